@@ -91,6 +91,7 @@ if "bpy" in locals():
     ratings = reload(ratings)
     comments_utils = reload(comments_utils)
     resolutions = reload(resolutions)
+    search_cache = reload(search_cache)
     search = reload(search)
     tasks_queue = reload(tasks_queue)
     ui = reload(ui)
@@ -148,6 +149,7 @@ else:
     from . import comments_utils
     from . import resolutions
     from . import search
+    from . import search_cache
     from . import tasks_queue
     from . import ui
     from . import ui_bgl
@@ -2031,6 +2033,22 @@ class BlenderKitAddonPreferences(AddonPreferences):
         update=utils.save_prefs,
     )
 
+    client_tasks_budget: IntProperty(
+        name="Task Processing Budget (ms)",
+        description="Maximum time in milliseconds spent on handling updates from the BlenderKit-Client in one timer tick. Remaining updates are handled in next ticks, search results and downloads first. 0 means no limit",
+        default=20,
+        min=0,
+        max=1000,
+        update=utils.save_prefs,
+    )
+
+    client_reports_stream: BoolProperty(
+        name="Stream Client Reports",
+        description="Keep a long-poll connection to the BlenderKit-Client open in a background thread, so updates on tasks arrive as soon as they happen and Blender only processes received updates. Regular polling is used as a fallback when the stream fails",
+        default=False,
+        update=timer.reports_stream_property_updated,
+    )
+
     unpack_files: BoolProperty(
         name="Unpack Files",
         description="Unpack assets after download \n "
@@ -2227,6 +2245,29 @@ In this case you should also set path to your system CA bundle containing proxy'
         description="Size of thumbnails of the assetbar in 3D view",
     )
 
+    history_results_budget: IntProperty(
+        name="Search History Results Limit",
+        description="Maximum number of search results kept in memory across all tabs and search history steps. Results of least recently viewed history steps are dropped first and searched again when you navigate back to them. 0 means no limit",
+        default=2000,
+        min=0,
+        max=100000,
+        update=utils.save_prefs,
+    )
+
+    asset_bar_atlas: BoolProperty(
+        name="Draw Thumbnails From Atlas",
+        description="Pack small thumbnails of the asset bar into a few large textures and draw them all at once. Faster with many rows on large screens. Applies when the asset bar is opened again",
+        default=False,
+        update=utils.save_prefs,
+    )
+
+    search_cache: BoolProperty(
+        name="Cache Search Results",
+        description="Keep search results on disk for a day. Recent searches are shown instantly without a request, older ones are shown immediately and updated once the current results arrive",
+        default=True,
+        update=utils.save_prefs,
+    )
+
     search_field_width: IntProperty(
         name="Search Field Width",
         default=0,
@@ -2363,6 +2404,15 @@ In this case you should also set path to your system CA bundle containing proxy'
         gui_settings.prop(self, "show_on_start")
         gui_settings.prop(self, "thumb_size")
         gui_settings.prop(self, "max_assetbar_rows")
+        gui_settings.prop(self, "history_results_budget")
+        gui_settings.prop(self, "asset_bar_atlas")
+        if not image_utils.can_decode_thumbnails():
+            # decoding in background threads needs Pillow, which is not bundled with Blender
+            gui_settings.label(
+                text="Thumbnails load on the main thread, install Pillow to load them in background",
+                icon="INFO",
+            )
+        gui_settings.prop(self, "search_cache")
         gui_settings.prop(self, "search_field_width")
         gui_settings.prop(self, "search_in_header")
         gui_settings.prop(self, "show_VIEW3D_MT_blenderkit_model_properties")
@@ -2375,12 +2425,18 @@ In this case you should also set path to your system CA bundle containing proxy'
         network_settings.label(text="Networking settings")
         network_settings.prop(self, "client_port")
         network_settings.prop(self, "client_polling")
+        network_settings.prop(self, "client_reports_stream")
+        network_settings.prop(self, "client_tasks_budget")
         network_settings.prop(self, "ip_version")
         network_settings.prop(self, "ssl_context")
         network_settings.prop(self, "proxy_which")
         if self.proxy_which == "CUSTOM":
             network_settings.prop(self, "proxy_address")
         network_settings.prop(self, "trusted_ca_certs")
+        conn_stats = client_lib.get_connection_stats()
+        network_settings.label(
+            text=f"Client connections: {conn_stats['new']} new, {conn_stats['reused']} reused"
+        )
 
         # UPDATER SETTINGS
         addon_updater_ops.update_settings_ui(self, context)
@@ -2575,6 +2631,7 @@ def unregister():
             bk_logger.info("Reported Blender quit to Client.")
         except Exception as e:
             bk_logger.error(e)
+        client_lib.close_session()
 
     del bpy.types.WindowManager.blenderkitUI
     del bpy.types.WindowManager.blenderkit_models
@@ -21,6 +21,8 @@ import math
 import os
 import re
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
 
 import bpy
 from bpy.props import BoolProperty, StringProperty
@@ -28,11 +30,13 @@ from bpy.props import BoolProperty, StringProperty
 from . import (
     comments_utils,
     global_vars,
+    image_utils,
     paths,
     ratings_utils,
     reports,
     search,
     ui,
+    ui_bgl,
     ui_panels,
     utils,
 )
@@ -48,6 +52,18 @@ bk_logger = logging.getLogger(__name__)
 
 active_area_pointer = 0
 
+PREFETCH_SCREENS_MAX = 2  # how many screens ahead are prepared when scrolling fast
+WARMUP_IMAGES_PER_TICK = 4
+WARMUP_TIME_BUDGET = 0.004  # seconds of main thread work per warmup timer tick
+THUMBNAIL_DECODE_WORKERS = 2
+thumbnails_warmup: list[str] = []
+# thumbnail path -> (asset id, future of pixels decoded in worker thread)
+thumbnails_decoding: dict[str, tuple[str, Future]] = {}
+thumbnails_decode_failed: set[str] = set()
+"""Thumbnails which failed to decode in worker threads, they are loaded by bpy instead."""
+thumbnail_decode_size = 128  # asset bar thumb_size, thumbnails are decoded to it
+thumbnail_decode_executor: Optional[ThreadPoolExecutor] = None
+
 
 def get_area_height(self):
     if type(self.context) != dict:
@@ -128,16 +144,8 @@ def modal_inside(self, context, event):
             self.update_timer_start = time.time()
             # self.update_buttons()
 
-            # progress bar
-            # change - let's try to optimize and redraw only when needed
-            change = False
-            for asset_button in self.asset_buttons:
-                if not asset_button.visible:
-                    continue
-                if sr is not None and len(sr) > asset_button.asset_index:
-                    asset_data = sr[asset_button.asset_index]
-                    self.update_progress_bar(asset_button, asset_data)
-            if change:
+            # only buttons of assets changed by thumbnail, download or rating events are updated
+            if self.update_dirty_buttons():
                 context.region.tag_redraw()
 
         # Check for tab shortcut keys directly in the modal function
@@ -404,6 +412,7 @@ def set_thumb_check(element, asset, thumb_type="thumbnail_small"):
     """Set image in case it is loaded in search results. Checks global_vars.DATA["images available"].
     - if image download failed, it will be set to 'thumbnail_not_available.jpg'
     - if image doesn't exist, it will be set to 'thumbnail_notready.jpg'
+    - small thumbnails not loaded yet are decoded in worker threads when possible, 'thumbnail_notready.jpg' is shown meanwhile
     """
     directory = paths.get_temp_dir("%s_search" % asset["assetType"])
     tpath = os.path.join(directory, asset[thumb_type])
@@ -416,6 +425,15 @@ def set_thumb_check(element, asset, thumb_type="thumbnail_small"):
         tpath = paths.get_addon_thumbnail_path("thumbnail_notready.jpg")
     if image_ready is False or asset[thumb_type] == "":
         tpath = paths.get_addon_thumbnail_path("thumbnail_not_available.jpg")
+    if (
+        image_ready
+        and thumb_type == "thumbnail_small"
+        and image_utils.can_decode_thumbnails()
+        and tpath not in thumbnails_decode_failed
+        and bpy.data.images.get(f".{os.path.basename(tpath)}") is None
+    ):
+        decode_thumbnail(tpath, asset["id"])
+        tpath = paths.get_addon_thumbnail_path("thumbnail_notready.jpg")
 
     if element.get_image_path() == tpath:
         return
@@ -423,6 +441,115 @@ def set_thumb_check(element, asset, thumb_type="thumbnail_small"):
     element.set_image_colorspace("")
 
 
+def decode_thumbnail(tpath: str, asset_id: str = ""):
+    """Start decoding a thumbnail in a worker thread, warmup_thumbnails uploads it when finished.
+    The asset is marked dirty then, so its button picks up the new image.
+    """
+    global thumbnail_decode_executor
+    if tpath in thumbnails_decoding:
+        return
+    if thumbnail_decode_executor is None:
+        thumbnail_decode_executor = ThreadPoolExecutor(
+            max_workers=THUMBNAIL_DECODE_WORKERS
+        )
+    future = thumbnail_decode_executor.submit(
+        image_utils.decode_thumbnail, tpath, thumbnail_decode_size
+    )
+    thumbnails_decoding[tpath] = (asset_id, future)
+    if not bpy.app.timers.is_registered(warmup_thumbnails):
+        bpy.app.timers.register(warmup_thumbnails)
+
+
+def upload_decoded_thumbnails(budget_end: float):
+    """Create images from thumbnails decoded by worker threads, until budget_end time."""
+    for tpath, (asset_id, future) in list(thumbnails_decoding.items()):
+        if time.time() > budget_end:
+            return
+        if not future.done():
+            continue
+        del thumbnails_decoding[tpath]
+        imgname = f".{os.path.basename(tpath)}"
+        if bpy.data.images.get(imgname) is not None:
+            continue
+        try:
+            pixels = future.result()
+            img = image_utils.thumbnail_to_image(
+                imgname, tpath, pixels, thumbnail_decode_size
+            )
+            img.gl_load()
+            ui_bgl.image_pool.reserve(img)
+        except Exception as e:
+            # bpy loads it instead, the dirty button loads it right away through set_thumb_check()
+            bk_logger.warning(f"thumbnail decoding failed for {tpath}: {e}")
+            img = bpy.data.images.get(imgname)
+            if img is not None:
+                bpy.data.images.remove(img)
+            thumbnails_decode_failed.add(tpath)
+            thumbnails_warmup.insert(0, tpath)
+        if asset_id:
+            global_vars.DIRTY_ASSETS.add(asset_id)
+
+
+def warmup_thumbnails():
+    """Timer loading small thumbnails of assets ahead of scrolling, so they are ready when the buttons show them.
+    Thumbnails are decoded in worker threads when possible, main thread work per call fits into WARMUP_TIME_BUDGET.
+    """
+    budget_end = time.time() + WARMUP_TIME_BUDGET
+    upload_decoded_thumbnails(budget_end)
+    can_decode = image_utils.can_decode_thumbnails()
+    loaded = 0
+    while len(thumbnails_warmup) > 0 and time.time() < budget_end:
+        tpath = thumbnails_warmup.pop(0)
+        imgname = f".{os.path.basename(tpath)}"
+        if bpy.data.images.get(imgname) is not None:
+            continue
+        if can_decode and tpath not in thumbnails_decode_failed:
+            decode_thumbnail(tpath)
+            continue
+        if loaded >= WARMUP_IMAGES_PER_TICK:
+            thumbnails_warmup.insert(0, tpath)
+            break
+        try:
+            img = bpy.data.images.load(tpath, check_existing=True)
+            img.name = imgname
+            img.gl_load()
+            ui_bgl.image_pool.reserve(img)
+        except Exception as e:
+            bk_logger.debug(f"thumbnail warmup failed for {tpath}: {e}")
+        loaded += 1
+    if len(thumbnails_warmup) > 0 or len(thumbnails_decoding) > 0:
+        return 0.02
+    return None
+
+
+def queue_thumbnails_warmup(sr: list, start: int, end: int):
+    """Replace queued thumbnails with downloaded small thumbnails of results from start to end."""
+    thumbnails_warmup.clear()
+    directories = {}
+    for asset_data in sr[max(start, 0) : max(end, 0)]:
+        if asset_data is None or not asset_data.get("thumbnail_small"):
+            continue
+        if bpy.data.images.get(f".{asset_data['thumbnail_small']}") is not None:
+            continue
+        asset_type = asset_data["assetType"]
+        if asset_type not in directories:
+            directories[asset_type] = paths.get_temp_dir(f"{asset_type}_search")
+        tpath = os.path.join(directories[asset_type], asset_data["thumbnail_small"])
+        if global_vars.DATA["images available"].get(tpath):
+            thumbnails_warmup.append(tpath)
+    if len(thumbnails_warmup) > 0 and not bpy.app.timers.is_registered(
+        warmup_thumbnails
+    ):
+        bpy.app.timers.register(warmup_thumbnails)
+
+
+def clear_thumbnails_warmup():
+    thumbnails_warmup.clear()
+    for asset_id, future in thumbnails_decoding.values():
+        future.cancel()
+    thumbnails_decoding.clear()
+
+
 class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
     bl_idname = "view3d.blenderkit_asset_bar_widget"
     bl_label = "BlenderKit asset bar refresh"
@@ -718,6 +845,8 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
         self.button_margin = int(0 * ui_scale)
         self.assetbar_margin = int(2 * ui_scale)
         self.thumb_size = int(user_preferences.thumb_size * ui_scale)
+        global thumbnail_decode_size
+        thumbnail_decode_size = self.thumb_size
         self.button_size = 2 * self.button_margin + self.thumb_size
         self.other_button_size = int(30 * ui_scale)
         self.icon_size = int(24 * ui_scale)
@@ -748,6 +877,12 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
             max(region.width, context.window.width) / self.button_size
         )
         self.max_wcount = user_preferences.max_assetbar_rows
+        # enough image slots for all rows and the screens prefetched in both directions
+        ui_bgl.image_pool.resize(
+            self.wcount
+            * user_preferences.max_assetbar_rows
+            * (1 + 2 * PREFETCH_SCREENS_MAX)
+        )
 
         history_step = search.get_active_history_step()
         search_results = history_step.get("search_results")
@@ -1033,6 +1168,13 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
                 self.asset_buttons.append(new_button)
                 button_idx += 1
 
+        self.draw_list = ui_bgl.DrawList()
+        self.atlas_items = []
+        if bpy.context.preferences.addons[__package__].preferences.asset_bar_atlas:  # type: ignore[union-attr]
+            ui_bgl.thumbnail_atlas.set_cell_size(self.thumb_size)
+            for asset_button in self.asset_buttons:
+                asset_button.atlas_items = self.atlas_items
+
         self.button_close = BL_UI_Button(
             self.bar_width - self.other_button_size,
             -self.other_button_size,
@@ -1356,6 +1498,10 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
 
         self.last_scroll_offset = -10  # set to -10 so it updates on first run
         self.scroll_offset = ui_props.scroll_offset
+        # buttons are all built now, only later changes of assets are updated
+        self.dirty_generation = global_vars.DIRTY_ASSETS.generation
+        self.scroll_velocity = 0.0  # assets per second, negative when scrolling back
+        self.last_scroll_time = time.time()
 
         self.text_color = (0.9, 0.9, 0.9, 1.0)
         self.warning_color = (0.9, 0.5, 0.5, 1.0)
@@ -1367,6 +1513,21 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
         self.trackpad_x_accum = 0
         self.trackpad_y_accum = 0
 
+    def draw_widgets(self):
+        """Draw widgets through one draw list, so each layer of the asset bar takes a few batches.
+        Thumbnails overlays and the tooltip are drawn as layers on top of the asset buttons,
+        thumbnails of asset buttons are drawn from the texture atlas with the images of their layer.
+        """
+        last_asset_button = self.asset_buttons[-1] if self.asset_buttons else None
+        for widget in self.widgets:
+            if widget in self.draw_layer_starts:
+                self.draw_list.new_layer()
+            widget.draw_into(self.draw_list)
+            if widget is last_asset_button and widget.atlas_items is not None:
+                self.draw_list.call(ui_bgl.thumbnail_atlas.draw, self.atlas_items)
+        self.draw_list.flush()
+        self.atlas_items.clear()
+
     def setup_widgets(self, context, event):
         widgets_panel = []
         widgets_panel.extend(self.widgets_panel)
@@ -1386,6 +1547,17 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
         widgets.append(self.tooltip_panel)
         widgets += self.tooltip_widgets
 
+        # widgets drawn over the images of the widgets before them
+        overlays = (
+            self.red_alerts
+            + self.bookmark_buttons
+            + self.validation_icons
+            + self.progress_bars
+        )
+        self.draw_layer_starts = [self.tooltip_panel, self.tooltip_dark_panel]
+        if overlays:
+            self.draw_layer_starts.append(overlays[0])
+
         self.init_widgets(context, widgets)
         self.panel.add_widgets(widgets_panel)
         self.tooltip_panel.add_widgets(self.tooltip_widgets)
@@ -1459,6 +1631,7 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
         ui_props = bpy.context.window_manager.blenderkitUI
         ui_props.assetbar_on = False
         ui_props.scroll_offset = self.scroll_offset
+        bk_logger.debug(f"asset bar image pool: {ui_bgl.image_pool.get_stats()}")
 
         # for w in wm.windows:
         #     for a in w.screen.areas:
@@ -1511,6 +1684,12 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
             # we should detect on which button_index scroll/left/right happened to refresh shown thumbnail
         bpy.context.window.cursor_set("HAND")
         search_index = widget.button_index + self.scroll_offset
+        if search.is_search_result_evicted(search_index):
+            # placeholder until the page is refilled, its data is incomplete
+            self.active_index = -1
+            bpy.context.window_manager.blenderkitUI.active_index = -1
+            self.hide_tooltip()
+            return
         if search_index < self.search_results_count:
             self.show_tooltip()
         if self.active_index != search_index:
@@ -1658,6 +1837,8 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
         # avoid double click to download assets under panels, mainly category panel
         if now - ui_panels.last_time_dropdown_active < 0.5:
             return
+        if search.is_search_result_evicted(widget.search_index + self.scroll_offset):
+            return
         # start drag drop
         bpy.ops.view3d.asset_drag_drop(
             "INVOKE_DEFAULT",
@@ -1668,6 +1849,8 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
         self.finish()
 
     def asset_menu(self, widget):
+        if self.active_index < 0:
+            return  # evicted asset under the mouse
         self.hide_tooltip()
         bpy.ops.wm.blenderkit_asset_popup("INVOKE_DEFAULT")
         # bpy.ops.wm.call_menu(name='OBJECT_MT_blenderkit_asset_menu')
@@ -1718,8 +1901,12 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
         else:
             asset_button.progress_bar.visible = False
 
-    def update_validation_icon(self, asset_button, asset_data: dict):
-        if utils.profile_is_validator():
+    def update_validation_icon(
+        self, asset_button, asset_data: dict, is_validator: Optional[bool] = None
+    ):
+        if is_validator is None:
+            is_validator = utils.profile_is_validator()
+        if is_validator:
             rating = global_vars.RATINGS.get(asset_data["id"])
             v_icon = ui.verification_icons[
                 asset_data.get("verificationStatus", "validated")
@@ -1745,22 +1932,52 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
 
     def update_image(self, asset_id):
         """should be run after thumbs are retrieved so they can be updated"""
-        sr = search.get_search_results()
+        global_vars.DIRTY_ASSETS.add(asset_id)
+
+    def update_dirty_buttons(self) -> bool:
+        """Update visible buttons of assets marked in global_vars.DIRTY_ASSETS since the last call.
+        Returns True if any button was updated.
+        """
+        dirty_assets = global_vars.DIRTY_ASSETS
+        if dirty_assets.generation == self.dirty_generation:
+            return False
+        asset_ids = dirty_assets.get_since(self.dirty_generation)
+        self.dirty_generation = dirty_assets.generation
+        history_step = search.get_active_history_step()
+        sr = history_step.get("search_results")
         if not sr:
-            return
-        for asset_button in self.asset_buttons:
-            if asset_button.asset_index < len(sr):
-                asset_data = sr[asset_button.asset_index]
-                if asset_data["assetBaseId"] == asset_id:
-                    set_thumb_check(
-                        asset_button, asset_data, thumb_type="thumbnail_small"
-                    )
+            return False
+        if asset_ids is None:  # missed changes were dropped already
+            self.update_buttons()
+            return True
+
+        changed = False
+        is_validator = utils.profile_is_validator()
+        for asset_id in asset_ids:
+            for position in search.get_search_result_positions(asset_id, history_step):
+                asset_button = self.get_asset_button(position)
+                if asset_button is None or sr[position] is None:
+                    continue
+                self.update_button(asset_button, sr[position], is_validator)
+                changed = True
+        return changed
+
+    def get_asset_button(self, asset_index: int):
+        """Get visible button showing the search result at asset_index."""
+        button_index = asset_index - self.scroll_offset
+        if button_index < 0 or button_index >= len(self.asset_buttons):
+            return None
+        asset_button = self.asset_buttons[button_index]
+        if not asset_button.visible or asset_button.asset_index != asset_index:
+            return None
+        return asset_button
 
     def update_buttons(self):
         history_step = search.get_active_history_step()
         sr = history_step.get("search_results")
         if not sr:
             return
+        is_validator = utils.profile_is_validator()
         for asset_button in self.asset_buttons:
             if asset_button.visible:
                 asset_button.asset_index = (
@@ -1775,35 +1992,7 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
 
                     # show indices for debug purposes
                     # asset_button.text = str(asset_button.asset_index)
-
-                    set_thumb_check(
-                        asset_button, asset_data, thumb_type="thumbnail_small"
-                    )
-                    # asset_button.set_image(img_filepath)
-                    self.update_validation_icon(asset_button, asset_data)
-
-                    # update bookmark buttons
-                    asset_button.bookmark_button.asset_index = asset_button.asset_index
-
-                    self.update_bookmark_icon(asset_button.bookmark_button)
-
-                    self.update_progress_bar(asset_button, asset_data)
-
-                    if (
-                        utils.profile_is_validator()
-                        and asset_data["verificationStatus"] == "uploaded"
-                    ):
-                        over_limit = utils.is_upload_old(
-                            asset_data.get("lastBlendUpload")
-                        )
-                        if over_limit:
-                            redness = min(over_limit * 0.05, 0.7)
-                            asset_button.red_alert.bg_color = (1, 0, 0, redness)
-                            asset_button.red_alert.visible = True
-                        else:
-                            asset_button.red_alert.visible = False
-                    elif utils.profile_is_validator():
-                        asset_button.red_alert.visible = False
+                    self.update_button(asset_button, asset_data, is_validator)
             else:
                 asset_button.visible = False
                 asset_button.validation_icon.visible = False
@@ -1812,6 +2001,41 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
                 if utils.profile_is_validator():
                     asset_button.red_alert.visible = False
 
+    def update_button(self, asset_button, asset_data: dict, is_validator: bool):
+        """Update thumbnail, icons, progress bar and validator alert of one asset button."""
+        if asset_data.get("evicted"):
+            # placeholder until refill_search_page() brings the asset back
+            asset_button.set_image(
+                paths.get_addon_thumbnail_path("thumbnail_notready.jpg")
+            )
+            asset_button.set_image_colorspace("")
+            asset_button.validation_icon.visible = False
+            asset_button.progress_bar.visible = False
+            if is_validator:
+                asset_button.red_alert.visible = False
+            return
+        set_thumb_check(asset_button, asset_data, thumb_type="thumbnail_small")
+        # asset_button.set_image(img_filepath)
+        self.update_validation_icon(asset_button, asset_data, is_validator)
+
+        # update bookmark buttons
+        asset_button.bookmark_button.asset_index = asset_button.asset_index
+
+        self.update_bookmark_icon(asset_button.bookmark_button)
+
+        self.update_progress_bar(asset_button, asset_data)
+
+        if is_validator and asset_data["verificationStatus"] == "uploaded":
+            over_limit = utils.is_upload_old(asset_data.get("lastBlendUpload"))
+            if over_limit:
+                redness = min(over_limit * 0.05, 0.7)
+                asset_button.red_alert.bg_color = (1, 0, 0, redness)
+                asset_button.red_alert.visible = True
+            else:
+                asset_button.red_alert.visible = False
+        elif is_validator:
+            asset_button.red_alert.visible = False
+
     def scroll_update(self, always=False):
         history_step = search.get_active_history_step()
         sr = history_step.get("search_results")
@@ -1827,11 +2051,15 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
             self.scroll_offset, len(sr) - (self.wcount * self.hcount)
         )
         self.scroll_offset = max(self.scroll_offset, 0)
-        # only update if scroll offset actually changed, otherwise this is unnecessary
+        self.update_scroll_velocity()
+        screen = self.wcount * self.hcount
+        prefetch = self.get_prefetch_distance()
 
+        # ask for next page early enough, so it arrives before user scrolls to it
         if (
             sro["count"] > len(sr)
-            and len(sr) - self.scroll_offset < (self.wcount * self.hcount) + 15
+            and self.scroll_velocity >= 0
+            and len(sr) - self.scroll_offset < screen + max(prefetch, 15)
         ):
             self.search_more()
 
@@ -1850,7 +2078,35 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
             return
         self.last_scroll_offset = self.scroll_offset
 
+        search.update_search_pages(history_step, self.scroll_offset)
         self.update_buttons()
+        if self.scroll_velocity >= 0:
+            start = self.scroll_offset + screen
+            queue_thumbnails_warmup(sr, start, start + prefetch)
+        else:
+            queue_thumbnails_warmup(
+                sr, self.scroll_offset - prefetch, self.scroll_offset
+            )
+
+    def update_scroll_velocity(self):
+        """Track direction and speed of scrolling, used to prefetch results ahead."""
+        if self.last_scroll_offset < 0 or self.scroll_offset == self.last_scroll_offset:
+            return
+        now = time.time()
+        dt = max(now - self.last_scroll_time, 0.01)
+        velocity = (self.scroll_offset - self.last_scroll_offset) / dt
+        if dt < 0.5:  # continuous scrolling, smooth out the steps
+            velocity = (self.scroll_velocity + velocity) / 2
+        self.scroll_velocity = velocity
+        self.last_scroll_time = now
+
+    def get_prefetch_distance(self) -> int:
+        """Number of results prepared ahead, one screen when scrolling slowly, up to PREFETCH_SCREENS_MAX when fast."""
+        screen = self.wcount * self.hcount
+        screens = min(
+            PREFETCH_SCREENS_MAX, max(1.0, abs(self.scroll_velocity) / screen)
+        )
+        return int(screens * screen)
 
     def search_by_author(self, asset_index):
         history_step = search.get_active_history_step()
@@ -1925,6 +2181,7 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
             bk_logger.info(f'deleting asset from local drive: {asset_data["name"]}')
             paths.delete_asset_debug(asset_data)
             asset_data["downloaded"] = 0
+            global_vars.DIRTY_ASSETS.add(asset_data["id"])
             return True
 
         # Shortcut: Open Author's personal Webpage
@@ -2090,10 +2347,16 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
 
         # Copy search results from current history step if they exist
         if current_history_step.get("search_results"):
-            new_history_step["search_results"] = current_history_step["search_results"]
+            # copy, as next pages are appended to the list in place
+            new_history_step["search_results"] = list(
+                current_history_step["search_results"]
+            )
             new_history_step["search_results_orig"] = current_history_step[
                 "search_results_orig"
             ]
+            new_history_step["search_pages"] = [
+                dict(page) for page in current_history_step.get("search_pages", [])
+            ]
             new_history_step["is_searching"] = False
 
             # Update search results count to trigger UI refresh
@@ -2152,6 +2415,7 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
 
         # Get active history step of the selected tab
         history_step = search.get_active_history_step()
+        search.touch_history_step(history_step)
         ui_state = history_step["ui_state"]
 
         # Update UI properties
@@ -2200,6 +2464,9 @@ class BlenderKitAssetBarOperator(BL_UI_OT_draw_operator):
         self.update_tab_icons()
         # unlock the search
         ui_props.search_lock = False
+        # results were dropped to fit into memory budget, search again with the restored ui_state
+        if history_step.pop("results_dropped", False):
+            search.search()
 
     def history_back(self, widget):
         """Navigate to previous history step."""
@@ -2234,4 +2501,15 @@ def register():
 
 
 def unregister():
+    global thumbnail_decode_executor
+    clear_thumbnails_warmup()
+    if thumbnail_decode_executor is not None:
+        thumbnail_decode_executor.shutdown(wait=False)
+        thumbnail_decode_executor = None
+    ui_bgl.image_pool.clear()
+    ui_bgl.thumbnail_atlas.clear()
+    if bpy.app.timers.is_registered(ui_bgl.fill_thumbnail_atlas):
+        bpy.app.timers.unregister(ui_bgl.fill_thumbnail_atlas)
+    if bpy.app.timers.is_registered(warmup_thumbnails):
+        bpy.app.timers.unregister(warmup_thumbnails)
     bpy.utils.unregister_class(BlenderKitAssetBarOperator)
@@ -77,8 +77,9 @@ def draw_callback_dragging(self, context):
     linelength = 35
     scene = bpy.context.scene
     ui_props = bpy.context.window_manager.blenderkitUI
+    draw_list = ui_bgl.DrawList()
 
-    ui_bgl.draw_image(
+    draw_list.image(
         self.mouse_x + linelength,
         self.mouse_y - linelength - ui_props.thumb_size,
         ui_props.thumb_size,
@@ -86,7 +87,7 @@ def draw_callback_dragging(self, context):
         img,
         1,
     )
-    ui_bgl.draw_line2d(
+    draw_list.line2d(
         self.mouse_x,
         self.mouse_y,
         self.mouse_x + linelength,
@@ -97,7 +98,7 @@ def draw_callback_dragging(self, context):
     # text messages in 3d view
     if context.area.type == "VIEW_3D":
         if self.asset_data["assetType"] == "material":
-            ui_bgl.draw_text(
+            draw_list.text(
                 f"Assign material to {self.object_name}",
                 self.mouse_x,
                 self.mouse_y - linelength - 20 - ui_props.thumb_size,
@@ -109,7 +110,7 @@ def draw_callback_dragging(self, context):
     if hasattr(self, "in_node_editor") and self.in_node_editor:
         if self.asset_data["assetType"] not in ["material", "nodegroup"]:
             # Draw warning for incompatible asset types
-            ui_bgl.draw_text(
+            draw_list.text(
                 "Cancel Drag & Drop",
                 self.mouse_x,
                 self.mouse_y - linelength - 20 - ui_props.thumb_size,
@@ -121,7 +122,7 @@ def draw_callback_dragging(self, context):
             and self.node_editor_type == "shader"
         ):
             # Draw material hints for shader editor
-            ui_bgl.draw_text(
+            draw_list.text(
                 "Drop to replace active material",
                 self.mouse_x,
                 self.mouse_y - linelength - 20 - ui_props.thumb_size,
@@ -135,7 +136,7 @@ def draw_callback_dragging(self, context):
             if self.is_nodegroup_compatible_with_editor(
                 nodegroup_type, self.node_editor_type
             ):
-                ui_bgl.draw_text(
+                draw_list.text(
                     "Drop to add node group",
                     self.mouse_x,
                     self.mouse_y - linelength - 20 - ui_props.thumb_size,
@@ -154,7 +155,7 @@ def draw_callback_dragging(self, context):
                 else:
                     switch_message = "Drop to switch editor type"
 
-                ui_bgl.draw_text(
+                draw_list.text(
                     switch_message,
                     self.mouse_x,
                     self.mouse_y - linelength - 20 - ui_props.thumb_size,
@@ -163,13 +164,14 @@ def draw_callback_dragging(self, context):
                 )
     elif context.area.type not in ["VIEW_3D", "OUTLINER"]:
         # draw under the image
-        ui_bgl.draw_text(
+        draw_list.text(
             "Cancel Drag & Drop",
             self.mouse_x,
             self.mouse_y - linelength - 20 - ui_props.thumb_size,
             16,
             (0.9, 0.9, 0.9, 1.0),
         )
+    draw_list.flush()
 
 
 def draw_callback_3d_dragging(self, context):
@@ -265,8 +267,7 @@ def draw_bbox(
             (v2, v3, vz3, vz2),
             (v3, v0, vz0, vz3),
         )
-        for r in rects:
-            ui_bgl.draw_rect_3d(r, color)
+        ui_bgl.draw_rects_3d(rects, color)
 
 
 def draw_downloader(x, y, percent=0, img=None, text=""):
@@ -312,6 +313,7 @@ def draw_callback_2d_progress(self, context):
     x = ui.reports_x
     y = ui.reports_y
     index = 0
+    draw_list = ui_bgl.DrawList()
     for key, task in download.download_tasks.items():
         asset_data = task["asset_data"]
 
@@ -324,6 +326,7 @@ def draw_callback_2d_progress(self, context):
                 y - index * 30,
                 text="downloading %s" % asset_data["name"],
                 percent=task["progress"],
+                draw_list=draw_list,
             )
             index += 1
 
@@ -332,8 +335,15 @@ def draw_callback_2d_progress(self, context):
         n = ""
         if tcom.name is not None:
             n = tcom.name + ": "
-        draw_progress(x, y - index * 30, "%s" % n + tcom.lasttext, tcom.progress)
+        draw_progress(
+            x,
+            y - index * 30,
+            "%s" % n + tcom.lasttext,
+            tcom.progress,
+            draw_list=draw_list,
+        )
         index += 1
+    draw_list.flush()
     for report in reports.reports:
         # print('drawing reports', x, y, report.text)
         report.draw(x, y - index * 30)
@@ -360,9 +370,13 @@ def draw_callback_3d_progress(self, context):
                     )
 
 
-def draw_progress(x, y, text="", percent=None, color=colors.GREEN):
-    ui_bgl.draw_rect(x, y, percent, 5, color)
-    ui_bgl.draw_text(text, x, y + 8, 16, color)
+def draw_progress(x, y, text="", percent=None, color=colors.GREEN, draw_list=None):
+    if draw_list is None:
+        ui_bgl.draw_rect(x, y, percent, 5, color)
+        ui_bgl.draw_text(text, x, y + 8, 16, color)
+        return
+    draw_list.rect(x, y, percent, 5, color)
+    draw_list.text(text, x, y + 8, 16, color)
 
 
 def find_and_activate_instancers(object):
@@ -1539,6 +1553,13 @@ class AssetDragOperator(bpy.types.Operator):
         return {"RUNNING_MODAL"}
 
     def invoke(self, context, event):
+        ui_props = bpy.context.window_manager.blenderkitUI
+        if ui_props.active_index < 0 or search.is_search_result_evicted(
+            ui_props.active_index
+        ):
+            return {
+                "CANCELLED"
+            }  # asset data are not complete until the page is refilled
         # We now accept all area types
         # if context.area.type not in ["VIEW_3D", "OUTLINER"]:
         #     self.report({"WARNING"}, "View3D or Outliner not found, cannot run operator")
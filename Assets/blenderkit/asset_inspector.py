@@ -232,6 +232,26 @@ def check_anim(props, obs):
         props.animated = True
 
 
+def get_mesh_stats(mesh):
+    """Count triangles, quads and ngons of the mesh and check if it is manifold.
+    Mesh is manifold when each of its edges is used by exactly 2 faces.
+    """
+    import numpy
+
+    loop_totals = numpy.empty(len(mesh.polygons), dtype=numpy.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    tris = int(numpy.count_nonzero(loop_totals == 3))
+    quads = int(numpy.count_nonzero(loop_totals == 4))
+    ngons = int(numpy.count_nonzero(loop_totals > 4))
+    del loop_totals
+
+    edge_indices = numpy.empty(len(mesh.loops), dtype=numpy.int32)
+    mesh.loops.foreach_get("edge_index", edge_indices)
+    faces_per_edge = numpy.bincount(edge_indices, minlength=len(mesh.edges))
+    manifold = bool(numpy.all(faces_per_edge == 2))
+    return tris, quads, ngons, manifold
+
+
 def check_meshprops(props, obs):
     """checks polycount, manifold, mesh parts (not implemented)"""
     face_count = 0
@@ -241,14 +261,12 @@ def check_meshprops(props, obs):
     ngons = 0
     vertices_count = 0
 
-    edges_counts = {}
     manifold = True
 
     for ob in obs:
         if ob.type != "MESH" and ob.type != "CURVE":
             continue
 
-        ob_eval = None
         if ob.type == "CURVE":
             # depsgraph = bpy.context.evaluated_depsgraph_get()
             # object_eval = ob.evaluated_get(depsgraph)
@@ -263,25 +281,12 @@ def check_meshprops(props, obs):
         face_count += fco
         vertices_count += len(mesh.vertices)
         fcor = fco
-        for f in mesh.polygons:
-            # face sides counter
-            if len(f.vertices) == 3:
-                tris += 1
-            elif len(f.vertices) == 4:
-                quads += 1
-            elif len(f.vertices) > 4:
-                ngons += 1
-
-            # manifold counter
-            for i, v in enumerate(f.vertices):
-                v1 = f.vertices[i - 1]
-                e = (min(v, v1), max(v, v1))
-                edges_counts[e] = edges_counts.get(e, 0) + 1
-
+        ob_tris, ob_quads, ob_ngons, ob_manifold = get_mesh_stats(mesh)
+        tris += ob_tris
+        quads += ob_quads
+        ngons += ob_ngons
         # all meshes have to be manifold for this to work.
-        manifold = manifold and not any(
-            i in edges_counts.values() for i in [0, 1, 3, 4]
-        )
+        manifold = manifold and ob_manifold
 
         for m in ob.modifiers:
             if m.type == "SUBSURF" or m.type == "MULTIRES":
@@ -298,8 +303,8 @@ def check_meshprops(props, obs):
                 fcor *= m.ratio
         face_count_render += fcor
 
-        if ob_eval:
-            ob_eval.to_mesh_clear()
+        if ob.type == "CURVE":
+            ob.to_mesh_clear()
 
     # write out props
     props.face_count = int(face_count)
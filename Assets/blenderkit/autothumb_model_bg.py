@@ -49,7 +49,7 @@ def center_obs_for_thumbnail(obs):
     parent.rotation_euler = (0, 0, 0)
     parent.location = (0, 0, 0)
     bpy.context.view_layer.update()
-    minx, miny, minz, maxx, maxy, maxz = utils.get_bounds_worldspace(obs)
+    minx, miny, minz, maxx, maxy, maxz = utils.get_bounds_worldspace(obs, exact=False)
 
     cx = (maxx - minx) / 2 + minx
     cy = (maxy - miny) / 2 + miny
@@ -23,6 +23,8 @@ class BL_UI_Button(BL_UI_Widget):
         self.__image = None
         self.__image_size = (24, 24)
         self.__image_position = (4, 2)
+        # when set to a list, image is not drawn but appended to it, to be drawn from the texture atlas
+        self.atlas_items = None
 
     @property
     def text_color(self):
@@ -111,6 +113,7 @@ class BL_UI_Button(BL_UI_Widget):
 
             if self.__image and len(self.__image.pixels) == 0:
                 self.__image.reload()
+                ui_bgl.image_pool.invalidate(self.__image)
                 self.__image.gl_load()
         except Exception as e:
             print(f"BL_UI_BUTTON set_image() error: {e}")
@@ -144,7 +147,16 @@ class BL_UI_Button(BL_UI_Widget):
         # Draw text
         self.draw_text(area_height)
 
-    def set_colors(self):
+    def draw_into(self, draw_list):
+        if not self._is_visible:
+            return
+        self.draw_panel_into(draw_list, self.get_color())
+        self.draw_image(draw_list)
+        if self._text:
+            x, y = self.get_text_position(self.get_area_height())
+            draw_list.text(self._text, x, y, self.get_text_size(), self._text_color)
+
+    def get_color(self):
         color = self._bg_color
 
         # pressed
@@ -155,36 +167,67 @@ class BL_UI_Button(BL_UI_Widget):
         elif self.__state == 2:
             color = self._hover_bg_color
 
-        self.shader.uniform_float("color", color)
+        return color
 
-    def draw_text(self, area_height):
-        font_id = 1
+    def set_colors(self):
+        self.shader.uniform_float("color", self.get_color())
+
+    def get_text_size(self):
         if bpy.app.version < (3, 1, 0):
             # Blender 3.0 requires size:int https://docs.blender.org/api/3.0/blf.html#blf.size
             # but assetBar's search tab text is float - needs conversion in here
-            blf.size(font_id, int(self._text_size), 72)
-        elif bpy.app.version < (4, 0, 0):
-            blf.size(font_id, self._text_size, 72)
+            return int(self._text_size)
+        return self._text_size
+
+    def get_text_position(self, area_height):
+        """Set font size and get position of the text centered in the button."""
+        font_id = 1
+        if bpy.app.version < (4, 0, 0):
+            blf.size(font_id, self.get_text_size(), 72)
         else:
             blf.size(font_id, self._text_size)
 
         size = blf.dimensions(font_id, self._text)
 
         textpos_y = area_height - self._textpos[1] - (self.height + size[1]) / 2.0
-        blf.position(
-            font_id, self._textpos[0] + (self.width - size[0]) / 2.0, textpos_y + 1, 0
-        )
+        return self._textpos[0] + (self.width - size[0]) / 2.0, textpos_y + 1
+
+    def draw_text(self, area_height):
+        font_id = 1
+        x, y = self.get_text_position(area_height)
+        blf.position(font_id, x, y, 0)
 
         r, g, b, a = self._text_color
         blf.color(font_id, r, g, b, a)
 
         blf.draw(font_id, self._text)
 
-    def draw_image(self):
+    def draw_image(self, draw_list=None):
         if self.__image is not None:
             y_screen_flip = self.get_area_height() - self.y_screen
             off_x, off_y = self.__image_position
             sx, sy = self.__image_size
+            if self.atlas_items is not None:
+                self.atlas_items.append(
+                    (
+                        self.x_screen + off_x,
+                        y_screen_flip - off_y - sy,
+                        sx,
+                        sy,
+                        self.__image,
+                    )
+                )
+                return True
+            if draw_list is not None:
+                draw_list.image(
+                    self.x_screen + off_x,
+                    y_screen_flip - off_y - sy,
+                    sx,
+                    sy,
+                    self.__image,
+                    1.0,
+                )
+                return True
             ui_bgl.draw_image(
                 self.x_screen + off_x,
                 y_screen_flip - off_y - sy,
@@ -49,6 +49,7 @@ class BL_UI_Image(BL_UI_Widget):
 
             if self.__image and len(self.__image.pixels) == 0:
                 self.__image.reload()
+                ui_bgl.image_pool.invalidate(self.__image)
                 self.__image.gl_load()
         except Exception as e:
             print(f"BL_UI_BUTTON: exception in set_image(): {e}")
@@ -76,11 +77,27 @@ class BL_UI_Image(BL_UI_Widget):
 
         self.draw_image()
 
-    def draw_image(self):
+    def draw_into(self, draw_list):
+        # panel of images is 1 pixel or empty and has no color of its own, only the image is drawn
+        if not self._is_visible:
+            return
+        self.draw_image(draw_list)
+
+    def draw_image(self, draw_list=None):
         if self.__image is not None:
             y_screen_flip = self.get_area_height() - self.y_screen
             off_x, off_y = self.__image_position
             sx, sy = self.__image_size
+            if draw_list is not None:
+                draw_list.image(
+                    self.x_screen + off_x,
+                    y_screen_flip - off_y - sy,
+                    sx,
+                    sy,
+                    self.__image,
+                    1.0,
+                )
+                return True
             ui_bgl.draw_image(
                 self.x_screen + off_x,
                 y_screen_flip - off_y - sy,
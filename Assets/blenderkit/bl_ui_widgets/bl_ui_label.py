@@ -50,6 +50,39 @@ class BL_UI_Label(BL_UI_Widget):
     def is_in_rect(self, x, y):
         return False
 
+    def get_text_position(self, area_height):
+        """Get position of the first line, font size has to be set already."""
+        font_id = 1
+        x = self.x_screen
+        y = area_height - self.y_screen - self.height
+        if self._halign != "LEFT":
+            width, height = blf.dimensions(font_id, self._text)
+            if self._halign == "RIGHT":
+                x -= width
+            elif self._halign == "CENTER":
+                x -= width // 2
+            if self._valign == "CENTER":
+                y -= height // 2
+            # bottom could be here but there's no reason for it
+        return x, y
+
+    def draw_into(self, draw_list):
+        if not self._is_visible:
+            return
+
+        font_id = 1
+        if bpy.app.version < (4, 0, 0):
+            blf.size(font_id, self._text_size, 72)
+        else:
+            blf.size(font_id, self._text_size)
+        x, y = self.get_text_position(self.get_area_height())
+        if not self.multiline:
+            draw_list.text(self._text, x, y, self._text_size, self._text_color)
+            return
+        for line in self._text.split("\n"):
+            draw_list.text(line, x, y, self._text_size, self._text_color)
+            y -= self.row_height
+
     def draw(self):
         if not self._is_visible:
             return
@@ -62,20 +95,8 @@ class BL_UI_Label(BL_UI_Widget):
         else:
             blf.size(font_id, self._text_size)
 
-        textpos_y = area_height - self.y_screen - self.height
-
         r, g, b, a = self._text_color
-        x = self.x_screen
-        y = textpos_y
-        if self._halign != "LEFT":
-            width, height = blf.dimensions(font_id, self._text)
-            if self._halign == "RIGHT":
-                x -= width
-            elif self._halign == "CENTER":
-                x -= width // 2
-            if self._valign == "CENTER":
-                y -= height // 2
-            # bottom could be here but there's no reason for it
+        x, y = self.get_text_position(area_height)
         if not self.multiline:
             blf.position(font_id, x, y, 0)
 
@@ -76,6 +76,18 @@ class BL_UI_Widget:
 
         self.batch_panel.draw(self.shader)
 
+    def draw_into(self, draw_list):
+        """Add the widget to ui_bgl.DrawList instead of drawing it right away."""
+        if not self._is_visible:
+            return
+        self.draw_panel_into(draw_list, self._bg_color)
+
+    def draw_panel_into(self, draw_list, color):
+        y_screen_flip = self.get_area_height() - self.y_screen
+        draw_list.rect(
+            self.x_screen, y_screen_flip - self.height, self.width, self.height, color
+        )
+
     def init(self, context):
         self.context = context
         self.update(self.x, self.y)
@@ -20,8 +20,11 @@ import dataclasses
 import logging
 import os
 import platform
+import queue
 import shutil
 import subprocess
+import threading
+import time
 from os import path
 from typing import Optional
 from http.client import responses as http_responses
@@ -36,6 +39,66 @@ from . import datas, global_vars, reports, utils
 bk_logger = logging.getLogger(__name__)
 NO_PROXIES = {"http": "", "https": ""}
 TIMEOUT = (0.1, 1)
+REPORTS_STREAM_WAIT = 25
+"""Seconds the BlenderKit-Client may hold the long-poll /report request open before responding with no changes."""
+
+_session: Optional[requests.Session] = None
+"""Shared keep-alive session used for all requests to the BlenderKit-Client from the main thread."""
+_closed_sessions_stats = {"new": 0, "reused": 0}
+"""Connection counters of already closed sessions, so the stats survive session recreation."""
+
+
+def get_session() -> requests.Session:
+    """Get shared requests.Session with keep-alive connection pool to the BlenderKit-Client.
+    The session is created lazily, recreated after reorder_ports() and closed in shutdown_client().
+    Session is not thread-safe, background threads should use their own sessions.
+    """
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        _session.mount("http://", adapter)
+    return _session
+
+
+def close_session():
+    """Close the shared session and its pooled connections. Next get_session() call creates a new one."""
+    global _session
+    if _session is None:
+        return
+    stats = _get_session_stats(_session)
+    _closed_sessions_stats["new"] += stats["new"]
+    _closed_sessions_stats["reused"] += stats["reused"]
+    _session.close()
+    _session = None
+    bk_logger.debug(f"Closed BlenderKit-Client session, {get_connection_stats()}")
+
+
+def _get_session_stats(session: requests.Session) -> dict:
+    """Count new and reused connections in the pools of the session's adapters."""
+    new = 0
+    total = 0
+    for adapter in session.adapters.values():
+        poolmanager = getattr(adapter, "poolmanager", None)
+        if poolmanager is None:
+            continue
+        for key in list(poolmanager.pools.keys()):
+            pool = poolmanager.pools.get(key)
+            if pool is None:
+                continue
+            new += pool.num_connections
+            total += pool.num_requests
+    return {"new": new, "reused": max(0, total - new)}
+
+
+def get_connection_stats() -> dict:
+    """Get number of new and reused connections to the BlenderKit-Client since add-on registration."""
+    stats = dict(_closed_sessions_stats)
+    if _session is not None:
+        current = _get_session_stats(_session)
+        stats["new"] += current["new"]
+        stats["reused"] += current["reused"]
+    return stats
 
 
 def get_address() -> str:
@@ -125,20 +188,25 @@ def reorder_ports(port: str = ""):
     bk_logger.info(
         f"Ports reordered so first port is now {global_vars.CLIENT_PORTS[0]} (previous index was {i})"
     )
+    close_session()  # pooled connections point to the previous port
+    global_vars.CLIENT_REPORTS_SEQ = 0  # other port, other Client, other sequence
 
 
-def get_reports(app_id: str):
+def get_reports(app_id: str) -> tuple[list, int]:
     """Get reports for all tasks of app_id Blender instance at once.
     If few last calls failed, then try to get reports also from other than default ports.
+    Only tasks changed since the last received sequence cursor are requested, see unpack_report().
+    Returns tasks and the new sequence cursor, caller stores it in CLIENT_REPORTS_SEQ once the tasks are consumed.
     """
     data = ensure_minimal_data({"app_id": app_id})
     data["project_name"] = utils.get_project_name()
     data["blender_version"] = utils.get_blender_version()
+    data["since_seq"] = global_vars.CLIENT_REPORTS_SEQ
 
     # on 10, there is second BlenderKit-Client start
     if global_vars.CLIENT_FAILED_REPORTS < 10:
         url = f"{get_base_url()}/report"
-        return request_report(url, data)
+        return unpack_report(request_report(url, data), data["since_seq"])
 
     last_exception = None
     for port in global_vars.CLIENT_PORTS:
@@ -150,7 +218,7 @@ def get_reports(app_id: str):
                 f"Got reports from BlenderKit-Client on port {port}, setting it as default for this instance"
             )
             reorder_ports(port)
-            return report
+            return unpack_report(report, data["since_seq"])
         except Exception as e:
             bk_logger.info(f"Failed to get BlenderKit-Client reports: {e}")
             last_exception = e
@@ -158,18 +226,114 @@ def get_reports(app_id: str):
         raise last_exception
 
 
-def request_report(url: str, data: dict) -> dict:
+def request_report(
+    url: str,
+    data: dict,
+    session: Optional[requests.Session] = None,
+    timeout: tuple = TIMEOUT,
+) -> dict:
     """Make HTTP request to /report endpoint. If all goes well a JSON dict is returned.
     If something goes south, this function raises requests.HTTPError or requests.JSONDecodeError.
+    Background threads have to pass their own session, shared session is used otherwise.
     """
-    with requests.Session() as session:
-        resp = session.get(url, json=data, timeout=TIMEOUT, proxies=NO_PROXIES)
-        if resp.status_code != 200:
-            # not using resp.raise_for_status() for better message
-            raise requests.HTTPError(
-                f"{http_responses[resp.status_code]}: {resp.text}", response=resp
-            )
-        return resp.json()
+    if session is None:
+        session = get_session()
+    resp = session.get(url, json=data, timeout=timeout, proxies=NO_PROXIES)
+    if resp.status_code != 200:
+        # not using resp.raise_for_status() for better message
+        raise requests.HTTPError(
+            f"{http_responses[resp.status_code]}: {resp.text}", response=resp
+        )
+    return resp.json()
+
+
+class ReportsStream:
+    """Background reader of reports from the BlenderKit-Client.
+    Reader thread keeps a long-poll request to /report open, Client responds as soon as some task changes
+    (or after REPORTS_STREAM_WAIT seconds with no changes). Received task lists are put into the buffer queue,
+    which is drained by timer.client_communication_timer() on the main thread.
+    Buffered items are (tasks, seq) tuples. CLIENT_REPORTS_SEQ is the only sequence cursor, it is moved by the
+    main thread when it takes the tasks, so reports dropped with the buffer are sent again. The reader waits
+    until its previous batch is taken and reads the cursor before every request.
+    On any failure the exception is put into the buffer and the thread ends, polling then takes over again.
+    Clients not supporting long-poll respond immediately, in that case the thread waits min_interval between requests.
+    """
+
+    def __init__(
+        self,
+        data: dict,
+        buffer: queue.Queue,
+        min_interval: float = 0.2,
+    ):
+        self.data = data
+        """Request data prepared on the main thread, bpy is not accessible from the reader thread."""
+        self.buffer = buffer
+        self.min_interval = min_interval
+        self.long_poll_supported = False
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.read, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def is_alive(self) -> bool:
+        return self.thread.is_alive() and not self.stop_event.is_set()
+
+    def read(self):
+        with requests.Session() as session:
+            while not self.stop_event.is_set():
+                # cursor moves only once the main thread takes the previous batch
+                if not self.buffer.empty():
+                    self.stop_event.wait(0.05)
+                    continue
+                since_seq = global_vars.CLIENT_REPORTS_SEQ
+                data = dict(self.data)
+                data["long_poll"] = True
+                data["long_poll_wait"] = REPORTS_STREAM_WAIT
+                data["since_seq"] = since_seq
+                url = f"{get_base_url()}/report"
+                start = time.monotonic()
+                try:
+                    report = request_report(
+                        url, data, session, timeout=(0.1, REPORTS_STREAM_WAIT + 5)
+                    )
+                    tasks, seq = unpack_report(report, since_seq)
+                except Exception as e:
+                    if not self.stop_event.is_set():
+                        self.buffer.put(e)
+                    return
+
+                if self.stop_event.is_set():
+                    return
+                if len(tasks) > 0 or seq != since_seq:
+                    self.buffer.put((tasks, seq))
+
+                elapsed = time.monotonic() - start
+                if elapsed > 1:  # Client held the request, so it does long-poll
+                    self.long_poll_supported = True
+                if not self.long_poll_supported and elapsed < self.min_interval:
+                    self.stop_event.wait(self.min_interval - elapsed)
+
+
+def unpack_report(report, since_seq: int) -> tuple[list, int]:
+    """Get list of tasks and the new sequence cursor from the /report response.
+    Clients supporting incremental reports respond with {"seq": int, "tasks": [...]} containing only tasks
+    changed since the since_seq cursor. Older Clients respond with plain list of all active tasks.
+    If the sequence goes backwards, Client was restarted, so the cursor is reset and next report contains all tasks.
+    """
+    if isinstance(report, list):
+        return report, since_seq
+
+    seq = report.get("seq", 0)
+    if seq < since_seq:
+        bk_logger.info(
+            f"Client report sequence went back ({since_seq} -> {seq}), Client was restarted"
+        )
+        seq = 0
+    return report.get("tasks", []), seq
 
 
 ### ASSETS
@@ -179,32 +343,32 @@ def asset_search(search_data: datas.SearchData):
     bk_logger.info(f"Starting search request: {search_data.urlquery}")
 
     search_data = ensure_minimal_data_class(search_data)
-    with requests.Session() as session:
-        url = get_base_url() + "/blender/asset_search"
-        resp = session.post(
-            url, json=datas.asdict(search_data), timeout=TIMEOUT, proxies=NO_PROXIES
-        )
-        bk_logger.debug("Got search response")
-        return resp.json()
+    session = get_session()
+    url = get_base_url() + "/blender/asset_search"
+    resp = session.post(
+        url, json=datas.asdict(search_data), timeout=TIMEOUT, proxies=NO_PROXIES
+    )
+    bk_logger.debug("Got search response")
+    return resp.json()
 
 
 # DOWNLOAD
 def asset_download(data):
     """Download specified asset."""
     data = ensure_minimal_data(data)
-    with requests.Session() as session:
-        url = get_base_url() + "/blender/asset_download"
-        resp = session.post(url, json=data, timeout=TIMEOUT, proxies=NO_PROXIES)
-        return resp.json()
+    session = get_session()
+    url = get_base_url() + "/blender/asset_download"
+    resp = session.post(url, json=data, timeout=TIMEOUT, proxies=NO_PROXIES)
+    return resp.json()
 
 
 def cancel_download(task_id: str):
     """Cancel the specified task with ID on the BlenderKit-Client."""
     data = ensure_minimal_data({"task_id": task_id})
-    with requests.Session() as session:
-        url = get_base_url() + "/blender/cancel_download"
-        resp = session.get(url, json=data, timeout=TIMEOUT, proxies=NO_PROXIES)
-        return resp
+    session = get_session()
+    url = get_base_url() + "/blender/cancel_download"
+    resp = session.get(url, json=data, timeout=TIMEOUT, proxies=NO_PROXIES)
+    return resp
 
 
 # UPLOAD
@@ -217,11 +381,11 @@ def asset_upload(upload_data, export_data, upload_set):
         "upload_set": upload_set,
     }
     data = ensure_minimal_data(data)
-    with requests.Session() as session:
-        url = get_base_url() + "/blender/asset_upload"
-        bk_logger.debug(f"making a request to: {url}")
-        resp = session.post(url, json=data, timeout=TIMEOUT, proxies=NO_PROXIES)
-        return resp
+    session = get_session()
+    url = get_base_url() + "/blender/asset_upload"
+    bk_logger.debug(f"making a request to: {url}")
+    resp = session.post(url, json=data, timeout=TIMEOUT, proxies=NO_PROXIES)
+    return resp
 
 
 ### PROFILES
@@ -233,10 +397,10 @@ def download_gravatar_image(author_data: datas.UserProfile) -> requests.Response
         "gravatarHash": author_data.gravatarHash,
     }
     data = ensure_minimal_data(data)
-    with requests.Session() as session:
-        url = get_base_url() + "/profiles/download_gravatar_image"
-        resp = session.get(url, json=data, timeout=TIMEOUT, proxies=NO_PROXIES)
-        return resp
+    session = get_session()
+    url = get_base_url() + "/profiles/download_gravatar_image"
+    resp = session.get(url, json=data, timeout=TIMEOUT, proxies=NO_PROXIES)
+    return resp
 
 
 def get_user_profile() -> requests.Response:
@@ -244,26 +408,26 @@ def get_user_profile() -> requests.Response:
     This creates task on BlenderKit-Client to fetch data which are later handled once available.
     """
     data = ensure_minimal_data()
-    with requests.Session() as session:
-        return session.get(
-            f"{get_base_url()}/profiles/get_user_profile",
-            json=data,
-            timeout=TIMEOUT,
-            proxies=NO_PROXIES,
-        )
+    session = get_session()
+    return session.get(
+        f"{get_base_url()}/profiles/get_user_profile",
+        json=data,
+        timeout=TIMEOUT,
+        proxies=NO_PROXIES,
+    )
 
 
 ### COMMENTS
 def get_comments(asset_id, api_key=""):
     """Get all comments on the asset."""
     data = ensure_minimal_data({"asset_id": asset_id})
-    with requests.Session() as session:
-        return session.post(
-            f"{get_base_url()}/comments/get_comments",
-            json=data,
-            timeout=TIMEOUT,
-            proxies=NO_PROXIES,
-        )
+    session = get_session()
+    return session.post(
+        f"{get_base_url()}/comments/get_comments",
+        json=data,
+        timeout=TIMEOUT,
+        proxies=NO_PROXIES,
+    )
 
 
 def create_comment(asset_id, comment_text, api_key, reply_to_id=0):
@@ -274,13 +438,13 @@ def create_comment(asset_id, comment_text, api_key, reply_to_id=0):
         "reply_to_id": reply_to_id,
     }
     data = ensure_minimal_data(data)
-    with requests.Session() as session:
-        return session.post(
-            f"{get_base_url()}/comments/create_comment",
-            json=data,
-            timeout=TIMEOUT,
-            proxies=NO_PROXIES,
-        )
+    session = get_session()
+    return session.post(
+        f"{get_base_url()}/comments/create_comment",
+        json=data,
+        timeout=TIMEOUT,
+        proxies=NO_PROXIES,
+    )
 
 
 def feedback_comment(asset_id, comment_id, api_key, flag="like"):
@@ -291,13 +455,13 @@ def feedback_comment(asset_id, comment_id, api_key, flag="like"):
         "flag": flag,
     }
     data = ensure_minimal_data(data)
-    with requests.Session() as session:
-        return session.post(
-            f"{get_base_url()}/comments/feedback_comment",
-            json=data,
-            timeout=TIMEOUT,
-            proxies=NO_PROXIES,
-        )
+    session = get_session()
+    return session.post(
+        f"{get_base_url()}/comments/feedback_comment",
+        json=data,
+        timeout=TIMEOUT,
+        proxies=NO_PROXIES,
+    )
 
 
 def mark_comment_private(asset_id, comment_id, api_key, is_private=False):
@@ -308,51 +472,51 @@ def mark_comment_private(asset_id, comment_id, api_key, is_private=False):
         "is_private": is_private,
     }
     data = ensure_minimal_data(data)
-    with requests.Session() as session:
-        return session.post(
-            f"{get_base_url()}/comments/mark_comment_private",
-            json=data,
-            timeout=TIMEOUT,
-            proxies=NO_PROXIES,
-        )
+    session = get_session()
+    return session.post(
+        f"{get_base_url()}/comments/mark_comment_private",
+        json=data,
+        timeout=TIMEOUT,
+        proxies=NO_PROXIES,
+    )
 
 
 ### NOTIFICATIONS
 def mark_notification_read(notification_id):
     """Mark the notification as read on the server."""
     data = ensure_minimal_data({"notification_id": notification_id})
-    with requests.Session() as session:
-        return session.post(
-            f"{get_base_url()}/notifications/mark_notification_read",
-            json=data,
-            timeout=TIMEOUT,
-            proxies=NO_PROXIES,
-        )
+    session = get_session()
+    return session.post(
+        f"{get_base_url()}/notifications/mark_notification_read",
+        json=data,
+        timeout=TIMEOUT,
+        proxies=NO_PROXIES,
+    )
 
 
 ### REPORTS
 def report_usages(data: dict):
     """Report usages of assets in current scene via BlenderKit-Client to the server."""
     data = ensure_minimal_data(data)
-    with requests.Session() as session:
-        return session.post(
-            f"{get_base_url()}/report_usages",
-            json=data,
-            timeout=TIMEOUT,
-            proxies=NO_PROXIES,
-        )
+    session = get_session()
+    return session.post(
+        f"{get_base_url()}/report_usages",
+        json=data,
+        timeout=TIMEOUT,
+        proxies=NO_PROXIES,
+    )
 
 
 # RATINGS
 def get_rating(asset_id: str):
     data = ensure_minimal_data({"asset_id": asset_id})
-    with requests.Session() as session:
-        return session.get(
-            f"{get_base_url()}/ratings/get_rating",
-            json=data,
-            timeout=TIMEOUT,
-            proxies=NO_PROXIES,
-        )
+    session = get_session()
+    return session.get(
+        f"{get_base_url()}/ratings/get_rating",
+        json=data,
+        timeout=TIMEOUT,
+        proxies=NO_PROXIES,
+    )
 
 
 def send_rating(asset_id: str, rating_type: str, rating_value: str):
@@ -362,25 +526,25 @@ def send_rating(asset_id: str, rating_type: str, rating_value: str):
         "rating_value": rating_value,
     }
     data = ensure_minimal_data(data)
-    with requests.Session() as session:
-        return session.post(
-            f"{get_base_url()}/ratings/send_rating",
-            json=data,
-            timeout=TIMEOUT,
-            proxies=NO_PROXIES,
-        )
+    session = get_session()
+    return session.post(
+        f"{get_base_url()}/ratings/send_rating",
+        json=data,
+        timeout=TIMEOUT,
+        proxies=NO_PROXIES,
+    )
 
 
 # BOOKMARKS
 def get_bookmarks():
     data = ensure_minimal_data()
-    with requests.Session() as session:
-        return session.get(
-            f"{get_base_url()}/ratings/get_bookmarks",
-            json=data,
-            timeout=TIMEOUT,
-            proxies=NO_PROXIES,
-        )
+    session = get_session()
+    return session.get(
+        f"{get_base_url()}/ratings/get_bookmarks",
+        json=data,
+        timeout=TIMEOUT,
+        proxies=NO_PROXIES,
+    )
 
 
 ### BLOCKING WRAPPERS
@@ -398,15 +562,15 @@ def get_download_url(asset_data, scene_id, api_key):
         },
     }
     data = ensure_minimal_data(data)
-    with requests.Session() as session:
-        resp = session.get(
-            f"{get_base_url()}/wrappers/get_download_url",
-            json=data,
-            timeout=TIMEOUT,
-            proxies=NO_PROXIES,
-        )
-        resp = resp.json()
-        return (resp["can_download"], resp["download_url"], resp["filename"])
+    session = get_session()
+    resp = session.get(
+        f"{get_base_url()}/wrappers/get_download_url",
+        json=data,
+        timeout=TIMEOUT,
+        proxies=NO_PROXIES,
+    )
+    resp = resp.json()
+    return (resp["can_download"], resp["download_url"], resp["filename"])
 
 
 def complete_upload_file_blocking(
@@ -422,16 +586,16 @@ def complete_upload_file_blocking(
         "originalFilename": os.path.basename(filepath),  # teoreticky asi nemusi byt
     }
     data = ensure_minimal_data(data)
-    with requests.Session() as session:
-        resp = session.get(
-            f"{get_base_url()}/wrappers/complete_upload_file_blocking",
-            json=data,
-            timeout=(1, 600),
-            proxies=NO_PROXIES,
-        )
+    session = get_session()
+    resp = session.get(
+        f"{get_base_url()}/wrappers/complete_upload_file_blocking",
+        json=data,
+        timeout=(1, 600),
+        proxies=NO_PROXIES,
+    )
 
-        print("complete_upload_file_blocking resp:", resp)
-        return resp.ok
+    print("complete_upload_file_blocking resp:", resp)
+    return resp.ok
 
 
 def blocking_file_download(url: str, filepath: str, api_key: str) -> requests.Response:
@@ -441,13 +605,13 @@ def blocking_file_download(url: str, filepath: str, api_key: str) -> requests.Re
         "filepath": filepath,
     }
     data = ensure_minimal_data(data)
-    with requests.Session() as session:
-        return session.get(
-            f"{get_base_url()}/wrappers/blocking_file_download",
-            json=data,
-            timeout=(1, 600),
-            proxies=NO_PROXIES,
-        )
+    session = get_session()
+    return session.get(
+        f"{get_base_url()}/wrappers/blocking_file_download",
+        json=data,
+        timeout=(1, 600),
+        proxies=NO_PROXIES,
+    )
 
 
 def blocking_request(
@@ -456,9 +620,12 @@ def blocking_request(
     headers: Optional[dict] = None,
     json_data: Optional[dict] = None,
     timeout: tuple = TIMEOUT,
+    session: Optional[requests.Session] = None,
 ) -> requests.Response:
     """Make blocking HTTP request through BlenderKit-Client.
-    Will not return until results are available."""
+    Will not return until results are available.
+    Calls from background threads have to pass their own session.
+    """
     if headers is None:
         headers = {}
     data = {
@@ -468,13 +635,14 @@ def blocking_request(
     }
     if json_data is not None:
         data["json"] = json_data
-    with requests.Session() as session:
-        return session.get(
-            f"{get_base_url()}/wrappers/blocking_request",
-            json=data,
-            timeout=timeout,
-            proxies=NO_PROXIES,
-        )
+    if session is None:
+        session = get_session()
+    return session.get(
+        f"{get_base_url()}/wrappers/blocking_request",
+        json=data,
+        timeout=timeout,
+        proxies=NO_PROXIES,
+    )
 
 
 ### REQUEST WRAPPERS
@@ -501,13 +669,13 @@ def nonblocking_request(
     data = ensure_minimal_data(data)
     if json_data is not None:
         data["json"] = json_data
-    with requests.Session() as session:
-        return session.get(
-            f"{get_base_url()}/wrappers/nonblocking_request",
-            json=data,
-            timeout=TIMEOUT,
-            proxies=NO_PROXIES,
-        )
+    session = get_session()
+    return session.get(
+        f"{get_base_url()}/wrappers/nonblocking_request",
+        json=data,
+        timeout=TIMEOUT,
+        proxies=NO_PROXIES,
+    )
 
 
 ### AUTHORIZATION
@@ -521,14 +689,14 @@ def send_oauth_verification_data(code_verifier, state: str):
             "state": state,
         }
     )
-    with requests.Session() as session:
-        resp = session.post(
-            f"{get_base_url()}/oauth2/verification_data",
-            json=data,
-            timeout=TIMEOUT,
-            proxies=NO_PROXIES,
-        )
-        return resp
+    session = get_session()
+    resp = session.post(
+        f"{get_base_url()}/oauth2/verification_data",
+        json=data,
+        timeout=TIMEOUT,
+        proxies=NO_PROXIES,
+    )
+    return resp
 
 
 def refresh_token(refresh_token, old_api_key):
@@ -537,43 +705,46 @@ def refresh_token(refresh_token, old_api_key):
     """
     bk_logger.info("Calling API token refresh")
     data = ensure_minimal_data({"refresh_token": refresh_token})
-    with requests.Session() as session:
-        url = get_base_url() + "/refresh_token"
-        resp = session.get(
-            url,
-            json=data,
-            timeout=TIMEOUT,
-            proxies=NO_PROXIES,
-        )
-        return resp
+    session = get_session()
+    url = get_base_url() + "/refresh_token"
+    resp = session.get(
+        url,
+        json=data,
+        timeout=TIMEOUT,
+        proxies=NO_PROXIES,
+    )
+    return resp
 
 
 def oauth2_logout():
     """Logout from OAUTH2. BlenderKit-Client will revoke the token on the server."""
     data = ensure_minimal_data()
     data["refresh_token"] = global_vars.PREFS["api_key_refresh"]
-    with requests.Session() as session:
-        url = get_base_url() + "/oauth2/logout"
-        resp = session.get(url, json=data, timeout=TIMEOUT, proxies=NO_PROXIES)
-        return resp
+    session = get_session()
+    url = get_base_url() + "/oauth2/logout"
+    resp = session.get(url, json=data, timeout=TIMEOUT, proxies=NO_PROXIES)
+    return resp
 
 
 def unsubscribe_addon():
     """Unsubscribe the add-on from the BlenderKit-Client. Called when the add-on is disabled, uninstalled or when Blender is closed."""
     data = ensure_minimal_data()
-    with requests.Session() as session:
-        url = get_base_url() + "/blender/unsubscribe_addon"
-        resp = session.get(url, json=data, timeout=TIMEOUT, proxies=NO_PROXIES)
-        return resp
+    session = get_session()
+    url = get_base_url() + "/blender/unsubscribe_addon"
+    resp = session.get(url, json=data, timeout=TIMEOUT, proxies=NO_PROXIES)
+    return resp
 
 
 def shutdown_client():
     """Request to shutdown the BlenderKit-Client."""
     data = ensure_minimal_data()
-    with requests.Session() as session:
-        url = get_base_url() + "/shutdown"
+    session = get_session()
+    url = get_base_url() + "/shutdown"
+    try:
         resp = session.get(url, data=data, timeout=TIMEOUT, proxies=NO_PROXIES)
-        return resp
+    finally:
+        close_session()
+    return resp
 
 
 def handle_client_status_task(task):
@@ -16,8 +16,10 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+import dataclasses
+import time
 import uuid
-from typing import Optional
+from typing import Any, Callable, Optional
 
 
 class Task:
@@ -54,3 +56,51 @@ class Task:
 
     def __str__(self):
         return f"ID={self.task_id}, APP_ID={self.app_id}"
+
+
+TaskHandler = Callable[[Task], Any]
+
+
+@dataclasses.dataclass
+class HandlerTiming:
+    """Cumulative timing of handler calls for one task type."""
+
+    calls: int = 0
+    total: float = 0.0
+    worst: float = 0.0
+
+
+TASK_HANDLERS: dict[tuple[str, str], TaskHandler] = {}
+"""Handlers of tasks reported by the Client. Key is (task_type, status), empty status matches any status."""
+HANDLER_TIMINGS: dict[str, HandlerTiming] = {}
+"""Timing of handler calls, key is task_type."""
+
+
+def register_task_handler(task_type: str, handler: TaskHandler, status: str = ""):
+    """Register handler for tasks of task_type. If status is specified, handler is used only for tasks in that status."""
+    TASK_HANDLERS[(task_type, status)] = handler
+
+
+def get_task_handler(task: Task) -> Optional[TaskHandler]:
+    """Get handler registered for the task's type and status, or for the task's type and any status."""
+    handler = TASK_HANDLERS.get((task.task_type, task.status))
+    if handler is None:
+        handler = TASK_HANDLERS.get((task.task_type, ""))
+    return handler
+
+
+def run_task_handler(task: Task) -> Any:
+    """Call handler registered for the task and record how long it took. Tasks without a handler are ignored."""
+    handler = get_task_handler(task)
+    if handler is None:
+        return None
+
+    start = time.perf_counter()
+    try:
+        return handler(task)
+    finally:
+        duration = time.perf_counter() - start
+        timing = HANDLER_TIMINGS.setdefault(task.task_type, HandlerTiming())
+        timing.calls += 1
+        timing.total += duration
+        timing.worst = max(timing.worst, duration)
@@ -66,6 +66,8 @@ class SearchData:
         False  # Client makes some extra stuff for validators - like fetching all the ratings right away
     )
     history_id: str = ""
+    refill: bool = False  # evicted page with urlquery is fetched again
+    revalidate: bool = False  # page is shown from the search cache, replace it
 
 
 @dataclasses.dataclass
@@ -152,3 +154,39 @@ class AssetRating:
     working_hours: Optional[float] = None  # name kept as comes from API
     working_hours_fetched: bool = False
     # TODO: Add last time ratings checked to improve caching
+
+
+DIRTY_ASSETS_MAX = 1000
+
+
+@dataclasses.dataclass
+class DirtyAssets:
+    """Asset ids whose asset bar buttons need an update, each marked with the generation it was added in.
+    Every asset bar keeps the last generation it has read, so all bars see all changes.
+    Only the last DIRTY_ASSETS_MAX ids are kept, also while no asset bar is open.
+    """
+
+    generation: int = 0
+    ids: dict[str, int] = dataclasses.field(default_factory=dict)
+    oldest: int = 0  # generation of the oldest dropped id
+
+    def add(self, asset_id: str):
+        self.generation += 1
+        self.ids.pop(asset_id, None)
+        self.ids[asset_id] = self.generation
+        while len(self.ids) > DIRTY_ASSETS_MAX:
+            dropped = next(iter(self.ids))
+            self.oldest = self.ids.pop(dropped)
+
+    def get_since(self, generation: int) -> Optional[list[str]]:
+        """Get ids added after the generation, newest first.
+        Returns None if some of them were already dropped, the reader has to update everything then.
+        """
+        if generation < self.oldest:
+            return None
+        ids = []
+        for asset_id in reversed(self.ids):
+            if self.ids[asset_id] <= generation:
+                break
+            ids.append(asset_id)
+        return ids
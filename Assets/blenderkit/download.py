@@ -27,6 +27,7 @@ from . import (
     append_link,
     client_lib,
     client_tasks,
+    global_vars,
     paths,
     reports,
     resolutions,
@@ -173,29 +174,148 @@ def scene_load(context):
     # and erase from scene linked files that aren't used in the scene.
 
 
+class AssetUsageIndex:
+    """Live counts of assets used by objects of a scene and their materials.
+    Kept up to date by the depsgraph handler, so scene_save doesn't have to scan all objects.
+    Same as the original full scan, only objects linked directly to the scene collection are counted.
+    Undo, redo and file load invalidate the index, it is rebuilt on next save.
+    """
+
+    def __init__(self):
+        self.scene_pointer = 0
+        self.valid = False
+        self.objects: dict[int, tuple] = (
+            {}
+        )  # object pointer -> (assetBaseIds it uses, object data pointer, object name)
+        self.data_users: dict[int, set[str]] = (
+            {}
+        )  # object data pointer -> names of objects using it, their material slots can be linked to the data
+        self.counts: dict[str, int] = {}
+        self.assets: dict[str, dict] = {}  # assetBaseId -> asset_data
+
+    def invalidate(self):
+        self.valid = False
+
+    def rebuild(self, scene):
+        self.objects.clear()
+        self.data_users.clear()
+        self.counts.clear()
+        self.assets.clear()
+        for ob in scene.collection.objects:
+            self.set_object(ob)
+        self.scene_pointer = scene.as_pointer()
+        self.valid = True
+
+    def set_object(self, ob):
+        pointer = ob.as_pointer()
+        self.remove_object(pointer)
+        used = []
+        asset_data = ob.get("asset_data")
+        if asset_data is not None:
+            used.append(self.add_asset(asset_data))
+        for ms in ob.material_slots:
+            m = ms.material
+            if m is not None and m.get("asset_data") is not None:
+                used.append(self.add_asset(m["asset_data"]))
+        data_pointer = ob.data.as_pointer() if ob.data is not None else 0
+        if data_pointer:
+            self.data_users.setdefault(data_pointer, set()).add(ob.name)
+        self.objects[pointer] = (tuple(used), data_pointer, ob.name)
+
+    def set_data_users(self, data, scene_objects):
+        """Update objects using the object data, e.g. a mesh which got a material assigned."""
+        for name in list(self.data_users.get(data.as_pointer(), ())):
+            ob = scene_objects.get(name)
+            if ob is not None:
+                self.set_object(ob)
+
+    def sync_objects(self, scene_objects):
+        """Add objects linked to the scene and remove unlinked or deleted ones, those don't send their own updates."""
+        current = {ob.as_pointer(): ob for ob in scene_objects}
+        for pointer in self.objects.keys() - current.keys():
+            self.remove_object(pointer)
+        for pointer in current.keys() - self.objects.keys():
+            self.set_object(current[pointer])
+
+    def add_asset(self, asset_data) -> str:
+        abid = asset_data["assetBaseId"]
+        self.counts[abid] = self.counts.get(abid, 0) + 1
+        if abid not in self.assets:
+            # copy, the ID property is freed together with its object
+            self.assets[abid] = asset_data.to_dict()
+        return abid
+
+    def remove_object(self, pointer: int):
+        used, data_pointer, name = self.objects.pop(pointer, ((), 0, ""))
+        for abid in used:
+            self.counts[abid] -= 1
+            if self.counts[abid] == 0:
+                del self.counts[abid]
+                del self.assets[abid]
+        users = self.data_users.get(data_pointer)
+        if users is not None:
+            users.discard(name)
+            if not users:
+                del self.data_users[data_pointer]
+
+
+asset_usage_index = AssetUsageIndex()
+
+
+@persistent
+def asset_usage_depsgraph_update(scene, depsgraph):
+    """Update asset usage index with objects changed in the scene."""
+    index = asset_usage_index
+    if not index.valid:
+        return
+    if scene.as_pointer() != index.scene_pointer:
+        index.invalidate()
+        return
+    scene_objects = scene.collection.objects
+    relinked = False
+    for update in depsgraph.updates:
+        if isinstance(update.id, (bpy.types.Collection, bpy.types.Scene)):
+            relinked = True  # objects were linked, unlinked or deleted
+            continue
+        if isinstance(update.id, bpy.types.Mesh):
+            index.set_data_users(update.id.original, scene_objects)
+            continue
+        if not isinstance(update.id, bpy.types.Object):
+            continue
+        if update.is_updated_transform and not (
+            update.is_updated_geometry or update.is_updated_shading
+        ):
+            continue  # moving objects doesn't change used assets
+        ob = update.id.original
+        if scene_objects.get(ob.name) is None:
+            index.remove_object(ob.as_pointer())
+        else:
+            index.set_object(ob)
+    if relinked or len(scene_objects) != len(index.objects):
+        index.sync_objects(scene_objects)
+
+
+@persistent
+def asset_usage_invalidate(*args):
+    """Undo, redo and load replace the data, pointers in the index are not valid anymore."""
+    asset_usage_index.invalidate()
+
+
 # TODO: FIX OR REMOVE THIS BROKEN FUNCTION - remove empty dict all the time
 # https://github.com/BlenderKit/blenderkit/issues/1013
 def get_asset_usages():
     """Report the usage of assets to the server."""
     sid = utils.get_scene_id()
-    assets = {}
-    asset_obs = []
     scene = bpy.context.scene
-    asset_usages = {}
-
-    for ob in scene.collection.objects:
-        if ob.get("asset_data") != None:
-            asset_obs.append(ob)
-
-    for ob in asset_obs:
-        asset_data = ob["asset_data"]
-        abid = asset_data["assetBaseId"]
-
-        if assets.get(abid) is None:
-            asset_usages[abid] = {"count": 1}
-            assets[abid] = asset_data
-        else:
-            asset_usages[abid]["count"] += 1
+    if (
+        not asset_usage_index.valid
+        or asset_usage_index.scene_pointer != scene.as_pointer()
+    ):
+        asset_usage_index.rebuild(scene)
+    assets = dict(asset_usage_index.assets)
+    asset_usages = {
+        abid: {"count": count} for abid, count in asset_usage_index.counts.items()
+    }
 
     # brushes
     for b in bpy.data.brushes:
@@ -203,18 +323,6 @@ def get_asset_usages():
             abid = b["asset_data"]["assetBaseId"]
             asset_usages[abid] = {"count": 1}
             assets[abid] = b["asset_data"]
-    # materials
-    for ob in scene.collection.objects:
-        for ms in ob.material_slots:
-            m = ms.material
-
-            if m is not None and m.get("asset_data") is not None:
-                abid = m["asset_data"]["assetBaseId"]
-                if assets.get(abid) is None:
-                    asset_usages[abid] = {"count": 1}
-                    assets[abid] = m["asset_data"]
-                else:
-                    asset_usages[abid]["count"] += 1
 
     assets_list = []
     assets_reported = scene.get("assets reported", {})
@@ -276,21 +384,15 @@ def udpate_asset_data_in_dicts(asset_data):
     scene["assets used"][asset_data["assetBaseId"]] = data
 
     # Get search results from history
-    history_step = search.get_active_history_step()
-    search_results = history_step.get("search_results")
-    if not search_results:
+    results = search.find_search_results(asset_data["assetBaseId"])
+    if not results:
         return
 
-    for result in search_results:
-        if result["assetBaseId"] != asset_data["assetBaseId"]:
-            continue
-        for file in asset_data["files"]:
-            if not file.get("url"):
-                continue
-            for f1 in result["files"]:
-                if f1["fileType"] != file["fileType"]:
-                    continue
-                f1["url"] = file["url"]
+    urls = {f["fileType"]: f["url"] for f in asset_data["files"] if f.get("url")}
+    for result in results:
+        for f1 in result.get("files", []):  # evicted results have no files
+            if f1["fileType"] in urls:
+                f1["url"] = urls[f1["fileType"]]
 
 
 def assign_material(object, material, target_slot):
@@ -835,12 +937,11 @@ def download_write_progress(task_id, task):
     task_addon["progress"] = task.progress
     task_addon["text"] = task.message
 
-    # go through search results to write progress to display progress bars
-    sr = search.get_search_results()
-    if sr is not None:
-        for r in sr:
-            if task.data["asset_data"]["id"] == r["id"]:
-                r["downloaded"] = task.progress
+    # write progress to search results to display progress bars
+    for r in search.find_search_results(task.data["asset_data"]["id"]):
+        if r["downloaded"] != task.progress:
+            global_vars.DIRTY_ASSETS.add(r["id"])
+        r["downloaded"] = task.progress
 
 
 # TODO might get moved to handle all blenderkit stuff, not to slow down.
@@ -1093,13 +1194,9 @@ def try_finished_append(asset_data, **kwargs):
         raise e
 
     # Update downloaded status in search results
-    sr = search.get_search_results()
-    if sr is None:
-        return
-    for sres in sr:
-        if asset_data["id"] != sres["id"]:
-            continue
+    for sres in search.find_search_results(asset_data["id"]):
         sres["downloaded"] = 100
+        global_vars.DIRTY_ASSETS.add(sres["id"])
 
 
 def get_asset_in_scene(asset_data):
@@ -1609,6 +1706,10 @@ def register_download():
     bpy.utils.register_class(BlenderkitKillDownloadOperator)
     bpy.app.handlers.load_post.append(scene_load)
     bpy.app.handlers.save_pre.append(scene_save)
+    bpy.app.handlers.depsgraph_update_post.append(asset_usage_depsgraph_update)
+    bpy.app.handlers.undo_post.append(asset_usage_invalidate)
+    bpy.app.handlers.redo_post.append(asset_usage_invalidate)
+    bpy.app.handlers.load_post.append(asset_usage_invalidate)
 
 
 def unregister_download():
@@ -1616,3 +1717,7 @@ def unregister_download():
     bpy.utils.unregister_class(BlenderkitKillDownloadOperator)
     bpy.app.handlers.load_post.remove(scene_load)
     bpy.app.handlers.save_pre.remove(scene_save)
+    bpy.app.handlers.depsgraph_update_post.remove(asset_usage_depsgraph_update)
+    bpy.app.handlers.undo_post.remove(asset_usage_invalidate)
+    bpy.app.handlers.redo_post.remove(asset_usage_invalidate)
+    bpy.app.handlers.load_post.remove(asset_usage_invalidate)
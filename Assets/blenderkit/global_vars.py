@@ -32,6 +32,8 @@ CLIENT_RUNNING = False
 """Just  for on_startup_client_online_timer()."""
 CLIENT_FAILED_REPORTS = 0
 """Number of failed requests to get reports from the BlenderKit-Client. If too many, something is wrong."""
+CLIENT_REPORTS_SEQ = 0
+"""Sequence cursor of the last report received from the BlenderKit-Client. Client sends only tasks changed after it."""
 CLIENT_PORTS = ["62485", "65425", "55428", "49452", "35452", "25152", "5152", "1234"]
 """Ports are ordered during the start, and later after malfunction."""
 
@@ -54,6 +56,8 @@ TABS = {
 }
 
 RATINGS: dict[str, datas.AssetRating] = {}
+DIRTY_ASSETS: datas.DirtyAssets = datas.DirtyAssets()
+"""Asset ids and assetBaseIds whose asset bar buttons need an update. Filled on thumbnail, download and rating events, read by each asset bar."""
 BKIT_PROFILE: datas.MineProfile = datas.MineProfile()
 """Profile of the current user."""
 BKIT_AUTHORS: dict[int, datas.UserProfile] = {}
@@ -22,6 +22,12 @@ import time
 import bpy
 
 
+try:  # Pillow is not bundled with Blender, thumbnails are decoded by bpy without it
+    from PIL import Image as PILImage
+except ImportError:
+    PILImage = None
+
+
 def get_orig_render_settings():
     rs = bpy.context.scene.render
     ims = rs.image_settings
@@ -93,7 +99,8 @@ def set_colorspace(img, colorspace: str = ""):
 
         if colorspace == "Non-Color":
             img.colorspace_settings.is_data = True
-        else:
+        elif img.colorspace_settings.name != colorspace:
+            # assigning even the same colorspace reloads the image
             img.colorspace_settings.name = colorspace
     except Exception as e:
         print(f"Colorspace {colorspace} not found: {e}")
@@ -190,40 +197,109 @@ def find_image_depth(image):
         return depth_mapping.get(image.depth, "8")
 
 
-def can_erase_alpha(na):
-    alpha = na[3::4]
-    alpha_sum = alpha.sum()
-    if alpha_sum == alpha.size:
-        print("image can have alpha erased")
-    # print(alpha_sum, alpha.size)
-    return alpha_sum == alpha.size
+IMAGE_ANALYSIS_TILE_PIXELS = 1 << 20  # pixels analysed at once, bounds the temporaries
+IMAGE_ANALYSIS_WORKERS = 4
 
 
-def is_image_black(na):
-    r = na[::4]
-    g = na[1::4]
-    b = na[2::4]
+def analyze_pixels_tile(tile, verdicts):
+    """Disprove the still open verdicts on one tile of pixels shaped (pixels, channels)."""
+    import numpy
 
-    rgbsum = r.sum() + g.sum() + b.sum()
+    if verdicts["alpha"] and not numpy.all(tile[:, 3] == 1):
+        verdicts["alpha"] = False
+    if verdicts["black"] and numpy.any(tile[:, :3]):
+        verdicts["black"] = False
+    if verdicts["bw"] and not (
+        numpy.array_equal(tile[:, 0], tile[:, 1])
+        and numpy.array_equal(tile[:, 1], tile[:, 2])
+    ):
+        verdicts["bw"] = False
+
+
+def analyze_pixels(
+    na,
+    channels=4,
+    alpha=True,
+    black=True,
+    bw=True,
+    workers=1,
+    tile_pixels=IMAGE_ANALYSIS_TILE_PIXELS,
+):
+    """Compute alpha, black and grayscale verdicts of a flat pixel buffer tile by tile.
+    alpha - alpha channel is fully opaque and can be erased
+    black - all color channels are zero
+    bw - all color channels are equal, image can be stored as BW
+    A verdict is no longer checked once a tile disproves it and the scan stops when all are disproved,
+    so no full-size temporaries are created. With workers > 1 the tiles are analysed in threads,
+    numpy releases the GIL for the comparisons.
+    """
+    from concurrent.futures import ThreadPoolExecutor
 
-    # print('rgb sum', rgbsum, r.sum(), g.sum(), b.sum())
-    if rgbsum == 0:
-        print("image can have alpha channel dropped")
-    return rgbsum == 0
+    verdicts = {
+        "alpha": alpha and channels == 4,
+        "black": black and channels >= 3,
+        "bw": bw and channels >= 3,
+    }
+    pixels = na.reshape(-1, channels)
+    starts = range(0, len(pixels), tile_pixels)
 
+    def analyze_tile(start):
+        if any(verdicts.values()):
+            analyze_pixels_tile(pixels[start : start + tile_pixels], verdicts)
 
-def is_image_bw(na):
-    r = na[::4]
-    g = na[1::4]
-    b = na[2::4]
+    if workers > 1 and len(starts) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(analyze_tile, starts))
+    else:
+        for start in starts:
+            if not any(verdicts.values()):
+                break
+            analyze_tile(start)
+    return verdicts
+
+
+def analyze_image(image, workers=1, **checks):
+    """Read the pixels of a bpy image once and analyse them with analyze_pixels."""
+    t = time.time()
+    na = imagetonumpy_flat(image)
+    verdicts = analyze_pixels(na, channels=image.channels, workers=workers, **checks)
+    del na
+    print(f"analysed image {image.name} in {time.time() - t:.3f}s: {verdicts}")
+    return verdicts
 
-    rg_equal = r == g
-    gb_equal = g == b
-    rgbequal = rg_equal.all() and gb_equal.all()
-    if rgbequal:
-        print("image is black and white, can have channels reduced")
 
-    return rgbequal
+def can_decode_thumbnails():
+    """Return True if thumbnails can be decoded outside of the main thread."""
+    return PILImage is not None
+
+
+def decode_thumbnail(filepath, size):
+    """Decode a JPEG/WebP thumbnail and resize it to size x size pixels.
+    Doesn't touch bpy, so it can run in worker threads.
+    Returns flat float32 RGBA pixels ordered bottom row first as bpy images store them.
+    """
+    import numpy
+
+    with PILImage.open(filepath) as img:
+        img = img.convert("RGBA")
+        if img.size != (size, size):
+            img = img.resize((size, size), PILImage.BILINEAR)
+        na = numpy.asarray(img, dtype=numpy.float32)
+    na = na[::-1].reshape(-1)
+    na *= 1.0 / 255.0
+    return na
+
+
+def thumbnail_to_image(iname, filepath, pixels, size, colorspace=""):
+    """Create a bpy image from pixels decoded by decode_thumbnail, must run on the main thread.
+    filepath_raw is used so Blender doesn't reload the pixels from the file.
+    """
+    img = bpy.data.images.new(iname, size, size, alpha=True)
+    # colorspace change regenerates pixels of generated images, so it's set before they are written
+    set_colorspace(img, colorspace)
+    img.pixels.foreach_set(pixels)
+    img.filepath_raw = filepath
+    return img
 
 
 def numpytoimage(a, iname, width=0, height=0, channels=3):
@@ -380,16 +456,49 @@ def check_nmap_mean_ok(i):
     return nmap_ok
 
 
-def check_nmap_ogl_vs_dx(i, mask=None, generated_test_images=False):
+NMAP_FAST_SIZE = 512  # longer side of the image analysed in fast mode
+
+
+def integrate_nmap_heights(na, mask, rmean, gmean):
+    """Integrate heights from normal map pixels for OpenGL and DirectX conventions.
+    Height of a pixel is half of the sum of its left and lower neighbours minus the slope of the pixel,
+    pixels outside of the image and masked out pixels have height 0.
+    Pixels on one anti-diagonal only depend on the previous one, so the image is swept diagonal by diagonal.
+    Returns arrays of OpenGL and DirectX heights indexed [x, y].
+    """
+    import numpy
+
+    width, height = na.shape[0], na.shape[1]
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        diff_x = (na[:, :, 0] - rmean) / (na[:, :, 2] - 0.5)
+        diff_y = (na[:, :, 1] - gmean) / (na[:, :, 2] - 0.5)
+    slopes = numpy.stack((diff_x + diff_y, diff_x - diff_y))
+    if mask is None:
+        visible = numpy.ones((width, height), dtype=bool)
+    else:
+        visible = mask[:, :, 3] > 0
+
+    # padded by zero row and column, height of pixel x, y is at x + 1, y + 1
+    heights = numpy.zeros((2, width + 1, height + 1), numpy.float32)
+    for k in range(width + height - 1):
+        xs = numpy.arange(max(0, k - height + 1), min(k, width - 1) + 1)
+        ys = k - xs
+        calc_height = (
+            heights[:, xs, ys + 1] + heights[:, xs + 1, ys] - slopes[:, xs, ys]
+        ) / 2
+        heights[:, xs + 1, ys + 1] = numpy.where(visible[xs, ys], calc_height, 0)
+    return heights[0, 1:, 1:], heights[1, 1:, 1:]
+
+
+def check_nmap_ogl_vs_dx(
+    i, mask=None, generated_test_images=False, fast=False, return_confidence=False
+):
     """
     checks if normal map is directX or OpenGL.
     Returns - String value - DirectX and OpenGL
+    With fast=True the image is sampled down to NMAP_FAST_SIZE pixels on the longer side.
+    With return_confidence=True returns also confidence of the guess from 0 to 1.
     """
-    import numpy
-
-    width = i.size[0]
-    height = i.size[1]
-
     rmean, gmean, bmean = get_rgb_mean(i)
 
     na = imagetonumpy(i)
@@ -397,59 +506,18 @@ def check_nmap_ogl_vs_dx(i, mask=None, generated_test_images=False):
     if mask:
         mask = imagetonumpy(mask)
 
-    red_x_comparison = numpy.zeros((width, height), numpy.float32)
-    green_y_comparison = numpy.zeros((width, height), numpy.float32)
+    if fast:
+        step = max(1, max(na.shape[0], na.shape[1]) // NMAP_FAST_SIZE)
+        na = na[::step, ::step]
+        if mask is not None:
+            mask = mask[::step, ::step]
 
-    if generated_test_images:
-        red_x_comparison_img = numpy.empty(
-            (width, height, 4), numpy.float32
-        )  # images for debugging purposes
-        green_y_comparison_img = numpy.empty(
-            (width, height, 4), numpy.float32
-        )  # images for debugging purposes
-
-    ogl = numpy.zeros((width, height), numpy.float32)
-    dx = numpy.zeros((width, height), numpy.float32)
+    width = na.shape[0]
+    height = na.shape[1]
+    ogl, dx = integrate_nmap_heights(na, mask, rmean, gmean)
 
-    if generated_test_images:
-        ogl_img = numpy.empty(
-            (width, height, 4), numpy.float32
-        )  # images for debugging purposes
-        dx_img = numpy.empty(
-            (width, height, 4), numpy.float32
-        )  # images for debugging purposes
-
-    for y in range(0, height):
-        for x in range(0, width):
-            # try to mask with UV mask image
-            if mask is None or mask[x, y, 3] > 0:
-                last_height_x = ogl[max(x - 1, 0), min(y, height - 1)]
-                last_height_y = ogl[max(x, 0), min(y - 1, height - 1)]
-
-                diff_x = (na[x, y, 0] - rmean) / ((na[x, y, 2] - 0.5))
-                diff_y = (na[x, y, 1] - gmean) / ((na[x, y, 2] - 0.5))
-                calc_height = (last_height_x + last_height_y) - diff_x - diff_y
-                calc_height = calc_height / 2
-                ogl[x, y] = calc_height
-                if generated_test_images:
-                    rgb = calc_height * 0.1 + 0.5
-                    ogl_img[x, y] = [rgb, rgb, rgb, 1]
-
-                # green channel
-                last_height_x = dx[max(x - 1, 0), min(y, height - 1)]
-                last_height_y = dx[max(x, 0), min(y - 1, height - 1)]
-
-                diff_x = (na[x, y, 0] - rmean) / ((na[x, y, 2] - 0.5))
-                diff_y = (na[x, y, 1] - gmean) / ((na[x, y, 2] - 0.5))
-                calc_height = (last_height_x + last_height_y) - diff_x + diff_y
-                calc_height = calc_height / 2
-                dx[x, y] = calc_height
-                if generated_test_images:
-                    rgb = calc_height * 0.1 + 0.5
-                    dx_img[x, y] = [rgb, rgb, rgb, 1]
-
-    ogl_std = ogl.std()
-    dx_std = dx.std()
+    ogl_std = float(ogl.std())
+    dx_std = float(dx.std())
 
     # print(mean_ogl, mean_dx)
     # print(max_ogl, max_dx)
@@ -462,27 +530,29 @@ def check_nmap_ogl_vs_dx(i, mask=None, generated_test_images=False):
         print("this is probably an OpenGL texture")
 
     if generated_test_images:
-        # red_x_comparison_img = red_x_comparison_img.swapaxes(0,1)
-        # red_x_comparison_img = red_x_comparison_img.flatten()
-        #
-        # green_y_comparison_img = green_y_comparison_img.swapaxes(0,1)
-        # green_y_comparison_img = green_y_comparison_img.flatten()
-        #
-        # numpytoimage(red_x_comparison_img, 'red_' + i.name, width=width, height=height, channels=1)
-        # numpytoimage(green_y_comparison_img, 'green_' + i.name, width=width, height=height, channels=1)
-
-        ogl_img = ogl_img.swapaxes(0, 1)
-        ogl_img = ogl_img.flatten()
-
-        dx_img = dx_img.swapaxes(0, 1)
-        dx_img = dx_img.flatten()
-
-        numpytoimage(ogl_img, "OpenGL", width=width, height=height, channels=1)
-        numpytoimage(dx_img, "DirectX", width=width, height=height, channels=1)
+        # images for debugging purposes
+        for heights, name in ((ogl, "OpenGL"), (dx, "DirectX")):
+            rgb = heights * 0.1 + 0.5
+            img = numpy_stack_gray(rgb)
+            img = img.swapaxes(0, 1)
+            img = img.flatten()
+            numpytoimage(img, name, width=width, height=height, channels=1)
+
+    result = "DirectX" if abs(ogl_std) > abs(dx_std) else "OpenGL"
+    if not return_confidence:
+        return result
+    larger = max(abs(ogl_std), abs(dx_std))
+    confidence = abs(abs(ogl_std) - abs(dx_std)) / larger if larger > 0 else 0.0
+    return result, confidence
+
+
+def numpy_stack_gray(values):
+    """Make RGBA pixels [x, y, 4] from gray values [x, y]."""
+    import numpy
 
-    if abs(ogl_std) > abs(dx_std):
-        return "DirectX"
-    return "OpenGL"
+    return numpy.stack(
+        (values, values, values, numpy.ones_like(values)), axis=-1
+    ).astype(numpy.float32)
 
 
 def make_possible_reductions_on_image(
@@ -500,8 +570,6 @@ def make_possible_reductions_on_image(
     # teximage.colorspace_settings.name = 'sRGB' color correction mambo jambo.
 
     JPEG_QUALITY = 90
-    # is_image_black(na)
-    # is_image_bw(na)
 
     rs = bpy.context.scene.render
     ims = rs.image_settings
@@ -512,7 +580,7 @@ def make_possible_reductions_on_image(
     orig_compression = ims.compression
     orig_depth = ims.color_depth
 
-    # if is_image_black(na):
+    # if analyze_image(teximage)["black"]:
     #     # just erase the image from the asset here, no need to store black images.
     #     pass;
 
@@ -535,9 +603,9 @@ def make_possible_reductions_on_image(
 
     fp = input_filepath
     if do_reductions:
-        na = imagetonumpy_flat(teximage)
+        verdicts = analyze_image(teximage, workers=IMAGE_ANALYSIS_WORKERS, black=False)
 
-        if can_erase_alpha(na):
+        if verdicts["alpha"]:
             print(teximage.file_format)
             if teximage.file_format == "PNG":
                 print("changing type of image to JPG")
@@ -555,7 +623,7 @@ def make_possible_reductions_on_image(
                 ims.color_mode = "RGB"
                 image_depth = "8"
 
-            if is_image_bw(na):
+            if verdicts["bw"]:
                 ims.color_mode = "BW"
 
     ims.file_format = teximage.file_format
@@ -16,6 +16,7 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+import bisect
 import getpass
 import logging
 import os
@@ -24,6 +25,8 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+from collections import OrderedDict
 
 import bpy
 
@@ -244,18 +247,82 @@ resolutions = {
 }
 
 
+# resolution values sorted ascending, for nearest-match search with bisect
+resolution_values = sorted(resolutions.values())
+resolution_keys = {v: k for k, v in resolutions.items()}
+
+
+def closest_value_index(values, value):
+    """Index of the item closest to value in ascending values, lower one wins a tie."""
+    i = bisect.bisect_left(values, value)
+    if i == len(values):
+        return i - 1
+    if i > 0 and value - values[i - 1] <= values[i] - value:
+        return i - 1
+    return i
+
+
 def round_to_closest_resolution(res):
-    rdist = 1000000
-    #    while res/2>1:
-    #        p2res*=2
-    #        res = res/2
-    for rkey in resolutions:
-        d = abs(res - resolutions[rkey])
-        if d < rdist:
-            rdist = d
-            p2res = rkey
+    return resolution_keys[
+        resolution_values[closest_value_index(resolution_values, res)]
+    ]
 
-    return p2res
+
+FILES_INDEX_CACHE_SIZE = 5000
+files_index_cache: OrderedDict = OrderedDict()
+"""(asset id, fileTypes of the files) -> index of the files, see index_asset_files(). Kept out of asset_data,
+which is stored in ID properties, those can't hold the mixed lists of the index.
+Keyed by content, asset data read back from ID properties or Client tasks are new objects with the same files."""
+files_index_lock = threading.Lock()
+
+
+def get_files_index_key(asset_data) -> tuple:
+    return (
+        asset_data.get("id"),
+        tuple(f["fileType"] for f in asset_data["files"]),
+    )
+
+
+def index_asset_files(asset_data):
+    """Precompute index of asset files:
+    types - position of the file in asset_data["files"] by fileType
+    resolutions - [resolution value, fileType] of resolution files, sorted by value
+    Built once when results are parsed, so get_res_file doesn't rescan the files.
+    The index is cached by asset id and the file types it was built from.
+    """
+    files = asset_data["files"]
+    types = {}
+    for i, f in enumerate(files):
+        types.setdefault(f["fileType"], i)
+    files_resolutions = sorted(
+        [resolutions[file_type], file_type]
+        for file_type in types
+        if file_type in resolutions
+    )
+    files_index = {
+        "types": types,
+        "resolutions": files_resolutions,
+        "count": len(files),
+    }
+    key = get_files_index_key(asset_data)
+    with files_index_lock:
+        files_index_cache[key] = files_index
+        files_index_cache.move_to_end(key)
+        while len(files_index_cache) > FILES_INDEX_CACHE_SIZE:
+            files_index_cache.popitem(last=False)
+    return files_index
+
+
+def get_files_index(asset_data):
+    """Return index of asset files, built if missing or if the files changed, e.g. for asset data from scenes."""
+    key = get_files_index_key(asset_data)
+    with files_index_lock:
+        files_index = files_index_cache.get(key)
+        if files_index is not None:
+            files_index_cache.move_to_end(key)
+    if files_index is None:
+        return index_asset_files(asset_data)
+    return files_index
 
 
 def get_res_file(asset_data, resolution, find_closest_with_url=False):
@@ -272,32 +339,23 @@ def get_res_file(asset_data, resolution, find_closest_with_url=False):
         resolution file
         resolution, so that other processess can pass correctly which resolution is downloaded.
     """
-    orig = None
-    res = None
-    closest = None
+    files = asset_data["files"]
+    files_index = get_files_index(asset_data)
+    types = files_index["types"]
+    orig = files[types["blend"]] if "blend" in types else None
+
+    if resolution in types:
+        # exact match found, return.
+        return files[types[resolution]], resolution
+
+    # find closest resolution if the exact match wasn't found.
     target_resolution = resolutions.get(resolution)
-    mindist = 100000000
-
-    for f in asset_data["files"]:
-        if f["fileType"] == "blend":
-            orig = f
-            if resolution == "blend":
-                # orig file found, return.
-                return orig, "blend"
-
-        if f["fileType"] == resolution:
-            # exact match found, return.
-            return f, resolution
-        # find closest resolution if the exact match won't be found.
-        rval = resolutions.get(f["fileType"])
-        if rval and target_resolution:
-            rdiff = abs(target_resolution - rval)
-            if rdiff < mindist:
-                closest = f
-                mindist = rdiff
-    if not res and not closest:
+    files_resolutions = files_index["resolutions"]
+    if not target_resolution or not files_resolutions:
         return orig, "blend"
-    return closest, closest["fileType"]
+    values = [rval for rval, file_type in files_resolutions]
+    closest_type = files_resolutions[closest_value_index(values, target_resolution)][1]
+    return files[types[closest_type]], closest_type
 
 
 def server_to_local_filename(server_filename: str, asset_name: str) -> str:
@@ -117,6 +117,7 @@ def store_rating_local(
     rating.quality_fetched = True
     setattr(rating, rating_type, value)
     global_vars.RATINGS[asset_id] = rating
+    global_vars.DIRTY_ASSETS.add(asset_id)
 
 
 def get_rating_local(asset_id: str) -> Optional[datas.AssetRating]:
@@ -17,23 +17,30 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import copy
+import dataclasses
 import json
 import logging
 import math
 import os
 import re
+import threading
+import time
 import unicodedata
 import urllib.parse
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Union
 
 import bpy
+import requests
 from bpy.app.handlers import persistent
 from bpy.props import (  # TODO only keep the ones actually used when cleaning
     BoolProperty,
+    IntProperty,
     StringProperty,
 )
 from bpy.types import Operator
+from bpy_extras.io_utils import ExportHelper
 
 from . import (
     asset_bar_op,
@@ -47,13 +54,25 @@ from . import (
     ratings_utils,
     reports,
     resolutions,
+    search_cache,
     tasks_queue,
+    ui_bgl,
     utils,
 )
 
 
 bk_logger = logging.getLogger(__name__)
 search_tasks = {}
+parse_executor: Optional[ThreadPoolExecutor] = None
+SEARCH_PAGES_DISTANCE = 300
+"""Pages of search results further than this number of results from the scroll offset are evicted."""
+BULK_SEARCH_WORKERS = 4  # same as the pool size of Client connections
+BULK_SEARCH_RETRIES = 3
+
+EVICTED_ASSET_KEYS = ("description", "files", "tags", "dictParameters", "parameters")
+"""Heavy keys of asset data dropped from evicted pages."""
+parsing_search_tasks: list = []
+"""Search tasks with results being parsed in parse_executor: (task, orig_task, future)."""
 
 
 def update_ad(ad):
@@ -186,7 +205,21 @@ def parse_result(r) -> dict:
     ----------
     r - search result, also called asset_data
     """
-    scene = bpy.context.scene
+    webp_supported = bpy.app.version >= (3, 4, 0)  # WEBP was optimized in Blender 3.4.0
+    asset_data, author = parse_result_data(r, webp_supported, global_vars.BKIT_AUTHORS)
+    if not asset_data:
+        return {}
+    merge_parsed_result(asset_data, author, get_assets_used())
+    return asset_data
+
+
+def parse_result_data(
+    r: dict, webp_supported: bool, known_authors
+) -> tuple[dict, Optional[datas.UserProfile]]:
+    """Pure-Python part of parse_result(), does not touch bpy, so it can run outside of the main thread.
+    Returns parsed asset data and profile of the author, if the author is not in known_authors.
+    Data of the current scene are merged later on the main thread by merge_parsed_result().
+    """
     # TODO remove this fix when filesSize is fixed.
     # this is a temporary fix for too big numbers from the server.
     # can otherwise get the Python int too large to convert to C int
@@ -198,17 +231,21 @@ def parse_result(r) -> dict:
     asset_type = r["assetType"]
     # TODO remove this condition so all assets are parsed?
     if len(r["files"]) == 0:
-        return {}
+        return {}, None
 
     adata = r["author"]
     social_networks = datas.parse_social_networks(adata.pop("socialNetworks", []))
-    author = datas.UserProfile(**adata, socialNetworks=social_networks)
-    generate_author_profile(author)
+    author = None
+    if int(adata["id"]) not in known_authors:
+        author = datas.UserProfile(**adata, socialNetworks=social_networks)
+        author.tooltip = generate_author_textblock(
+            author.firstName, author.lastName, author.aboutMe
+        )
 
     r["available_resolutions"] = []
     use_webp = True
-    if bpy.app.version < (3, 4, 0) or r.get("webpGeneratedTimestamp", 0) == 0:
-        use_webp = False  # WEBP was optimized in Blender 3.4.0
+    if not webp_supported or r.get("webpGeneratedTimestamp", 0) == 0:
+        use_webp = False
 
     # BIG THUMB - HDR CASE
     if r["assetType"] == "hdr":
@@ -232,28 +269,15 @@ def parse_result(r) -> dict:
     tname = paths.extract_filename_from_url(thumb_url)
     small_tname = paths.extract_filename_from_url(small_thumb_url)
     for f in r["files"]:
-        # if f['fileType'] == 'thumbnail':
-        #     tname = paths.extract_filename_from_url(f['fileThumbnailLarge'])
-        #     small_tname = paths.extract_filename_from_url(f['fileThumbnail'])
-        #     allthumbs.append(tname)  # TODO just first thumb is used now.
-
-        if f["fileType"] == "blend":
-            durl = f["downloadUrl"].split("?")[0]
-            # fname = paths.extract_filename_from_url(f['filePath'])
-
         if f["fileType"].find("resolution") > -1:
             r["available_resolutions"].append(resolutions.resolutions[f["fileType"]])
 
-    # code for more thumbnails
-    # tdict = {}
-    # for i, t in enumerate(allthumbs):
-    #     tdict['thumbnail_%i'] = t
+    paths.index_asset_files(r)
 
     r["max_resolution"] = 0
     if r["available_resolutions"]:  # should check only for non-empty sequences
         r["max_resolution"] = max(r["available_resolutions"])
 
-    # tooltip = generate_tooltip(r)
     # for some reason, the id was still int on some occurances. investigate this.
     r["author"]["id"] = str(r["author"]["id"])
 
@@ -262,7 +286,6 @@ def parse_result(r) -> dict:
     asset_data = {
         "thumbnail": tname,
         "thumbnail_small": small_tname,
-        # 'tooltip': tooltip,
     }
     asset_data["downloaded"] = 0
 
@@ -290,30 +313,93 @@ def parse_result(r) -> dict:
     if asset_type == "material":
         asset_data["texture_size_meters"] = params.get("textureSizeMeters", 1.0)
 
-    # asset_data.update(tdict)
+    # attempt to switch to use original data gradually, since the parsing as itself should become obsolete.
+    asset_data.update(r)
+    return asset_data, author
 
-    au = scene.get("assets used", {})  # type: ignore
-    if au == {}:
-        scene["assets used"] = au  # type: ignore
-    if r["assetBaseId"] in au.keys():
+
+def merge_parsed_result(
+    asset_data: dict, author: Optional[datas.UserProfile], assets_used
+) -> None:
+    """Main-thread part of parse_result(). Registers new author profile and marks assets already used in the scene."""
+    if author is not None:
+        generate_author_profile(author)
+
+    if asset_data["assetBaseId"] in assets_used.keys():
         asset_data["downloaded"] = 100
         # transcribe all urls already fetched from the server
-        r_previous = au[r["assetBaseId"]]
+        r_previous = assets_used[asset_data["assetBaseId"]]
         if r_previous.get("files"):
             for f in r_previous["files"]:
                 if f.get("url"):
-                    for f1 in r["files"]:
+                    for f1 in asset_data["files"]:
                         if f1["fileType"] == f["fileType"]:
                             f1["url"] = f["url"]
 
-    # attempt to switch to use original data gradually, since the parsing as itself should become obsolete.
-    asset_data.update(r)
-    return asset_data
+
+def parse_results(
+    results: list,
+    webp_supported: bool,
+    known_authors: set,
+    response: Optional[dict] = None,
+    cache_path: str = "",
+) -> list[tuple[dict, Optional[datas.UserProfile]]]:
+    """Run parse_result_data() on all results of a search page. Executed in parse_executor.
+    If cache_path is set, the raw response is written into the search cache before parsing modifies it.
+    """
+    if cache_path and response is not None:
+        search_cache.write_page(cache_path, response)
+
+    parsed = []
+    for result in results:
+        asset_data, author = parse_result_data(result, webp_supported, known_authors)
+        if not asset_data:
+            bk_logger.warning(
+                f"Parsed asset data are empty for search result {result.get('id')}"
+            )
+            continue
+        if author is not None:
+            known_authors.add(int(author.id))  # same author later on the page
+        parsed.append((asset_data, author))
+    return parsed
+
+
+def get_assets_used():
+    """Get 'assets used' ID property of the current scene, create it if missing."""
+    scene = bpy.context.scene
+    au = scene.get("assets used", {})  # type: ignore
+    if au == {}:
+        scene["assets used"] = au  # type: ignore
+    return au
+
+
+def get_parse_executor() -> ThreadPoolExecutor:
+    """Get single worker executor for parsing search results. Single worker keeps pages in order."""
+    global parse_executor
+    if parse_executor is None:
+        parse_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="bkit_search_parse"
+        )
+    return parse_executor
 
 
 def clear_searches():
     global search_tasks
     search_tasks.clear()
+    parsing_search_tasks.clear()
+
+
+def cancel_search_prefetch(history_id: str) -> None:
+    """Drop pending next page requests of the history step, they belong to the previous query."""
+    for task_id, search_data in list(search_tasks.items()):
+        if search_data.history_id == history_id and search_data.get_next:
+            search_tasks.pop(task_id)
+    parsing_search_tasks[:] = [
+        (task, orig_task, future)
+        for task, orig_task, future in parsing_search_tasks
+        if orig_task.history_id != history_id or not orig_task.get_next
+    ]
+    asset_bar_op.clear_thumbnails_warmup()
 
 
 def cleanup_search_results():
@@ -322,6 +408,8 @@ def cleanup_search_results():
     for history_step in get_history_steps().values():
         history_step.pop("search_results", None)
         history_step.pop("search_results_orig", None)
+        history_step.pop("search_pages", None)
+        history_step.pop("asset_index", None)
 
 
 def handle_search_task_error(task: client_tasks.Task) -> None:
@@ -351,9 +439,9 @@ def handle_search_task(task: client_tasks.Task) -> bool:
 
     # if original task was already removed (because user initiated another search), results are dropped- Returns True
     # because that's OK.
-    orig_task = search_tasks.get(task.task_id)
-
-    search_tasks.pop(task.task_id)
+    orig_task = search_tasks.pop(task.task_id, None)
+    if orig_task is None:
+        return True
 
     # this fixes black thumbnails in asset bar, test if this bug still persist in blender and remove if it's fixed
     if bpy.app.version < (3, 3, 0):
@@ -362,29 +450,103 @@ def handle_search_task(task: client_tasks.Task) -> bool:
 
     ###################
 
+    webp_supported = bpy.app.version >= (3, 4, 0)  # WEBP was optimized in Blender 3.4.0
+    known_authors = set(global_vars.BKIT_AUTHORS.keys())
+    cache_path = ""
+    preferences = bpy.context.preferences.addons[__package__].preferences
+    if (
+        preferences.search_cache  # type: ignore[union-attr]
+        and not task.data.get("from_cache")
+        and not orig_task.is_validator
+    ):
+        cache_path = search_cache.get_cache_path(orig_task.urlquery)
+    future = get_parse_executor().submit(
+        parse_results,
+        task.result["results"],
+        webp_supported,
+        known_authors,
+        task.result,
+        cache_path,
+    )
+    parsing_search_tasks.append((task, orig_task, future))
+    if not bpy.app.timers.is_registered(merge_parsed_search_results):
+        bpy.app.timers.register(merge_parsed_search_results)
+    return True
+
+
+def merge_parsed_search_results():
+    """Timer merging search pages parsed in parse_executor into their history steps, in order of arrival."""
+    # don't do anything while dragging, same as in handle_search_task()
+    if bpy.context.window_manager.blenderkitUI.dragging:  # type: ignore[attr-defined]
+        return 0.1
+
+    while len(parsing_search_tasks) > 0 and parsing_search_tasks[0][2].done():
+        task, orig_task, future = parsing_search_tasks.pop(0)
+        try:
+            parsed = future.result()
+        except Exception as e:
+            bk_logger.exception(f"Failed to parse search results: {e}")
+            history_step = get_history_step(orig_task.history_id)
+            if history_step is not None:
+                history_step["is_searching"] = False
+            continue
+        finish_search_task(task, orig_task, parsed)
+
+    if len(parsing_search_tasks) > 0:
+        return 0.02
+    return None
+
+
+def finish_search_task(
+    task: client_tasks.Task,
+    orig_task,
+    parsed: list[tuple[dict, Optional[datas.UserProfile]]],
+) -> None:
+    """Merge parsed search page into its history step and update the asset bar. Runs on the main thread."""
     asset_type = task.data["asset_type"]
     props = utils.get_search_props()
     search_name = f"bkit {asset_type} search"
 
     # Get current history step
     history_step = get_history_step(orig_task.history_id)
-
-    if not task.data.get("get_next"):
-        result_field = []  # type: ignore
-    else:
-        result_field = []
-        for r in history_step.get("search_results", []):  # type: ignore
-            result_field.append(r)
+    if history_step is None:
+        return
+    if orig_task.get_next and history_step.get("results_dropped"):
+        return  # next page of results dropped meanwhile, search is run again on switch to the step
 
     ui_props = bpy.context.window_manager.blenderkitUI  # type: ignore[attr-defined]
-    for result in task.result["results"]:
-        asset_data = parse_result(result)
-        if not asset_data:
-            bk_logger.warning("Parsed asset data are empty for search result", result)
-            continue
+    assets_used = get_assets_used()
+    for asset_data, author in parsed:
+        merge_parsed_result(asset_data, author, assets_used)
+
+    if orig_task.refill:
+        refill_search_page(history_step, orig_task.urlquery, parsed)
+        return
+    if orig_task.revalidate:
+        revalidate_search_page(history_step, orig_task.urlquery, parsed, task.result)
+        return
 
+    if not task.data.get("get_next"):
+        result_field = []  # type: ignore
+        history_step["search_pages"] = []
+    else:  # pages are appended in place, without copying of the previous results
+        result_field = history_step.get("search_results", [])  # type: ignore
+    page_start = len(result_field)
+
+    history_step.setdefault("search_pages", []).append(
+        {
+            "start": len(result_field),
+            "size": len(parsed),
+            "url": orig_task.urlquery,
+            "asset_type": orig_task.asset_type,
+            "evicted": False,
+            "refill_requested": 0.0,
+        }
+    )
+    is_validator = utils.profile_is_validator()
+    for asset_data, author in parsed:
         result_field.append(asset_data)
-        if not utils.profile_is_validator():
+        if not is_validator:
             continue
         # VALIDATORS
         # fetch all comments if user is validator to preview them faster
@@ -393,10 +555,17 @@ def handle_search_task(task: client_tasks.Task) -> bool:
         if comments is None:
             client_lib.get_comments(asset_data["assetBaseId"])
 
-    # Store results in history step
+    # Store results in history step, raw results are not needed anymore once parsed
     history_step["search_results"] = result_field
-    history_step["search_results_orig"] = task.result
+    index_search_results(history_step, page_start)
+    history_step["search_results_orig"] = {
+        k: v for k, v in task.result.items() if k != "results"
+    }
     history_step["is_searching"] = False
+    history_step.pop("results_dropped", None)
+    if history_step is get_active_history_step():
+        evict_far_search_pages(history_step, ui_props.scroll_offset)
+    enforce_history_budget()
 
     if len(result_field) < ui_props.scroll_offset or not (task.data.get("get_next")):
         # jump back
@@ -425,7 +594,151 @@ def handle_search_task(task: client_tasks.Task) -> bool:
     if not ui_props.assetbar_on and not task.data.get("get_next"):
         bpy.ops.view3d.run_assetbar_fix_context(keep_running=True, do_search=False)  # type: ignore[attr-defined]
 
-    return True
+
+def evict_far_search_pages(history_step: dict, scroll_offset: int) -> None:
+    """Strip heavy data from assets on pages further than SEARCH_PAGES_DISTANCE results from the scroll offset.
+    Stripped assets keep their position in search_results and data needed to identify them,
+    so indexes of the results stay valid. Evicted pages are fetched again by refill_near_search_pages().
+    Stripped assets are marked "evicted", UI must not use them (see is_search_result_evicted()),
+    asset bar shows placeholders for them and doesn't allow to hover, drag or open them.
+    """
+    search_results = history_step.get("search_results", [])
+    ui_props = bpy.context.window_manager.blenderkitUI  # type: ignore[attr-defined]
+    for page in history_step.get("search_pages", []):
+        if page["evicted"]:
+            continue
+        if not is_search_page_far(page, scroll_offset):
+            continue
+        if (
+            history_step is get_active_history_step()
+            and page["start"] <= ui_props.active_index < page["start"] + page["size"]
+        ):
+            ui_props.active_index = -1
+        for i in range(
+            page["start"], min(page["start"] + page["size"], len(search_results))
+        ):
+            asset_data = search_results[i]
+            search_results[i] = {
+                k: v for k, v in asset_data.items() if k not in EVICTED_ASSET_KEYS
+            }
+            search_results[i]["evicted"] = True
+        page["evicted"] = True
+
+
+def is_search_result_evicted(index: int, search_results: Optional[list] = None) -> bool:
+    """Check if the search result was stripped by evict_far_search_pages() and is not refilled yet."""
+    if search_results is None:
+        search_results = get_search_results()
+    if search_results is None or not 0 <= index < len(search_results):
+        return False
+    asset_data = search_results[index]
+    return asset_data is not None and asset_data.get("evicted", False)
+
+
+def refill_near_search_pages(history_step: dict, scroll_offset: int) -> None:
+    """Fetch again evicted pages which got close to the scroll offset."""
+    now = time.time()
+    for page in history_step.get("search_pages", []):
+        if not page["evicted"] or is_search_page_far(page, scroll_offset):
+            continue
+        if now - page["refill_requested"] < 10:  # refill already running
+            continue
+        page["refill_requested"] = now
+        add_search_process(
+            {"asset_type": page["asset_type"]},
+            get_next=True,
+            page_size=page["size"],
+            next_url=page["url"],
+            history_id=history_step["id"],
+            refill=True,
+        )
+
+
+def update_search_pages(history_step: dict, scroll_offset: int) -> None:
+    """Evict pages far from the scroll offset and refill evicted pages close to it."""
+    evict_far_search_pages(history_step, scroll_offset)
+    refill_near_search_pages(history_step, scroll_offset)
+
+
+def is_search_page_far(page: dict, scroll_offset: int) -> bool:
+    if page["start"] + page["size"] < scroll_offset - SEARCH_PAGES_DISTANCE:
+        return True
+    return page["start"] > scroll_offset + SEARCH_PAGES_DISTANCE
+
+
+def refill_search_page(history_step: dict, url: str, parsed: list) -> None:
+    """Put assets of fetched evicted page back into their positions in search_results.
+    If the page changed its size since it was evicted, it is replaced by the fetched assets
+    and following pages are shifted, so no stripped assets stay in the results.
+    """
+    search_results = history_step.get("search_results", [])
+    pages = history_step.get("search_pages", [])
+    for i, page in enumerate(pages):
+        if page["url"] != url or not page["evicted"]:
+            continue
+        start = page["start"]
+        size_change = len(parsed) - page["size"]
+        if size_change != 0:
+            bk_logger.info(
+                "Search results changed since the page was evicted, replacing the page"
+            )
+        search_results[start : start + page["size"]] = [
+            asset_data for asset_data, _ in parsed
+        ]
+        page["size"] = len(parsed)
+        page["evicted"] = False
+        page["refill_requested"] = 0.0
+        for next_page in pages[i + 1 :]:
+            next_page["start"] += size_change
+        index_search_results(history_step)  # page may contain other assets now
+        break
+    else:
+        return
+
+    # buttons show placeholders for evicted assets, show the refilled ones
+    if (
+        asset_bar_op.asset_bar_operator is not None
+        and history_step is get_active_history_step()
+    ):
+        asset_bar_op.asset_bar_operator.scroll_update(always=True)
+
+
+def revalidate_search_page(
+    history_step: dict, url: str, parsed: list, response: dict
+) -> None:
+    """Replace page shown from the search cache with the current page returned by the Client."""
+    search_results = history_step.get("search_results", [])
+    pages = history_step.get("search_pages", [])
+    for i, page in enumerate(pages):
+        if page["url"] != url:
+            continue
+        if page["evicted"]:  # is fetched again when scrolled close
+            return
+        if len(parsed) == page["size"]:
+            for j, (asset_data, _) in enumerate(parsed):
+                search_results[page["start"] + j] = asset_data
+        elif len(pages) == 1:
+            search_results[:] = [asset_data for asset_data, _ in parsed]
+            page["size"] = len(parsed)
+        else:
+            bk_logger.info(
+                "Cached search page changed its size, keeping it until next search"
+            )
+            return
+        if i == len(pages) - 1:
+            history_step["search_results_orig"] = {
+                k: v for k, v in response.items() if k != "results"
+            }
+        index_search_results(history_step)
+        break
+    else:
+        return
+
+    if (
+        asset_bar_op.asset_bar_operator is not None
+        and history_step is get_active_history_step()
+    ):
+        asset_bar_op.asset_bar_operator.scroll_update(always=True)
 
 
 def handle_thumbnail_download_task(task: client_tasks.Task) -> None:
@@ -475,6 +788,7 @@ def load_preview(asset):
             img = bpy.data.images.load(tpath, check_existing=True)
             img.name = iname
             if len(img.pixels) > 0:
+                ui_bgl.image_pool.reserve(img)
                 return True
         except Exception as e:
             print(f"search.py: could not load image {iname}: {e}")
@@ -493,17 +807,21 @@ def load_preview(asset):
         except Exception as e:
             print(f"search.py: could not reload image {iname}: {e}")
             return False
+        ui_bgl.image_pool.invalidate(img)
 
     image_utils.set_colorspace(img)
+    ui_bgl.image_pool.reserve(img)
     asset["thumb_small_loaded"] = True
     return True
 
 
 def load_previews():
+    """Load previews of results around the asset bar scroll position, as many as fit into the image pool."""
     results = get_search_results()
     if results is None:
         return
-    for _, result in enumerate(results):
+    start = bpy.context.window_manager.blenderkitUI.scroll_offset  # type: ignore[attr-defined]
+    for result in results[start : start + ui_bgl.image_pool.size]:
         load_preview(result)
 
 
@@ -633,10 +951,11 @@ def generate_author_profile(author_data: datas.UserProfile):
     if resp.status_code != 200:
         bk_logger.warning(resp.text)
 
-    # TODO: tooltip generation could be part of the __init__, right?
-    author_data.tooltip = generate_author_textblock(
-        author_data.firstName, author_data.lastName, author_data.aboutMe
-    )
+    # tooltip of authors from search results is already generated in parse_result_data()
+    if not author_data.tooltip:
+        author_data.tooltip = generate_author_textblock(
+            author_data.firstName, author_data.lastName, author_data.aboutMe
+        )
     global_vars.BKIT_AUTHORS[author_id] = author_data
     return
 
@@ -920,7 +1239,12 @@ def build_query_nodegroup(
 
 
 def add_search_process(
-    query, get_next: bool, page_size: int, next_url: str, history_id: str
+    query,
+    get_next: bool,
+    page_size: int,
+    next_url: str,
+    history_id: str,
+    refill: bool = False,
 ):
     global search_tasks
     addon_version = utils.get_addon_version()
@@ -946,11 +1270,46 @@ def add_search_process(
         blender_version=blender_version,
         is_validator=utils.profile_is_validator(),
         history_id=history_id,
+        refill=refill,
     )
+    preferences = bpy.context.preferences.addons[__package__].preferences
+    # validators search with their own query, which the cache would serve to them stale
+    if preferences.search_cache and not search_data.is_validator:  # type: ignore[union-attr]
+        cached, age = search_cache.read_page(search_cache.get_cache_path(urlquery))
+        if cached is not None and handle_cached_search(search_data, cached):
+            if age < search_cache.CACHE_TTL and not search_cache.thumbnails_missing(
+                cached, tempdir
+            ):
+                return
+            # stale page is shown, ask the Client for the current one
+            search_data = dataclasses.replace(search_data, revalidate=True)
+
     response = client_lib.asset_search(search_data)
     search_tasks[response["task_id"]] = search_data
 
 
+def handle_cached_search(search_data: datas.SearchData, cached: dict) -> bool:
+    """Handle cached search page as if it was a finished search task from the Client.
+    Returns False if the page could not be handled now (e.g. during drag), the Client is asked for it then.
+    """
+    task = client_tasks.Task(
+        data={
+            "asset_type": search_data.asset_type,
+            "get_next": search_data.get_next,
+            "from_cache": True,
+        },
+        app_id=str(os.getpid()),
+        task_type="search",
+        status="finished",
+        result=cached,
+    )
+    search_tasks[task.task_id] = search_data
+    if handle_search_task(task):
+        return True
+    search_tasks.pop(task.task_id, None)
+    return False
+
+
 def get_search_simple(
     parameters, filepath=None, page_size=100, max_results=100000000, api_key=""
 ):
@@ -1003,6 +1362,276 @@ def get_search_simple(
     return results
 
 
+def get_search_bulk(
+    query: dict,
+    filepath: str,
+    page_size=100,
+    max_results=100000000,
+    api_key="",
+    workers=BULK_SEARCH_WORKERS,
+):
+    """Searches and streams the search results into a file, fetching pages concurrently.
+    Meant for exports of large queries, results are not kept in memory.
+    Runs in a background thread, so it only uses its own sessions to the Client.
+
+    Parameters
+    ----------
+    query - search query dict, as built by build_query()
+    filepath - a file to save the results as JSON Lines, one asset per line, in no particular order
+    page_size - page size for retrieved results
+    max_results - max results of the search
+    api_key - BlenderKit api key
+    workers - number of pages fetched at the same time
+
+    Progress is stored in filepath + ".checkpoint" after every written page.
+    When the export is interrupted, calling this again with the same query resumes it.
+
+    Returns
+    -------
+    Returns number of results in the file
+    """
+    headers = utils.get_headers(api_key)
+    requeststring = query_to_url(
+        copy.deepcopy(query),
+        utils.get_addon_version(),
+        utils.get_blender_version(),
+        page_size=page_size,
+    )
+    checkpoint_path = filepath + ".checkpoint"
+    checkpoint = read_bulk_checkpoint(checkpoint_path, requeststring)
+
+    local = threading.local()
+    sessions: list[requests.Session] = []
+    sessions_lock = threading.Lock()
+
+    def get_session() -> requests.Session:
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+            with sessions_lock:
+                sessions.append(local.session)
+        return local.session
+
+    def fetch_page(page_index: int) -> dict:
+        url = requeststring
+        if page_index > 1:
+            url += f"&page={page_index}"
+        for attempt in range(BULK_SEARCH_RETRIES):
+            try:
+                response = client_lib.blocking_request(
+                    url, "GET", headers, session=get_session()
+                )
+                response.raise_for_status()
+                search_results = response.json()
+                if "results" not in search_results:
+                    raise KeyError(f"no results in response: {search_results}")
+                return search_results
+            except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+                bk_logger.warning(
+                    f"failed to get page {page_index}, attempt {attempt + 1}: {e}"
+                )
+        raise RuntimeError(f"could not get page {page_index} of {requeststring}")
+
+    try:
+        search_results = fetch_page(1)
+        total = min(search_results["count"], max_results)
+        page_count = math.ceil(total / page_size)
+        done_pages = set(checkpoint["pages"])
+        if done_pages:
+            bk_logger.info(
+                f"resuming export, {len(done_pages)}/{page_count} pages done"
+            )
+
+        with open(filepath, "a+", encoding="utf-8") as s:
+            s.truncate(checkpoint["offset"])  # drop page written after last checkpoint
+            s.seek(checkpoint["offset"])
+
+            def write_page(page_index: int, results: list):
+                limit = total - (page_index - 1) * page_size
+                for asset in results[:limit]:
+                    s.write(json.dumps(asset, ensure_ascii=False) + "\n")
+                s.flush()
+                checkpoint["offset"] = s.tell()
+                checkpoint["count"] += min(len(results), limit)
+                checkpoint["pages"].append(page_index)
+                write_bulk_checkpoint(checkpoint_path, checkpoint)
+                bk_logger.info(
+                    f"got page {page_index}, {len(checkpoint['pages'])}/{page_count} pages, {checkpoint['count']}/{total} assets"
+                )
+
+            if page_count > 0 and 1 not in done_pages:
+                write_page(1, search_results["results"])
+
+            pending = [i for i in range(2, page_count + 1) if i not in done_pages]
+            with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+                futures = {executor.submit(fetch_page, i): i for i in pending}
+                try:
+                    for future in as_completed(futures):
+                        write_page(futures[future], future.result()["results"])
+                except Exception:
+                    for future in futures:
+                        future.cancel()
+                    raise
+    finally:
+        for session in sessions:
+            session.close()
+
+    if os.path.isfile(checkpoint_path):
+        os.remove(checkpoint_path)
+    bk_logger.info(f"retrieved {checkpoint['count']} assets from elastic search")
+    return checkpoint["count"]
+
+
+def export_search_results(query: dict, filepath: str, max_results: int, api_key: str):
+    """Run get_search_bulk() in a background thread and report the outcome in the UI."""
+    try:
+        count = get_search_bulk(
+            query, filepath, max_results=max_results, api_key=api_key
+        )
+    except Exception as e:
+        bk_logger.exception("search export failed")
+        tasks_queue.add_task(
+            (
+                reports.add_report,
+                (f"Search export failed, run it again to resume: {e}", 10, "ERROR"),
+            )
+        )
+        return
+    tasks_queue.add_task(
+        (reports.add_report, (f"Exported {count} assets to {filepath}", 5, "INFO"))
+    )
+
+
+def read_bulk_checkpoint(checkpoint_path: str, url: str) -> dict:
+    """Read progress of get_search_bulk(). Checkpoint of a different search is ignored."""
+    empty = {"url": url, "offset": 0, "count": 0, "pages": []}
+    if not os.path.isfile(checkpoint_path):
+        return empty
+    try:
+        with open(checkpoint_path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError) as e:
+        bk_logger.warning(f"could not read search export checkpoint: {e}")
+        return empty
+    if checkpoint.get("url") != url:
+        return empty
+    return checkpoint
+
+
+def write_bulk_checkpoint(checkpoint_path: str, checkpoint: dict) -> None:
+    """Atomically write progress of get_search_bulk()."""
+    tmp_path = checkpoint_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def build_query(author_id="") -> Optional[dict]:
+    """Build search query from the search inputs of the active asset type.
+    Returns None when the search properties are not registered.
+    """
+    user_preferences = bpy.context.preferences.addons[__package__].preferences
+    wm = bpy.context.window_manager
+    ui_props = bpy.context.window_manager.blenderkitUI
+    props = utils.get_search_props()
+    query = None
+    if ui_props.asset_type == "MODEL":
+        if not hasattr(wm, "blenderkit_models"):
+            return None
+        query = build_query_model(
+            bpy.context.window_manager.blenderkit_models,
+            ui_props=bpy.context.window_manager.blenderkitUI,
+            preferences=bpy.context.preferences.addons[__package__].preferences,
+        )
+
+    if ui_props.asset_type == "PRINTABLE":
+        if not hasattr(wm, "blenderkit_models"):
+            return None
+        query = build_query_model(
+            bpy.context.window_manager.blenderkit_models,
+            ui_props=bpy.context.window_manager.blenderkitUI,
+            preferences=bpy.context.preferences.addons[__package__].preferences,
+        )
+        query["asset_type"] = "printable"  # Override the asset type for PRINTABLE
+
+    if ui_props.asset_type == "SCENE":
+        if not hasattr(wm, "blenderkit_scene"):
+            return None
+        query = build_query_scene(
+            bpy.context.window_manager.blenderkit_scene,
+            bpy.context.window_manager.blenderkitUI,
+        )
+
+    if ui_props.asset_type == "HDR":
+        if not hasattr(wm, "blenderkit_HDR"):
+            return None
+        query = build_query_HDR(
+            bpy.context.window_manager.blenderkit_HDR,
+            bpy.context.window_manager.blenderkitUI,
+        )
+
+    if ui_props.asset_type == "MATERIAL":
+        if not hasattr(wm, "blenderkit_mat"):
+            return None
+        query = build_query_material(
+            bpy.context.window_manager.blenderkit_mat,
+            bpy.context.window_manager.blenderkitUI,
+        )
+
+    if ui_props.asset_type == "TEXTURE":
+        if not hasattr(wm, "blenderkit_tex"):
+            return None
+        # props = scene.blenderkit_tex
+        # query = build_query_texture()
+
+    if ui_props.asset_type == "BRUSH":
+        if not hasattr(wm, "blenderkit_brush"):
+            return None
+        query = build_query_brush(
+            bpy.context.window_manager.blenderkit_brush,
+            bpy.context.window_manager.blenderkitUI,
+            bpy.context.image_paint_object,
+        )
+
+    if ui_props.asset_type == "NODEGROUP":
+        if not hasattr(wm, "blenderkit_nodegroup"):
+            return None
+        query = build_query_nodegroup(
+            props=bpy.context.window_manager.blenderkit_nodegroup,
+            ui_props=bpy.context.window_manager.blenderkitUI,
+        )
+
+    if query is None:
+        return None
+
+    # crop long searches
+    if query.get("query"):
+        if len(query["query"]) > 50:
+            query["query"] = strip_accents(query["query"])
+
+        if len(query["query"]) > 150:
+            idx = query["query"].find(" ", 142)
+            query["query"] = query["query"][:idx]
+
+    if props.search_category != "":
+        if utils.profile_is_validator() and user_preferences.categories_fix:
+            query["category"] = props.search_category
+        else:
+            query["category_subtree"] = props.search_category
+
+    if author_id != "":
+        query["author_id"] = author_id
+
+    elif ui_props.own_only:
+        # if user searches for [another] author, 'only my assets' is invalid. that's why in elif.
+        profile = global_vars.BKIT_PROFILE
+        if profile is not None:
+            query["author_id"] = str(profile.id)
+
+    # free first has to by in query to be evaluated as changed as another search, otherwise the filter is not updated.
+    query["free_first"] = ui_props.free_only
+    return query
+
+
 def search(get_next=False, query=None, author_id=""):
     """Initialize searching
     query : submit an already built query from search history
@@ -1014,7 +1643,6 @@ def search(get_next=False, query=None, author_id=""):
         return
 
     user_preferences = bpy.context.preferences.addons[__package__].preferences
-    wm = bpy.context.window_manager
     ui_props = bpy.context.window_manager.blenderkitUI
 
     # if search is locked, don't trigger search update
@@ -1030,99 +1658,12 @@ def search(get_next=False, query=None, author_id=""):
         return
 
     if not query:
-        if ui_props.asset_type == "MODEL":
-            if not hasattr(wm, "blenderkit_models"):
-                return
-            query = build_query_model(
-                bpy.context.window_manager.blenderkit_models,
-                ui_props=bpy.context.window_manager.blenderkitUI,
-                preferences=bpy.context.preferences.addons[__package__].preferences,
-            )
-
-        if ui_props.asset_type == "PRINTABLE":
-            if not hasattr(wm, "blenderkit_models"):
-                return
-            query = build_query_model(
-                bpy.context.window_manager.blenderkit_models,
-                ui_props=bpy.context.window_manager.blenderkitUI,
-                preferences=bpy.context.preferences.addons[__package__].preferences,
-            )
-            query["asset_type"] = "printable"  # Override the asset type for PRINTABLE
-
-        if ui_props.asset_type == "SCENE":
-            if not hasattr(wm, "blenderkit_scene"):
-                return
-            query = build_query_scene(
-                bpy.context.window_manager.blenderkit_scene,
-                bpy.context.window_manager.blenderkitUI,
-            )
-
-        if ui_props.asset_type == "HDR":
-            if not hasattr(wm, "blenderkit_HDR"):
-                return
-            query = build_query_HDR(
-                bpy.context.window_manager.blenderkit_HDR,
-                bpy.context.window_manager.blenderkitUI,
-            )
-
-        if ui_props.asset_type == "MATERIAL":
-            if not hasattr(wm, "blenderkit_mat"):
-                return
-            query = build_query_material(
-                bpy.context.window_manager.blenderkit_mat,
-                bpy.context.window_manager.blenderkitUI,
-            )
-
-        if ui_props.asset_type == "TEXTURE":
-            if not hasattr(wm, "blenderkit_tex"):
-                return
-            # props = scene.blenderkit_tex
-            # query = build_query_texture()
-
-        if ui_props.asset_type == "BRUSH":
-            if not hasattr(wm, "blenderkit_brush"):
-                return
-            query = build_query_brush(
-                bpy.context.window_manager.blenderkit_brush,
-                bpy.context.window_manager.blenderkitUI,
-                bpy.context.image_paint_object,
-            )
-
-        if ui_props.asset_type == "NODEGROUP":
-            if not hasattr(wm, "blenderkit_nodegroup"):
-                return
-            query = build_query_nodegroup(
-                props=bpy.context.window_manager.blenderkit_nodegroup,
-                ui_props=bpy.context.window_manager.blenderkitUI,
-            )
-
-        # crop long searches
-        if query.get("query"):
-            if len(query["query"]) > 50:
-                query["query"] = strip_accents(query["query"])
-
-            if len(query["query"]) > 150:
-                idx = query["query"].find(" ", 142)
-                query["query"] = query["query"][:idx]
-
-        if props.search_category != "":
-            if utils.profile_is_validator() and user_preferences.categories_fix:
-                query["category"] = props.search_category
-            else:
-                query["category_subtree"] = props.search_category
-
-        if author_id != "":
-            query["author_id"] = author_id
-
-        elif ui_props.own_only:
-            # if user searches for [another] author, 'only my assets' is invalid. that's why in elif.
-            profile = global_vars.BKIT_PROFILE
-            if profile is not None:
-                query["author_id"] = str(profile.id)
-
-        # free first has to by in query to be evaluated as changed as another search, otherwise the filter is not updated.
-        query["free_first"] = ui_props.free_only
+        query = build_query(author_id)
+        if query is None:
+            return
 
+    if not get_next:
+        cancel_search_prefetch(active_history_step["id"])
     active_history_step["is_searching"] = True
 
     page_size = min(40, ui_props.wcount * user_preferences.max_assetbar_rows + 5)
@@ -1515,6 +2056,53 @@ class TooltipLabelOperator(Operator):
         return {"FINISHED"}
 
 
+class ExportSearchResultsOperator(Operator, ExportHelper):
+    """Export all results of the current search into a JSON Lines file.
+    Interrupted export is resumed when exported again into the same file"""
+
+    bl_idname = "wm.blenderkit_export_search_results"
+    bl_label = "Export BlenderKit Search Results"
+    bl_options = {"REGISTER"}
+
+    filename_ext = ".jsonl"
+    filter_glob: StringProperty(  # type: ignore[valid-type]
+        default="*.jsonl", options={"HIDDEN"}
+    )
+
+    max_results: IntProperty(  # type: ignore[valid-type]
+        name="Max Results",
+        description="Maximum number of exported assets",
+        default=10000,
+        min=1,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return global_vars.CLIENT_ACCESSIBLE == True
+
+    def execute(self, context):
+        query = build_query()
+        if query is None:
+            self.report({"ERROR"}, "No search properties for this asset type")
+            return {"CANCELLED"}
+        preferences = bpy.context.preferences.addons[__package__].preferences
+        thread = threading.Thread(
+            target=export_search_results,
+            args=(query, self.filepath, self.max_results, preferences.api_key),
+            daemon=True,
+        )
+        thread.start()
+        reports.add_report("Exporting search results...")
+        return {"FINISHED"}
+
+
+def menu_export_search_results(self, context):
+    self.layout.operator(
+        ExportSearchResultsOperator.bl_idname,
+        text="BlenderKit Search Results (.jsonl)",
+    )
+
+
 def get_search_similar_keywords(asset_data: dict) -> str:
     """Generate search similar keywords from the given asset_data.
     Could be tuned in the future to provide better search results.
@@ -1526,7 +2114,12 @@ def get_search_similar_keywords(asset_data: dict) -> str:
     return keywords
 
 
-classes = [SearchOperator, UrlOperator, TooltipLabelOperator]
+classes = [
+    SearchOperator,
+    UrlOperator,
+    TooltipLabelOperator,
+    ExportSearchResultsOperator,
+]
 
 
 def register_search():
@@ -1537,11 +2130,20 @@ def register_search():
 
     for c in classes:
         bpy.utils.register_class(c)
+    bpy.types.TOPBAR_MT_file_export.append(menu_export_search_results)
 
 
 def unregister_search():
+    global parse_executor
     bpy.app.handlers.load_post.remove(scene_load)
-
+    if bpy.app.timers.is_registered(merge_parsed_search_results):
+        bpy.app.timers.unregister(merge_parsed_search_results)
+    parsing_search_tasks.clear()
+    if parse_executor is not None:
+        parse_executor.shutdown(wait=False)
+        parse_executor = None
+
+    bpy.types.TOPBAR_MT_file_export.remove(menu_export_search_results)
     for c in classes:
         bpy.utils.unregister_class(c)
 
@@ -1551,7 +2153,10 @@ def unregister_search():
 # - id: uuid
 # - ui_state: dict
 # - search_results: list
-# - search_results_orig: list
+# - search_results_orig: dict - last search response without the raw results (count, next, previous)
+# - last_viewed: float - time of the last switch to the step, least recently viewed steps drop results first
+# - results_dropped: bool - results were dropped to fit the memory budget, search is run again on switch
+# - search_pages: list - start, size and url of each page in search_results, pages far from scroll are evicted
 # - scroll_offset: int - this is separate since it doesn't influence when a new history step can be created
 
 # ui_state contains search_keywords, asset_type, all search filters, common ones and also those from advanced search panels for all asset types.
@@ -1717,6 +2322,7 @@ def create_history_step(active_tab):
         "id": str(uuid.uuid4()),
         "ui_state": ui_state,
         "scroll_offset": ui_props.scroll_offset,
+        "last_viewed": time.time(),
     }
 
     # Delete any future history steps
@@ -1771,6 +2377,88 @@ def get_active_history_step():
     return history_step
 
 
+def touch_history_step(history_step: dict) -> None:
+    """Mark the history step as viewed now, so it is evicted last by enforce_history_budget()."""
+    history_step["last_viewed"] = time.time()
+
+
+def enforce_history_budget() -> None:
+    """Drop search results of least recently viewed history steps over the history_results_budget preference.
+    Dropped history steps keep their ui_state, so results are searched again when the user navigates back.
+    Active history step is never dropped.
+    """
+    budget = bpy.context.preferences.addons[__package__].preferences.history_results_budget  # type: ignore
+    if budget == 0:
+        return
+
+    active_step = get_active_history_step()
+    steps = [
+        step
+        for step in get_history_steps().values()
+        if step is not active_step and step.get("search_results")
+    ]
+    total = len(active_step.get("search_results", []))
+    total += sum(len(step["search_results"]) for step in steps)
+    steps.sort(key=lambda step: step.get("last_viewed", 0))
+    for step in steps:
+        if total <= budget:
+            break
+        total -= len(step["search_results"])
+        drop_history_step_results(step)
+
+
+def drop_history_step_results(history_step: dict) -> None:
+    """Drop search results of the history step, keep its query in ui_state."""
+    history_step.pop("search_results", None)
+    history_step.pop("search_results_orig", None)
+    history_step.pop("search_pages", None)
+    history_step.pop("asset_index", None)
+    history_step["results_dropped"] = True
+    bk_logger.debug(f"Dropped search results of history step {history_step['id']}")
+
+
+def index_search_results(history_step: dict, start: int = 0) -> None:
+    """Index positions of search results by asset id and assetBaseId, from start to the end of results.
+    Starting from 0, or at a history step without index, rebuilds the whole index.
+    """
+    if start == 0 or "asset_index" not in history_step:
+        start = 0
+        history_step["asset_index"] = {}
+    index = history_step["asset_index"]
+    search_results = history_step.get("search_results", [])
+    for i in range(start, len(search_results)):
+        asset_data = search_results[i]
+        if asset_data is None:
+            continue
+        index.setdefault(asset_data["id"], []).append(i)
+        index.setdefault(asset_data["assetBaseId"], []).append(i)
+
+
+def get_search_result_positions(
+    asset_id: str, history_step: Optional[dict] = None
+) -> list[int]:
+    """Get positions of the asset in search results by its id or assetBaseId. Active history step is used by default."""
+    if history_step is None:
+        history_step = get_active_history_step()
+    if not history_step.get("search_results"):
+        return []
+    if "asset_index" not in history_step:
+        index_search_results(history_step)
+    return history_step["asset_index"].get(asset_id, [])
+
+
+def find_search_results(
+    asset_id: str, history_step: Optional[dict] = None
+) -> list[dict]:
+    """Get search results of the asset by its id or assetBaseId. Active history step is used by default."""
+    if history_step is None:
+        history_step = get_active_history_step()
+    search_results = history_step.get("search_results", [])
+    return [
+        search_results[i] for i in get_search_result_positions(asset_id, history_step)
+    ]
+
+
 def get_search_results() -> list[dict]:
     """Get search results from the active history step."""
     history_step = get_active_history_step()
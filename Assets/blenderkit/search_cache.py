@@ -0,0 +1,135 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+"""On-disk cache of search result pages, keyed by normalized search URL and user.
+Fresh pages are shown without asking the BlenderKit-Client, stale pages are shown
+immediately and replaced once the Client returns the current page (stale-while-revalidate).
+Reading and writing of pages does not touch bpy, so writes can be done in the search parse worker.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+import urllib.parse
+from typing import Optional
+
+from . import global_vars, paths
+
+
+bk_logger = logging.getLogger(__name__)
+
+CACHE_TTL = 15 * 60
+"""Age in seconds until which the cached page is used without asking the Client."""
+CACHE_MAX_AGE = 24 * 60 * 60
+"""Age in seconds until which the cached page is shown while the Client is asked for the current one."""
+CACHE_MAX_SIZE = 100 * 1024 * 1024
+"""Size of the cache directory in bytes, oldest pages are removed when exceeded."""
+VOLATILE_PARAMETERS = ("scene_uuid",)
+"""URL parameters which do not change the search results."""
+
+
+def normalize_url(urlquery: str) -> str:
+    """Drop volatile parameters and sort the rest, so the same search gives the same key."""
+    parsed = urllib.parse.urlsplit(urlquery)
+    params = urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+    params = sorted(p for p in params if p[0] not in VOLATILE_PARAMETERS)
+    query = urllib.parse.urlencode(params)
+    return urllib.parse.urlunsplit(
+        (parsed.scheme, parsed.netloc, parsed.path, query, "")
+    )
+
+
+def get_cache_dir() -> str:
+    return paths.get_temp_dir("search_cache")
+
+
+def get_cache_path(urlquery: str) -> str:
+    """Get path of the cached page. Results differ for each user (private assets, plans), so user is part of the key."""
+    key = f"{global_vars.BKIT_PROFILE.id}|{normalize_url(urlquery)}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    return os.path.join(get_cache_dir(), f"{digest}.json")
+
+
+def read_page(cache_path: str) -> tuple[Optional[dict], float]:
+    """Read cached search response. Returns the response and its age in seconds, or None if not cached or too old."""
+    try:
+        age = time.time() - os.path.getmtime(cache_path)
+        if age > CACHE_MAX_AGE:
+            return None, age
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f), age
+    except (OSError, ValueError) as e:
+        if not isinstance(e, FileNotFoundError):
+            bk_logger.warning(f"Failed to read cached search page {cache_path}: {e}")
+        return None, 0.0
+
+
+def write_page(cache_path: str, response: dict) -> None:
+    """Write search response into the cache. Write is atomic, so readers never see half-written page."""
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(response, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        bk_logger.warning(f"Failed to write search page to cache {cache_path}: {e}")
+        return
+    prune(os.path.dirname(cache_path))
+
+
+def prune(cache_dir: str, max_size: int = CACHE_MAX_SIZE) -> None:
+    """Remove oldest cached pages until the cache directory fits into max_size."""
+    entries = []
+    total = 0
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(".json"):
+                continue
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+    if total <= max_size:
+        return
+
+    entries.sort()
+    for _, size, path in entries:
+        if total <= max_size:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError as e:
+            bk_logger.warning(f"Failed to remove cached search page {path}: {e}")
+
+
+def thumbnails_missing(response: dict, tempdir: str) -> bool:
+    """Check if small thumbnails of cached results are missing in tempdir.
+    Thumbnails are downloaded by the Client as part of the search, so such page has to be revalidated.
+    """
+    for result in response.get("results", []):
+        names = (
+            paths.extract_filename_from_url(result.get("thumbnailSmallUrlWebp")),
+            paths.extract_filename_from_url(result.get("thumbnailSmallUrl")),
+        )
+        if not any(
+            name and os.path.exists(os.path.join(tempdir, name)) for name in names
+        ):
+            return True
+    return False
@@ -16,9 +16,12 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+import heapq
+import itertools
 import logging
-import queue
-from typing import Tuple
+import threading
+import time
+from typing import Optional, Tuple
 
 import bpy
 from bpy.app.handlers import persistent
@@ -27,6 +30,10 @@ from . import utils
 
 
 bk_logger = logging.getLogger(__name__)
+IDLE_INTERVAL = 0.3
+"""Sleep of queue_worker when there is no task, same as the former polling rate.
+Tasks added from background threads or before the first worker run wait at most this long,
+tasks added from the main thread wake the worker up sooner."""
 
 
 @persistent
@@ -37,12 +44,73 @@ def scene_load(context):
         bpy.app.timers.register(queue_worker)
 
 
-def get_queue():
+class TaskScheduler:
+    """Min-heap of tasks ordered by absolute due time.
+    Tasks with only_last are indexed by their stash key, newer task with the same key cancels the older one.
+    Cancelled tasks stay in the heap and are skipped when popped.
+    """
+
+    def __init__(self):
+        self.heap: list = []
+        self.stashed: dict[str, "task_object"] = {}
+        # tie breaker, keeps FIFO order for same due time
+        self.counter = itertools.count()
+        self.lock = threading.Lock()
+        self.next_wakeup = 0.0
+        """Monotonic time when queue_worker is scheduled to run next."""
+        self.running = False
+        """True while queue_worker executes tasks."""
+
+    def put(self, task: "task_object"):
+        with self.lock:
+            if task.only_last:
+                key = get_stash_key(task)
+                previous = self.stashed.get(key)
+                if previous is not None:
+                    previous.cancelled = True
+                self.stashed[key] = task
+            heapq.heappush(self.heap, (task.due, next(self.counter), task))
+
+    def pop_due(self, now: float) -> list:
+        """Remove and return all tasks which are due at now, in order of their due time."""
+        due = []
+        with self.lock:
+            while self.heap and self.heap[0][0] <= now:
+                _, _, task = heapq.heappop(self.heap)
+                if task.cancelled:
+                    continue
+                if task.only_last:
+                    self.stashed.pop(get_stash_key(task), None)
+                due.append(task)
+        return due
+
+    def next_due(self) -> Optional[float]:
+        """Due time of the earliest not cancelled task, None if there is no task."""
+        with self.lock:
+            while self.heap and self.heap[0][2].cancelled:
+                heapq.heappop(self.heap)
+            if not self.heap:
+                return None
+            return self.heap[0][0]
+
+    def empty(self) -> bool:
+        return self.next_due() is None
+
+
+def get_queue() -> TaskScheduler:
     # we pick just a random one of blender types, to try to get a persistent queue
     t = bpy.types.Scene
-    if not hasattr(t, "task_queue"):
-        t.task_queue = queue.Queue()
-    return t.task_queue
+    if not hasattr(t, "task_scheduler"):
+        t.task_scheduler = TaskScheduler()
+    return t.task_scheduler
+
+
+def get_stash_key(task: "task_object") -> str:
+    # this now makes the keys not only by task, but also two arguments.
+    # by now stashing is only used for ratings, where the first argument is url, second rating type.
+    # This enables fast rating of multiple assets while allowing larger delay for uploading of ratings.
+    # this avoids a duplicate request error on the server
+    return f"{task.command}-{task.arguments[0]}-{task.arguments[1]}"
 
 
 class task_object:
@@ -58,9 +126,11 @@ class task_object:
         self.command = command
         self.arguments = arguments
         self.wait = wait
+        self.due = time.monotonic() + wait
         self.only_last = only_last
         self.fake_context = fake_context
         self.fake_context_area = fake_context_area
+        self.cancelled = False
 
 
 def add_task(
@@ -80,77 +150,62 @@ def add_task(
         fake_context_area=fake_context_area,
     )
     q.put(taskob)
+    wake_worker(q, taskob.due)
+
+
+def wake_worker(q: TaskScheduler, due: float):
+    """Reschedule queue_worker if the task is due before the worker's next run.
+    Timers can be registered only from the main thread. When the worker is running, it reschedules itself on return.
+    """
+    if q.running or due >= q.next_wakeup:
+        return
+    if threading.current_thread() is not threading.main_thread():
+        return
+    if not bpy.app.timers.is_registered(queue_worker):
+        return
+    bpy.app.timers.unregister(queue_worker)
+    first_interval = max(0.0, due - time.monotonic())
+    bpy.app.timers.register(queue_worker, first_interval=first_interval)
+    q.next_wakeup = due
+
+
+def run_task(task: task_object):
+    bk_logger.debug("task queue task:" + str(task.command) + str(task.arguments))
+    try:
+        if task.fake_context:
+            fc = utils.get_fake_context(bpy.context, area_type=task.fake_context_area)
+            if bpy.app.version < (4, 0, 0):
+                task.command(fc, *task.arguments)
+            else:
+                with bpy.context.temp_override(**fc):
+                    task.command(*task.arguments)
+        else:
+            task.command(*task.arguments)
+    except Exception as e:
+        bk_logger.error(
+            "task queue failed task:" + str(task.command) + str(task.arguments) + str(e)
+        )
 
 
 # @bpy.app.handlers.persistent
 def queue_worker():
-    # utils.p('start queue worker timer')
-
-    # bk_logger.debug('timer queue worker')
-    time_step = 0.3
+    """Run all due tasks and sleep until the next task is due."""
     q = get_queue()
-    # save some performance by returning early
-    if q.empty():
-        return time_step
-    back_to_queue = []  # delayed events
-    stashed = {}
-    # first round we get all tasks that are supposed to be stashed and run only once (only_last option)
-    # stashing finds tasks with the property only_last and same command and executes only the last one.
-    while not q.empty():
-        task = q.get()
-        if task.only_last:
-            # this now makes the keys not only by task, but also two arguments.
-            # by now stashing is only used for ratings, where the first argument is url, second rating type.
-            # This enables fast rating of multiple assets while allowing larger delay for uploading of ratings.
-            # this avoids a duplicate request error on the server
-            stashed[f"{task.command}-{task.arguments[0]}-{task.arguments[1]}"] = task
-        else:
-            back_to_queue.append(task)
-    # return tasks to que except for stashed
-    for task in back_to_queue:
-        q.put(task)
-    # return stashed tasks to queue
-    for k in stashed.keys():
-        q.put(stashed[k])
-    # second round, execute or put back waiting tasks.
-    back_to_queue = []
-    while not q.empty():
-        # print('window manager', bpy.context.window_manager)
-        task = q.get()
-
-        if task.wait > 0:
-            task.wait -= time_step
-            back_to_queue.append(task)
-        else:
-            bk_logger.debug(
-                "task queue task:" + str(task.command) + str(task.arguments)
-            )
-            try:
-                if task.fake_context:
-                    fc = utils.get_fake_context(
-                        bpy.context, area_type=task.fake_context_area
-                    )
-                    if bpy.app.version < (4, 0, 0):
-                        task.command(fc, *task.arguments)
-                    else:
-                        with bpy.context.temp_override(**fc):
-                            task.command(*task.arguments)
-                else:
-                    task.command(*task.arguments)
-            except Exception as e:
-                bk_logger.error(
-                    "task queue failed task:"
-                    + str(task.command)
-                    + str(task.arguments)
-                    + str(e)
-                )
-                # bk_logger.exception('Got exception on main handler')
-                # raise
-        # print('queue while 2')
-    for task in back_to_queue:
-        q.put(task)
-    # utils.p('end queue worker timer')
-    return time_step
+    q.running = True
+    try:
+        for task in q.pop_due(time.monotonic()):
+            run_task(task)
+    finally:
+        q.running = False
+
+    now = time.monotonic()
+    next_due = q.next_due()
+    if next_due is None:
+        interval = IDLE_INTERVAL
+    else:
+        interval = min(IDLE_INTERVAL, max(0.0, next_due - now))
+    q.next_wakeup = now + interval
+    return interval
 
 
 def register():
@@ -19,6 +19,9 @@
 import logging
 import os
 import queue
+import time
+from typing import Optional
+
 import requests
 
 import bpy
@@ -49,6 +52,43 @@ reports_queue: queue.Queue = queue.Queue()
 pending_tasks = (
     list()
 )  # pending tasks are tasks that were not parsed correclty and should be tried to be parsed later.
+TASK_PRIORITIES = {
+    # user-facing
+    "search": 0,
+    "asset_download": 0,
+    "bkclientjs/get_asset": 0,
+    "login": 0,
+    "client_status": 0,
+    "message_from_daemon": 0,
+    "message_from_client": 0,
+    # background
+    "categories_update": 2,
+    "disclaimer": 2,
+    "notifications": 2,
+    "comments/get_comments": 2,
+    "comments/create_comment": 2,
+    "comments/feedback_comment": 2,
+    "comments/mark_comment_private": 2,
+    "profiles/fetch_gravatar_image": 2,
+    "profiles/get_user_profile": 2,
+    "ratings/get_rating": 2,
+    "ratings/get_ratings": 2,
+    "ratings/send_rating": 2,
+    "ratings/get_bookmarks": 2,
+}
+"""Priority of task types for time-budgeted handling, 0 is handled first. Not listed task types have priority 1."""
+last_task_states: dict[str, tuple[tuple, float]] = {}
+"""Status, progress and message of tasks when they were last handled and time they were last reported, key is task_id."""
+LAST_TASK_STATES_TTL = 300
+"""Seconds after which states of tasks no longer reported by the Client are forgotten."""
+reports_stream: Optional[client_lib.ReportsStream] = None
+"""Background reader filling reports_queue, used when client_reports_stream preference is enabled."""
+REPORTS_HEALTH_CHECK_INTERVAL = 5.0
+"""Seconds between reports polled while the reports stream is running, to check the Client is alive."""
+last_reports_poll = 0.0
+"""Time of the last polled report, see REPORTS_HEALTH_CHECK_INTERVAL."""
+last_reports_check = 0.0
+"""Time client_communication_timer() last got reports, used to handle backlog of pending_tasks in between."""
 
 
 def handle_failed_reports(exception: Exception) -> float:
@@ -122,17 +162,28 @@ def client_communication_timer():
     """Recieve all responses from Client and run according followup commands.
     This function is the only one responsible for keeping the Client up and running.
     """
-    global pending_tasks
-    bk_logger.debug("Getting tasks from Client")
-    search.check_clipboard()
+    global pending_tasks, last_reports_check
+    preferences = bpy.context.preferences.addons[__package__].preferences
+    delay = preferences.client_polling  # type: ignore[union-attr]
+    if len(download.download_tasks) > 0:
+        delay = min(0.2, delay)
+
     results = list()
-    try:
-        results = client_lib.get_reports(os.getpid())
-        global_vars.CLIENT_FAILED_REPORTS = 0
-    except Exception as e:
-        return handle_failed_reports(e)
+    failed_delay = None
+    reports_checked = False
+    # backlog of tasks is handled first, reports and clipboard are checked again only after the delay
+    if len(pending_tasks) == 0 or time.monotonic() - last_reports_check >= delay:
+        last_reports_check = time.monotonic()
+        bk_logger.debug("Getting tasks from Client")
+        search.check_clipboard()
+        results, failed_delay = get_client_reports(preferences, delay)
+        reports_checked = True
 
-    if global_vars.CLIENT_ACCESSIBLE is False:
+    if (
+        reports_checked
+        and failed_delay is None
+        and global_vars.CLIENT_ACCESSIBLE is False
+    ):
         bk_logger.info(
             f"BlenderKit-Client is running on port {global_vars.CLIENT_PORTS[0]}!"
         )
@@ -143,8 +194,8 @@ def client_communication_timer():
     bk_logger.debug("Handling tasks")
     results_converted_tasks = []
 
-    # convert to task type
-    for task in results:
+    # convert to task type, skipping tasks without any change since they were last handled
+    for task in coalesce_reported_tasks(results):
         task = client_tasks.Task(
             data=task["data"],
             task_id=task["task_id"],
@@ -158,18 +209,158 @@ def client_communication_timer():
         )
         results_converted_tasks.append(task)
 
-    # add pending tasks which were already parsed but not handled
-    results_converted_tasks.extend(pending_tasks)
+    # add pending tasks which were already parsed but not handled, unless newer report of the task arrived
+    reported_ids = {task.task_id for task in results_converted_tasks}
+    pending = [task for task in pending_tasks if task.task_id not in reported_ids]
     pending_tasks.clear()
-
-    for task in results_converted_tasks:
+    tasks = pending + results_converted_tasks
+    tasks.sort(key=get_task_priority)  # stable sort, older tasks stay first
+
+    budget = preferences.client_tasks_budget / 1000  # type: ignore[union-attr]
+    start = time.perf_counter()
+    for i, task in enumerate(tasks):
+        if budget > 0 and i > 0 and time.perf_counter() - start > budget:
+            pending_tasks.extend(tasks[i:])
+            bk_logger.debug(
+                f"Task handling budget spent, {len(pending_tasks)} tasks left for next tick"
+            )
+            return 0.01 if failed_delay is None else failed_delay
         handle_task(task)
 
     bk_logger.debug("Task handling finished")
-    delay = bpy.context.preferences.addons[__package__].preferences.client_polling
-    if len(download.download_tasks) > 0:
-        return min(0.2, delay)
-    return delay
+    if failed_delay is not None:
+        return failed_delay
+    return max(0.01, delay - (time.monotonic() - last_reports_check))
+
+
+def get_client_reports(preferences, delay: float) -> tuple[list, Optional[float]]:
+    """Get reports from the reports stream buffer, or poll them from the Client.
+    Returns reported tasks and the delay of next timer call if getting the reports failed.
+    """
+    global last_reports_poll
+    if reports_stream is not None and reports_stream.is_alive():
+        reports_stream.min_interval = delay
+        reports_stream.data["api_key"] = preferences.api_key
+        results, error = drain_reports_queue()
+        if (
+            error is None
+            and time.monotonic() - last_reports_poll > REPORTS_HEALTH_CHECK_INTERVAL
+        ):
+            # low-rate poll as health check, repeated reports of tasks are skipped by coalesce_reported_tasks()
+            try:
+                last_reports_poll = time.monotonic()
+                polled, seq = client_lib.get_reports(os.getpid())
+                set_reports_seq(seq)
+                results.extend(polled)
+                global_vars.CLIENT_FAILED_REPORTS = 0
+            except Exception as e:
+                error = e
+        if error is not None:
+            # tasks drained before the error are still handled
+            stop_reports_stream()
+            return results, handle_failed_reports(error)
+        return results, None
+
+    try:
+        last_reports_poll = time.monotonic()
+        results, global_vars.CLIENT_REPORTS_SEQ = client_lib.get_reports(os.getpid())
+        global_vars.CLIENT_FAILED_REPORTS = 0
+    except Exception as e:
+        stop_reports_stream()
+        return [], handle_failed_reports(e)
+    if preferences.client_reports_stream:
+        start_reports_stream(delay)
+    return results, None
+
+
+def get_task_priority(task: client_tasks.Task) -> int:
+    """Get priority of the task, lower number is handled sooner when tasks do not fit into the time budget."""
+    return TASK_PRIORITIES.get(task.task_type, 1)
+
+
+def coalesce_reported_tasks(results: list) -> list:
+    """Keep only the latest report of each task and drop reports with no change since the task was last handled.
+    States of finished tasks are kept too, so repeated reports of them are not handled twice.
+    Tasks not reported for LAST_TASK_STATES_TTL seconds are forgotten.
+    """
+    latest = {}
+    for task in results:
+        latest[task["task_id"]] = task
+
+    now = time.monotonic()
+    changed = []
+    for task_id, task in latest.items():
+        state = (task["status"], task["progress"], task["message"])
+        last_state = last_task_states.get(task_id)
+        last_task_states[task_id] = (state, now)
+        if last_state is not None and last_state[0] == state:
+            continue
+        changed.append(task)
+
+    for task_id, (state, reported) in list(last_task_states.items()):
+        if now - reported > LAST_TASK_STATES_TTL:
+            del last_task_states[task_id]
+    return changed
+
+
+def drain_reports_queue() -> tuple[list, Optional[Exception]]:
+    """Get all tasks buffered by the reports stream reader thread and move the sequence cursor past them.
+    Also returns the exception which stopped the reader thread, if there was any.
+    """
+    results = []
+    while True:
+        try:
+            item = reports_queue.get_nowait()
+        except queue.Empty:
+            return results, None
+        if isinstance(item, Exception):
+            return results, item
+        tasks, seq = item
+        set_reports_seq(seq)
+        results.extend(tasks)
+
+
+def set_reports_seq(seq: int):
+    """Move the sequence cursor to a consumed report. Reports from the stream and from the health check poll
+    may arrive out of order, so the cursor only goes back when the Client was restarted (seq reset to 0).
+    """
+    if seq == 0 or seq > global_vars.CLIENT_REPORTS_SEQ:
+        global_vars.CLIENT_REPORTS_SEQ = seq
+
+
+def start_reports_stream(min_interval: float):
+    """Start background reader of reports from the Client, polling is then only used as a fallback."""
+    global reports_stream
+    stop_reports_stream()
+    data = client_lib.ensure_minimal_data({"app_id": os.getpid()})
+    data["project_name"] = utils.get_project_name()
+    data["blender_version"] = utils.get_blender_version()
+    reports_stream = client_lib.ReportsStream(data, reports_queue, min_interval)
+    reports_stream.start()
+    bk_logger.info("Started streaming of reports from BlenderKit-Client")
+
+
+def stop_reports_stream():
+    """Stop the reports stream reader thread and drop buffered reports.
+    Sequence cursor was not moved past them, so the Client reports the dropped tasks again.
+    """
+    global reports_stream
+    if reports_stream is None:
+        return
+    reports_stream.stop()
+    reports_stream = None
+    while not reports_queue.empty():
+        try:
+            reports_queue.get_nowait()
+        except queue.Empty:
+            break
+
+
+def reports_stream_property_updated(user_preferences, context):
+    """Stop the reports stream when disabled. It is started by client_communication_timer() when enabled."""
+    utils.save_prefs(user_preferences, context)
+    if not user_preferences.client_reports_stream:
+        stop_reports_stream()
 
 
 @bpy.app.handlers.persistent
@@ -195,6 +386,7 @@ def save_prefs_cancel_all_tasks_and_restart_client(user_preferences, context):
         return
 
     reports.add_report("Restarting Client server", timeout=2)
+    stop_reports_stream()
     try:
         cancel_all_tasks(user_preferences, context)
         client_lib.shutdown_client()
@@ -230,6 +422,7 @@ def cancel_all_tasks(self, context):
     """Cancel all tasks."""
     global pending_tasks
     pending_tasks.clear()
+    last_task_states.clear()
     download.clear_downloads()
     search.clear_searches()
     # TODO: should add uploads
@@ -254,112 +447,71 @@ def task_error_overdrive(task: client_tasks.Task) -> None:
 
 
 def handle_task(task: client_tasks.Task):
-    """Handle incomming task information. Sort tasks by type and call apropriate functions."""
+    """Handle incomming task information. Dispatch the task to handler registered for its type and status."""
     if task.status == "error":
         task_error_overdrive(task)
 
-    # HANDLE ASSET DOWNLOAD
-    if task.task_type == "asset_download":
-        return download.handle_download_task(task)
-
-    # HANDLE ASSET UPLOAD
-    if task.task_type == "asset_upload":
-        return upload.handle_asset_upload(task)
-
-    if task.task_type == "asset_metadata_upload":
-        return upload.handle_asset_metadata_upload(task)
-
-    # HANDLE SEARCH (candidate to be a function)
-    if task.task_type == "search":
-        if task.status == "finished":
-            return search.handle_search_task(task)
-        elif task.status == "error":
-            return search.handle_search_task_error(task)
-
-    # HANDLE THUMBNAIL DOWNLOAD (candidate to be a function)
-    if task.task_type == "thumbnail_download":
-        return search.handle_thumbnail_download_task(task)
-
-    # HANDLE LOGIN
-    if task.task_type == "login":
-        return bkit_oauth.handle_login_task(task)
-
-    # HANDLE TOKEN REFRESH - most likely not needed anymore, TODO: remove
-    if task.task_type == "token_refresh":
-        return bkit_oauth.handle_token_refresh_task(task)
-
-    # HANDLE OAUTH LOGOUT
-    if task.task_type == "oauth2/logout":
-        return bkit_oauth.handle_logout_task(task)
-
-    # HANDLE CLIENT STATUS REPORT
-    if task.task_type == "client_status":
-        return client_lib.handle_client_status_task(task)
-
-    # HANDLE DISCLAIMER
-    if task.task_type == "disclaimer":
-        return disclaimer_op.handle_disclaimer_task(task)
-
-    # HANDLE CATEGORIES FETCH
-    if task.task_type == "categories_update":
-        return categories.handle_categories_task(task)
-
-    # HANDLE NOTIFICATIONS FETCH
-    if task.task_type == "notifications":
-        return comments_utils.handle_notifications_task(task)
-
-    # HANDLE VARIOUS COMMENTS TASKS
-    if task.task_type == "comments/get_comments":
-        return comments_utils.handle_get_comments_task(task)
-    if task.task_type == "comments/create_comment":
-        return comments_utils.handle_create_comment_task(task)
-    if task.task_type == "comments/feedback_comment":
-        return comments_utils.handle_feedback_comment_task(task)
-    if task.task_type == "comments/mark_comment_private":
-        return comments_utils.handle_mark_comment_private_task(task)
-
-    # HANDLE PROFILE
-    if task.task_type == "profiles/fetch_gravatar_image":
-        return search.handle_fetch_gravatar_task(task)
-    if task.task_type == "profiles/get_user_profile":
-        return search.handle_get_user_profile(task)
-
-    # HANDLE RATINGS
-    if task.task_type == "ratings/get_rating":
-        return ratings_utils.handle_get_rating_task(task)
-    if task.task_type == "ratings/get_ratings":
-        return ratings_utils.handle_get_ratings_task(task)
-    if task.task_type == "ratings/send_rating":
-        return ratings_utils.handle_send_rating_task(task)
-
-    # HANDLE BOOKMARKS
-    if task.task_type == "ratings/get_bookmarks":
-        return ratings_utils.handle_get_bookmarks_task(task)
-
-    # HANDLE NONBLOCKING_REQUEST
-    if task.task_type == "wrappers/nonblocking_request":
-        return utils.handle_nonblocking_request_task(task)
-
+    return client_tasks.run_task_handler(task)
+
+
+def handle_message_from_client(task: client_tasks.Task):
+    """Show message from the Client in GUI or log it into terminal."""
+    level = task.result.get("level", "INFO").upper()
+    duration = task.result.get("duration", 5)
+    destination = task.result.get("destination", "GUI")
+    if destination == "GUI":
+        return reports.add_report(task.message, duration, level)
+    if level == "INFO" or level == "VALIDATOR":
+        return bk_logger.info(task.message)
+    if level == "WARNING":
+        return bk_logger.warning(task.message)
+    if level == "ERROR":
+        return bk_logger.error(task.message)
+
+
+def register_task_handlers():
+    """Register handlers for all task types reported by the Client."""
+    register = client_tasks.register_task_handler
+    # ASSET DOWNLOAD AND UPLOAD
+    register("asset_download", download.handle_download_task)
+    register("asset_upload", upload.handle_asset_upload)
+    register("asset_metadata_upload", upload.handle_asset_metadata_upload)
+    # SEARCH
+    register("search", search.handle_search_task, status="finished")
+    register("search", search.handle_search_task_error, status="error")
+    register("thumbnail_download", search.handle_thumbnail_download_task)
+    # LOGIN, TOKEN REFRESH - most likely not needed anymore, TODO: remove, LOGOUT
+    register("login", bkit_oauth.handle_login_task)
+    register("token_refresh", bkit_oauth.handle_token_refresh_task)
+    register("oauth2/logout", bkit_oauth.handle_logout_task)
+    # CLIENT STATUS, DISCLAIMER, CATEGORIES, NOTIFICATIONS
+    register("client_status", client_lib.handle_client_status_task)
+    register("disclaimer", disclaimer_op.handle_disclaimer_task)
+    register("categories_update", categories.handle_categories_task)
+    register("notifications", comments_utils.handle_notifications_task)
+    # COMMENTS
+    register("comments/get_comments", comments_utils.handle_get_comments_task)
+    register("comments/create_comment", comments_utils.handle_create_comment_task)
+    register("comments/feedback_comment", comments_utils.handle_feedback_comment_task)
+    register(
+        "comments/mark_comment_private",
+        comments_utils.handle_mark_comment_private_task,
+    )
+    # PROFILES
+    register("profiles/fetch_gravatar_image", search.handle_fetch_gravatar_task)
+    register("profiles/get_user_profile", search.handle_get_user_profile)
+    # RATINGS AND BOOKMARKS
+    register("ratings/get_rating", ratings_utils.handle_get_rating_task)
+    register("ratings/get_ratings", ratings_utils.handle_get_ratings_task)
+    register("ratings/send_rating", ratings_utils.handle_send_rating_task)
+    register("ratings/get_bookmarks", ratings_utils.handle_get_bookmarks_task)
+    # NONBLOCKING_REQUEST
+    register("wrappers/nonblocking_request", utils.handle_nonblocking_request_task)
     # BKCLIENTJS - Download from web
-    if task.task_type == "bkclientjs/get_asset":
-        return download.handle_bkclientjs_get_asset(task)
-
-    # HANDLE MESSAGE FROM CLIENT
-    if (
-        task.task_type == "message_from_daemon"  # TODO: depracate message_from_daemon
-        or task.task_type == "message_from_client"
-    ):
-        level = task.result.get("level", "INFO").upper()
-        duration = task.result.get("duration", 5)
-        destination = task.result.get("destination", "GUI")
-        if destination == "GUI":
-            return reports.add_report(task.message, duration, level)
-        if level == "INFO" or level == "VALIDATOR":
-            return bk_logger.info(task.message)
-        if level == "WARNING":
-            return bk_logger.warning(task.message)
-        if level == "ERROR":
-            return bk_logger.error(task.message)
+    register("bkclientjs/get_asset", download.handle_bkclientjs_get_asset)
+    # MESSAGE FROM CLIENT
+    register("message_from_daemon", handle_message_from_client)  # TODO: depracate
+    register("message_from_client", handle_message_from_client)
 
 
 @bpy.app.handlers.persistent
@@ -406,6 +558,7 @@ def register_timers():
     It registers check_timers_timer which registers all other periodic non-ending timers.
     And individually it register all timers which are expected to end.
     """
+    register_task_handlers()
     if bpy.app.background:
         return
 
@@ -435,6 +588,7 @@ def unregister_timers():
         bpy.app.timers.unregister(bg_blender.bg_update)
     if bpy.app.timers.is_registered(client_communication_timer):
         bpy.app.timers.unregister(client_communication_timer)
+    stop_reports_stream()
     if bpy.app.timers.is_registered(timer_image_cleanup):
         bpy.app.timers.unregister(timer_image_cleanup)
 
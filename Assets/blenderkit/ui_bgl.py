@@ -17,14 +17,64 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import blf
+import bpy
 import gpu
 import logging
+import math
+import time
 from bpy import app
+from collections import OrderedDict
+from typing import Optional
 from gpu_extras.batch import batch_for_shader
 
 bk_logger = logging.getLogger(__name__)
 
 
+shaders: dict = (
+    {}
+)  # compiled once, see get_uniform_color_shader() and get_flat_color_shader()
+
+
+def get_uniform_color_shader(dimensions: int = 2):
+    """Get shader drawing with one color, for 2D or 3D coordinates."""
+    key = f"uniform_color_{dimensions}d"
+    shader = shaders.get(key)
+    if shader is None:
+        if app.version < (4, 0, 0):
+            shader = gpu.shader.from_builtin(f"{dimensions}D_UNIFORM_COLOR")
+        elif app.version < (4, 5, 0):
+            shader = gpu.shader.from_builtin("UNIFORM_COLOR")
+        else:
+            shader = gpu.shader.create_from_info(create_shader_info())
+        shaders[key] = shader
+    return shader
+
+
+def get_rect_shader(dimensions: int = 2):
+    """Get one color shader for triangles, builtin UNIFORM_COLOR still works for them in Blender 4.5+."""
+    if app.version < (4, 5, 0):
+        return get_uniform_color_shader(dimensions)
+    shader = shaders.get("uniform_color_rect")
+    if shader is None:
+        shader = gpu.shader.from_builtin("UNIFORM_COLOR")
+        shaders["uniform_color_rect"] = shader
+    return shader
+
+
+def get_flat_color_shader():
+    """Get shader drawing 2D primitives with per-vertex colors, used by DrawList."""
+    shader = shaders.get("flat_color")
+    if shader is None:
+        if app.version < (4, 0, 0):
+            shader = gpu.shader.from_builtin("2D_FLAT_COLOR")
+        elif app.version < (4, 5, 0):
+            shader = gpu.shader.from_builtin("FLAT_COLOR")
+        else:
+            shader = gpu.shader.create_from_info(create_flat_color_shader_info())
+        shaders["flat_color"] = shader
+    return shader
+
+
 def draw_rect(x, y, width, height, color):
     xmax = x + width
     ymax = y + height
@@ -36,10 +86,7 @@ def draw_rect(x, y, width, height, color):
     )
     indices = ((0, 1, 2), (2, 3, 0))
 
-    if app.version < (4, 0, 0):
-        shader = gpu.shader.from_builtin("2D_UNIFORM_COLOR")
-    else:
-        shader = gpu.shader.from_builtin("UNIFORM_COLOR")
+    shader = get_rect_shader(2)
     batch = batch_for_shader(shader, "TRIS", {"pos": points}, indices=indices)
 
     gpu.state.blend_set("ALPHA")
@@ -53,14 +100,7 @@ def draw_line2d(x1, y1, x2, y2, width, color):
     coords = ((x1, y1), (x2, y2))
     indices = ((0, 1),)
 
-    if app.version < (4, 0, 0):
-        shader = gpu.shader.from_builtin("2D_UNIFORM_COLOR")
-    elif app.version < (4, 5, 0):
-        shader = gpu.shader.from_builtin("UNIFORM_COLOR")
-    else:
-        shader_info = create_shader_info()
-        shader = gpu.shader.create_from_info(shader_info)
-
+    shader = get_uniform_color_shader(2)
     batch = batch_for_shader(shader, "LINES", {"pos": coords}, indices=indices)
     gpu.state.blend_set("ALPHA")
     shader.bind()
@@ -97,16 +137,39 @@ def create_shader_info():
     return shader_info
 
 
+def create_flat_color_shader_info():
+    """Per-vertex color variant of create_shader_info() for Blender 4.5+."""
+    if app.version < (4, 5, 0):
+        return bk_logger.warning("Unexpected call to create_flat_color_shader_info()!")
+    interface = gpu.types.GPUStageInterfaceInfo("bkit_flat_color_interface")
+    interface.flat("VEC4", "finalColor")
+    shader_info = gpu.types.GPUShaderCreateInfo()
+    shader_info.vertex_in(0, "VEC3", "pos")
+    shader_info.vertex_in(1, "VEC4", "color")
+    shader_info.vertex_out(interface)
+    shader_info.push_constant("MAT4", "ModelViewProjectionMatrix")
+    shader_info.fragment_out(0, "VEC4", "fragColor")
+    shader_info.vertex_source(
+        """
+        void main() {
+            finalColor = color;
+            gl_Position = ModelViewProjectionMatrix * vec4(pos, 1.0);
+        }
+    """
+    )
+    shader_info.fragment_source(
+        """
+        void main() {
+            fragColor = finalColor;
+        }
+    """
+    )
+    return shader_info
+
+
 def draw_lines(vertices, indices, color):
     """Used for drawing 3D bounding box."""
-    if app.version < (4, 0, 0):
-        shader = gpu.shader.from_builtin("3D_UNIFORM_COLOR")
-    elif app.version < (4, 5, 0):
-        shader = gpu.shader.from_builtin("UNIFORM_COLOR")
-    else:
-        shader_info = create_shader_info()
-        shader = gpu.shader.create_from_info(shader_info)
-
+    shader = get_uniform_color_shader(3)
     batch = batch_for_shader(shader, "LINES", {"pos": vertices}, indices=indices)
     gpu.state.blend_set("ALPHA")
     shader.bind()
@@ -116,78 +179,515 @@ def draw_lines(vertices, indices, color):
 
 def draw_rect_3d(coords, color):
     indices = [(0, 1, 2), (2, 3, 0)]
-    if app.version < (4, 0, 0):
-        shader = gpu.shader.from_builtin("3D_UNIFORM_COLOR")
-    else:
-        shader = gpu.shader.from_builtin("UNIFORM_COLOR")
+    shader = get_rect_shader(3)
     batch = batch_for_shader(shader, "TRIS", {"pos": coords}, indices=indices)
     shader.uniform_float("color", color)
     gpu.state.blend_set("ALPHA")
     batch.draw(shader)
 
 
-cached_images = {}
+def draw_rects_3d(rects, color):
+    """Draw quads given by 4 corners each in one batch."""
+    coords = []
+    indices = []
+    for rect in rects:
+        i = len(coords)
+        coords.extend(rect)
+        indices.extend([(i, i + 1, i + 2), (i + 2, i + 3, i)])
+    shader = get_rect_shader(3)
+    batch = batch_for_shader(shader, "TRIS", {"pos": coords}, indices=indices)
+    shader.uniform_float("color", color)
+    gpu.state.blend_set("ALPHA")
+    batch.draw(shader)
 
 
-def draw_image(x, y, width, height, image, transparency, crop=(0, 0, 1, 1), batch=None):
-    # draw_rect(x,y, width, height, (.5,0,0,.5))
+class DrawList:
+    """Retained mode list of 2D primitives collected during one redraw and drawn by flush().
+    Primitives are drawn by layers, new_layer() starts the next one on top of the previous.
+    In each layer all rects and lines are drawn first in one batch, then images and then texts,
+    so the number of batches doesn't grow with the number of drawn widgets.
+    """
 
-    try:
-        image.name
-    except:
-        print("Image is invalid- draw function")
-        return
+    def __init__(self):
+        self.layers: list = []  # (coords, colors, indices, images, texts)
+        self.new_layer()
+
+    def new_layer(self):
+        """Start a new layer, primitives added from now on are drawn over the previous ones."""
+        if self.layers and not any(self.layers[-1]):
+            return
+        self.layers.append(([], [], [], [], []))
+
+    def rect(self, x, y, width, height, color):
+        coords, colors, indices, _, _ = self.layers[-1]
+        i = len(coords)
+        coords.extend(
+            [(x, y), (x, y + height), (x + width, y + height), (x + width, y)]
+        )
+        colors.extend([color] * 4)
+        indices.extend([(i, i + 1, i + 2), (i + 2, i + 3, i)])
+
+    def line2d(self, x1, y1, x2, y2, width, color):
+        """Line is added as a quad, so it shares the batch with rects."""
+        length = math.hypot(x2 - x1, y2 - y1)
+        if length == 0:
+            return
+        # half width offset perpendicular to the line
+        nx = (y1 - y2) / length * width / 2
+        ny = (x2 - x1) / length * width / 2
+        coords, colors, indices, _, _ = self.layers[-1]
+        i = len(coords)
+        coords.extend(
+            [
+                (x1 + nx, y1 + ny),
+                (x2 + nx, y2 + ny),
+                (x2 - nx, y2 - ny),
+                (x1 - nx, y1 - ny),
+            ]
+        )
+        colors.extend([color] * 4)
+        indices.extend([(i, i + 1, i + 2), (i + 2, i + 3, i)])
+
+    def image(self, x, y, width, height, image, transparency=1.0):
+        self.layers[-1][3].append(
+            (draw_image, (x, y, width, height, image, transparency))
+        )
 
-    ci = cached_images.get(image.filepath)
-    if ci is not None:
-        if (
-            ci["x"] == x
-            and ci["y"] == y
-            and ci["width"] == width
-            and ci["height"] == height
+    def call(self, function, *args):
+        """Call a function drawing its own batch, e.g. the thumbnail atlas, with the images of the layer."""
+        self.layers[-1][3].append((function, args))
+
+    def text(self, text, x, y, size, color=(1, 1, 1, 0.5), halign="LEFT", valign="TOP"):
+        self.layers[-1][4].append((text, x, y, size, color, halign, valign))
+
+    def flush(self):
+        """Draw all collected primitives and empty the list."""
+        for coords, colors, indices, images, texts in self.layers:
+            if indices:
+                shader = get_flat_color_shader()
+                batch = batch_for_shader(
+                    shader, "TRIS", {"pos": coords, "color": colors}, indices=indices
+                )
+                gpu.state.blend_set("ALPHA")
+                shader.bind()
+                batch.draw(shader)
+            for function, args in images:
+                function(*args)
+            for item in texts:
+                draw_text(*item)
+        self.layers.clear()
+        self.new_layer()
+
+
+IMAGE_POOL_MIN_SIZE = 64
+IMAGE_BATCHES_MAX = 512
+
+
+class ImagePool:
+    """Fixed number of slots for images drawn by draw_image() and their GPU textures.
+    When a new image needs a slot, the least recently drawn one is recycled: its texture is released
+    and if the image was loaded for the pool (see reserve()), it is removed from bpy.data.images.
+    Images loaded by widgets themselves, e.g. icons, only lose their texture.
+    The asset bar sizes the pool to its grid plus the prefetch margin.
+    """
+
+    def __init__(self, size: int = IMAGE_POOL_MIN_SIZE):
+        self.size = size
+        self.slots: OrderedDict = (
+            OrderedDict()
+        )  # image name -> (image pointer, texture, owned)
+        self.images_to_remove: list[str] = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_texture(self, image):
+        """Get GPU texture of the image, creating it if the image has no slot yet."""
+        name = image.name
+        pointer = image.as_pointer()
+        slot = self.slots.get(name)
+        if slot is not None and slot[0] == pointer and slot[1] is not None:
+            self.slots.move_to_end(name)
+            self.hits += 1
+            return slot[1]
+
+        self.misses += 1
+        texture = gpu.texture.from_image(image)
+        owned = slot is not None and slot[0] == pointer and slot[2]
+        self.slots[name] = (pointer, texture, owned)
+        self.slots.move_to_end(name)
+        self.evict()
+        return texture
+
+    def reserve(self, image, owned: bool = True):
+        """Take a slot for image loaded ahead of drawing, texture is created on first draw.
+        owned - image was loaded for the pool (search thumbnails) and is removed when its slot is recycled.
+        """
+        name = image.name
+        pointer = image.as_pointer()
+        slot = self.slots.get(name)
+        if slot is not None and slot[0] == pointer:
+            if owned and not slot[2]:
+                self.slots[name] = (pointer, slot[1], True)
+            self.slots.move_to_end(name)
+            return
+        self.slots[name] = (pointer, None, owned)
+        self.evict()
+
+    def invalidate(self, image):
+        """Release texture of a reloaded image, it is created again on next draw."""
+        slot = self.slots.get(image.name)
+        if slot is not None:
+            self.slots[image.name] = (slot[0], None, slot[2])
+
+    def resize(self, size: int):
+        self.size = max(size, IMAGE_POOL_MIN_SIZE)
+        self.evict()
+
+    def evict(self):
+        while len(self.slots) > self.size:
+            name, (_, _, owned) = self.slots.popitem(last=False)
+            self.evictions += 1
+            if owned:
+                self.images_to_remove.append(name)
+        # blend data can't be changed while drawing, images are removed in a timer
+        if self.images_to_remove and not bpy.app.timers.is_registered(
+            remove_evicted_images
         ):
-            batch = ci["batch"]
-            image_shader = ci["image_shader"]
-            texture = ci["texture"]
-    if not batch:
-        coords = [(x, y), (x + width, y), (x, y + height), (x + width, y + height)]
+            bpy.app.timers.register(remove_evicted_images)
+
+    def clear(self):
+        self.slots.clear()
+        self.images_to_remove.clear()
+
+    def get_stats(self) -> dict:
+        return {
+            "size": self.size,
+            "used": len(self.slots),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
 
-        uvs = [
-            (crop[0], crop[1]),
-            (crop[2], crop[1]),
-            (crop[0], crop[3]),
-            (crop[2], crop[3]),
-        ]
+image_pool = ImagePool()
+image_batches: OrderedDict = OrderedDict()  # (x, y, width, height, crop) -> batch
 
-        indices = [(0, 1, 2), (2, 1, 3)]
 
+def remove_evicted_images():
+    """Timer removing images loaded for image_pool whose slots were recycled."""
+    while image_pool.images_to_remove:
+        name = image_pool.images_to_remove.pop()
+        if name in image_pool.slots:  # drawn again since eviction
+            continue
+        image = bpy.data.images.get(name)
+        if image is not None and image.users == 0:
+            bpy.data.images.remove(image)
+    return None
+
+
+def get_image_shader():
+    shader = shaders.get("image")
+    if shader is None:
         if app.version < (4, 0, 0):
-            image_shader = gpu.shader.from_builtin("2D_IMAGE")
+            shader = gpu.shader.from_builtin("2D_IMAGE")
+        else:
+            shader = gpu.shader.from_builtin("IMAGE")
+        shaders["image"] = shader
+    return shader
+
+
+def get_image_batch(x, y, width, height, crop):
+    """Get batch of a textured rectangle, cached by its position and size."""
+    key = (x, y, width, height, tuple(crop))
+    batch = image_batches.get(key)
+    if batch is not None:
+        image_batches.move_to_end(key)
+        return batch
+
+    coords = [(x, y), (x + width, y), (x, y + height), (x + width, y + height)]
+
+    uvs = [
+        (crop[0], crop[1]),
+        (crop[2], crop[1]),
+        (crop[0], crop[3]),
+        (crop[2], crop[3]),
+    ]
+
+    indices = [(0, 1, 2), (2, 1, 3)]
+    batch = batch_for_shader(
+        get_image_shader(), "TRIS", {"pos": coords, "texCoord": uvs}, indices=indices
+    )
+    image_batches[key] = batch
+    if len(image_batches) > IMAGE_BATCHES_MAX:
+        image_batches.popitem(last=False)
+    return batch
+
+
+ATLAS_CELLS_PER_ROW = 8  # one atlas page has 8 x 8 cells
+ATLAS_CELL = (
+    128  # pixels, default cell size, the asset bar sets it to its thumbnail size
+)
+ATLAS_CELL_MIN = 32
+ATLAS_CELL_MAX = 256
+ATLAS_PAGES_MAX = 4
+ATLAS_FILL_BUDGET = (
+    0.004  # seconds spent copying thumbnails into the atlas per fill_pending() call
+)
+
+
+class ThumbnailAtlas:
+    """Small thumbnails packed into a few large GPU textures, so a whole grid is drawn with one call per page.
+    Cells are recycled in least recently drawn order. Pixels of all pages are kept on the CPU side as 8 bit,
+    because a page texture can only be uploaded as a whole, from a float buffer made only for the upload.
+    Cells have the size of the asset bar thumbnails, see set_cell_size(), so thumbnails are not rescaled twice.
+    Drawing only queues images missing in the atlas, they are copied in by fill_pending() outside of the
+    draw callback, so a dirty page is uploaded once for all cells filled meanwhile.
+    Only 8 bit sRGB images are put into the atlas, their raw pixels in an SRGB8_A8 texture are sampled
+    the same way as gpu.texture.from_image() textures, other images are drawn by draw_image().
+    """
+
+    def __init__(
+        self,
+        cell: int = ATLAS_CELL,
+        per_row: int = ATLAS_CELLS_PER_ROW,
+        pages: int = ATLAS_PAGES_MAX,
+    ):
+        self.cell = cell
+        self.per_row = per_row
+        self.size = cell * per_row
+        self.per_page = self.per_row * self.per_row
+        self.max_cells = self.per_page * pages
+        self.cells: OrderedDict = (
+            OrderedDict()
+        )  # image name -> (cell index, image pointer)
+        self.free_cells = list(range(self.max_cells - 1, -1, -1))
+        self.pixels: list = []  # numpy uint8 arrays of pages, size x size x 4
+        self.textures: list = []
+        self.dirty_pages: set[int] = set()
+        self.batches: dict = {}  # page -> (key, batch)
+        self.pending: OrderedDict = (
+            OrderedDict()
+        )  # image name -> None, waiting for fill_pending()
+
+    def set_cell_size(self, cell: int):
+        """Resize cells to the thumbnail size, the atlas is emptied when it changes."""
+        cell = min(max(cell, ATLAS_CELL_MIN), ATLAS_CELL_MAX)
+        if cell == self.cell:
+            return
+        self.clear()
+        self.cell = cell
+        self.size = cell * self.per_row
+
+    def find_cell(self, image) -> Optional[int]:
+        """Get atlas cell of the image if its pixels are already in the atlas."""
+        cell = self.cells.get(image.name)
+        if cell is not None and cell[1] == image.as_pointer():
+            self.cells.move_to_end(image.name)
+            return cell[0]
+        return None
+
+    @staticmethod
+    def can_contain(image) -> bool:
+        return (
+            not image.is_float
+            and image.colorspace_settings.name == "sRGB"
+            and image.channels in (3, 4)
+        )
+
+    def fill_pending(self, budget: float = ATLAS_FILL_BUDGET) -> bool:
+        """Copy queued images into the atlas until budget seconds are spent. Must not run while drawing.
+        Returns True if any image was added, so the region can be redrawn.
+        """
+        start = time.perf_counter()
+        filled = False
+        while self.pending and time.perf_counter() - start < budget:
+            name, _ = self.pending.popitem(last=False)
+            image = bpy.data.images.get(name)
+            if image is None or not image.has_data:
+                continue
+            if self.find_cell(image) is None and self.get_cell(image) is not None:
+                filled = True
+        return filled
+
+    def get_cell(self, image) -> Optional[int]:
+        """Get atlas cell of the image, copying its pixels into a free or recycled cell if needed."""
+        name = image.name
+        pointer = image.as_pointer()
+        cell = self.cells.get(name)
+        if cell is not None and cell[1] == pointer:
+            self.cells.move_to_end(name)
+            return cell[0]
+
+        if cell is not None:
+            index = cell[0]
+        elif self.free_cells:
+            index = self.free_cells.pop()
         else:
-            image_shader = gpu.shader.from_builtin("IMAGE")
+            _, (index, _) = self.cells.popitem(last=False)
+        self.cells.pop(name, None)
+        if not self.copy_pixels(image, index):
+            self.free_cells.append(index)
+            return None
+        self.cells[name] = (index, pointer)
+        return index
+
+    def copy_pixels(self, image, index: int) -> bool:
+        import numpy
+
+        width, height = image.size
+        channels = image.channels
+        if width == 0 or height == 0 or channels not in (3, 4):
+            return False
+        source = numpy.empty(width * height * channels, dtype=numpy.float32)
+        image.pixels.foreach_get(source)
+        source = source.reshape(height, width, channels)
+        # nearest neighbour scaling into the cell
+        ys = numpy.arange(self.cell) * height // self.cell
+        xs = numpy.arange(self.cell) * width // self.cell
+        scaled = source[ys][:, xs]
+
+        page, position = divmod(index, self.per_page)
+        while len(self.pixels) <= page:
+            self.pixels.append(
+                numpy.zeros((self.size, self.size, 4), dtype=numpy.uint8)
+            )
+            self.textures.append(None)
+        row, column = divmod(position, self.per_row)
+        y0, x0 = row * self.cell, column * self.cell
+        target = self.pixels[page][y0 : y0 + self.cell, x0 : x0 + self.cell]
+        target[:, :, :channels] = scaled * 255 + 0.5
+        if channels == 3:
+            target[:, :, 3] = 255
+        self.dirty_pages.add(page)
+        return True
+
+    def get_uv(self, index: int) -> tuple[int, tuple]:
+        """Get page and UV rectangle of the cell, inset by half a texel against bleeding."""
+        page, position = divmod(index, self.per_page)
+        row, column = divmod(position, self.per_row)
+        inset = 0.5 / self.size
+        step = self.cell / self.size
+        return page, (
+            column * step + inset,
+            row * step + inset,
+            (column + 1) * step - inset,
+            (row + 1) * step - inset,
+        )
+
+    def get_texture(self, page: int):
+        if page in self.dirty_pages or self.textures[page] is None:
+            import numpy
+
+            # GPUTexture only takes float buffers, this one lives only for the upload
+            pixels = numpy.multiply(self.pixels[page], 1 / 255, dtype=numpy.float32)
+            data = gpu.types.Buffer("FLOAT", self.size * self.size * 4, pixels.ravel())
+            self.textures[page] = gpu.types.GPUTexture(
+                (self.size, self.size), format="SRGB8_A8", data=data
+            )
+            self.dirty_pages.discard(page)
+        return self.textures[page]
+
+    def draw(self, items: list):
+        """Draw images as (x, y, width, height, image) rectangles, one batch per atlas page.
+        Images not in the atlas are drawn separately by draw_image() and queued for fill_pending().
+        """
+        pages: dict = {}
+        for x, y, width, height, image in items:
+            try:
+                index = self.find_cell(image)
+                if index is None and self.can_contain(image):
+                    self.pending[image.name] = None
+                    if not bpy.app.timers.is_registered(fill_thumbnail_atlas):
+                        bpy.app.timers.register(fill_thumbnail_atlas)
+            except ReferenceError:  # image was removed
+                continue
+            if index is None:
+                draw_image(x, y, width, height, image, 1.0)
+                continue
+            image_pool.reserve(image, owned=False)  # keeps thumbnails alive in the pool
+            page, uv = self.get_uv(index)
+            pages.setdefault(page, []).append((x, y, width, height, uv))
+
+        shader = get_image_shader()
+        gpu.state.blend_set("ALPHA")
+        shader.bind()
+        for page, rects in pages.items():
+            shader.uniform_sampler("image", self.get_texture(page))
+            self.get_batch(page, rects).draw(shader)
+
+    def get_batch(self, page: int, rects: list):
+        key = tuple(rects)
+        cached = self.batches.get(page)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        coords = []
+        uvs = []
+        indices = []
+        for x, y, width, height, (u0, v0, u1, v1) in rects:
+            i = len(coords)
+            coords.extend(
+                [(x, y), (x + width, y), (x, y + height), (x + width, y + height)]
+            )
+            uvs.extend([(u0, v0), (u1, v0), (u0, v1), (u1, v1)])
+            indices.extend([(i, i + 1, i + 2), (i + 2, i + 1, i + 3)])
         batch = batch_for_shader(
-            image_shader, "TRIS", {"pos": coords, "texCoord": uvs}, indices=indices
+            get_image_shader(),
+            "TRIS",
+            {"pos": coords, "texCoord": uvs},
+            indices=indices,
         )
-        texture = gpu.texture.from_image(image)
-        # tell shader to use the image that is bound to image unit 0
-        cached_images[image.filepath] = {
-            "x": x,
-            "y": y,
-            "width": width,
-            "height": height,
-            "batch": batch,
-            "image_shader": image_shader,
-            "texture": texture,
-        }
+        self.batches[page] = (key, batch)
+        return batch
+
+    def clear(self):
+        self.cells.clear()
+        self.free_cells = list(range(self.max_cells - 1, -1, -1))
+        self.pixels.clear()
+        self.textures.clear()
+        self.dirty_pages.clear()
+        self.batches.clear()
+        self.pending.clear()
+
+
+thumbnail_atlas = ThumbnailAtlas()
+
+
+def fill_thumbnail_atlas():
+    """Timer copying thumbnails queued by ThumbnailAtlas.draw() into the atlas, outside of the draw callback."""
+    if thumbnail_atlas.fill_pending():
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == "VIEW_3D":
+                    area.tag_redraw()
+    if thumbnail_atlas.pending:
+        return 0.02
+    return None
+
+
+def draw_image(x, y, width, height, image, transparency, crop=(0, 0, 1, 1), batch=None):
+    # draw_rect(x,y, width, height, (.5,0,0,.5))
+
+    try:
+        image.name
+    except:
+        print("Image is invalid- draw function")
+        return
+
+    if not batch:
+        batch = get_image_batch(x, y, width, height, crop)
     # send image to gpu if it isn't there already
     if image.gl_load():
         raise Exception()
 
-    # texture = gpu.texture.from_image(image)
+    texture = image_pool.get_texture(image)
+    shader = get_image_shader()
     gpu.state.blend_set("ALPHA")
-    image_shader.bind()
-    image_shader.uniform_sampler("image", texture)
-    batch.draw(image_shader)
+    shader.bind()
+    # tell shader to use the image that is bound to image unit 0
+    shader.uniform_sampler("image", texture)
+    batch.draw(shader)
 
     return batch
 
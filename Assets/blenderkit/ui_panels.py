@@ -34,6 +34,7 @@ from . import (
     autothumb,
     categories,
     client_lib,
+    client_tasks,
     comments_utils,
     datas,
     download,
@@ -1637,6 +1638,44 @@ class VIEW3D_PT_blenderkit_import_settings(Panel):
         # layout.prop(props, 'unpack_files')
 
 
+class VIEW3D_PT_blenderkit_task_handlers(Panel):
+    bl_category = "BlenderKit"
+    bl_idname = "VIEW3D_PT_blenderkit_task_handlers"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_label = "Task handlers timing"
+    bl_parent_id = "VIEW3D_PT_blenderkit_unified"
+    bl_options = {"DEFAULT_CLOSED"}
+
+    @classmethod
+    def poll(cls, context):
+        return utils.experimental_enabled()
+
+    def draw(self, context):
+        layout = self.layout
+        timings = sorted(
+            client_tasks.HANDLER_TIMINGS.items(),
+            key=lambda item: item[1].total,
+            reverse=True,
+        )
+        if len(timings) == 0:
+            layout.label(text="No tasks handled yet")
+            return
+
+        col = layout.column(align=True)
+        row = col.row()
+        row.label(text="Task type")
+        row.label(text="Calls")
+        row.label(text="Total ms")
+        row.label(text="Worst ms")
+        for task_type, timing in timings:
+            row = col.row()
+            row.label(text=task_type)
+            row.label(text=str(timing.calls))
+            row.label(text=f"{timing.total * 1000:.1f}")
+            row.label(text=f"{timing.worst * 1000:.1f}")
+
+
 class VIEW3D_PT_blenderkit_unified(Panel):
     bl_category = "BlenderKit"
     bl_idname = "VIEW3D_PT_blenderkit_unified"
@@ -3820,6 +3859,7 @@ classes = (
     VIEW3D_PT_blenderkit_advanced_brush_search,
     VIEW3D_PT_blenderkit_categories,
     VIEW3D_PT_blenderkit_import_settings,
+    VIEW3D_PT_blenderkit_task_handlers,
     VIEW3D_PT_blenderkit_model_properties,
     VIEW3D_MT_blenderkit_model_properties,
     NODE_PT_blenderkit_material_properties,
@@ -41,6 +41,7 @@ from . import (
     persistent_preferences,
     reports,
     search,
+    ui_bgl,
 )
 
 
@@ -598,10 +599,31 @@ def get_hidden_texture(name, force_reload=False):
     return t
 
 
+# image name -> state of the pixels last copied to its preview, see img_to_preview
+preview_pixels_keys = {}
+# float32 buffer reused by img_to_preview, grown to the largest image seen
+preview_pixels_buffer = np.empty(0, np.float32)
+
+
+def get_preview_pixels_buffer(size):
+    """Return a float32 view of `size` elements on the reused preview buffer."""
+    global preview_pixels_buffer
+    if preview_pixels_buffer.size < size:
+        preview_pixels_buffer = np.empty(size, np.float32)
+    return preview_pixels_buffer[:size]
+
+
+def invalidate_preview(img):
+    """Force the next img_to_preview(copy_original=True) to copy pixels again, e.g. after reload."""
+    preview_pixels_keys.pop(img.name, None)
+
+
 def img_to_preview(img, copy_original=False):
     """
     Convert image to preview,
     handling alpha channel properly by filling transparent areas with theme color.
+    Pixels are read and written with foreach_get/foreach_set through a reused buffer,
+    and skipped when the preview was already filled from the same image state.
     """
     if bpy.app.version[0] >= 3:
         img.preview_ensure()
@@ -609,39 +631,49 @@ def img_to_preview(img, copy_original=False):
     if not copy_original:
         return
 
-    # Only process if image has alpha channel and needs filling
-    if img.channels == 4 and (
+    width, height = img.size
+    blend_alpha = img.channels == 4 and (
         img.alpha_mode == "STRAIGHT" or img.alpha_mode == "PREMUL"
-    ):
+    )
+    bg_color = None
+    if blend_alpha:
         # Get theme color (default Blender background)
         theme = bpy.context.preferences.themes[0]
-        bg_color = theme.user_interface.wcol_box.inner[:]
+        bg_color = tuple(theme.user_interface.wcol_box.inner[:3])
 
-        # Convert image pixels to numpy array for faster processing
-        pixels = np.array(img.pixels[:]).reshape(img.size[1], img.size[0], 4)
-
-        # Create alpha mask
-        alpha_mask = pixels[:, :, 3][:, :, np.newaxis]
-
-        # Create background color array
-        bg = np.array([bg_color[0], bg_color[1], bg_color[2], 1.0])
-        bg_array = np.tile(bg, (img.size[1], img.size[0], 1))
-
-        # Blend image with background based on alpha
-        blended = pixels * alpha_mask + bg_array * (1 - alpha_mask)
-
-        # Update preview
-        if img.preview.image_size != img.size:
-            img.preview.image_size = (img.size[0], img.size[1])
+    preview_key = (img.filepath, width, height, img.channels, img.alpha_mode, bg_color)
+    if preview_pixels_keys.get(img.name) == preview_key and tuple(
+        img.preview.image_size
+    ) == (width, height):
+        return
 
-        # Convert back to flat array and update preview pixels
-        img.preview.image_pixels_float = blended.flatten()
+    if not blend_alpha and tuple(img.preview.image_size) == (width, height):
+        # For non-alpha images, pixels are only copied when the preview size changes, as before
+        preview_pixels_keys[img.name] = preview_key
+        return
 
-    else:
-        # For non-alpha images, just copy pixels as before
-        if img.preview.image_size != img.size:
-            img.preview.image_size = (img.size[0], img.size[1])
-            img.preview.image_pixels_float = img.pixels[:]
+    pixels = get_preview_pixels_buffer(width * height * img.channels)
+    img.pixels.foreach_get(pixels)
+
+    if blend_alpha:
+        pixels_2d = pixels.reshape(-1, 4)
+        alpha_mask = pixels_2d[:, 3:4].copy()
+        # Blend image with background based on alpha, in place:
+        # rgb = rgb * alpha + bg * (1 - alpha), alpha = alpha * alpha + (1 - alpha)
+        rgb = pixels_2d[:, :3]
+        rgb -= np.asarray(bg_color, np.float32)
+        rgb *= alpha_mask
+        rgb += np.asarray(bg_color, np.float32)
+        alpha = pixels_2d[:, 3]
+        alpha -= 1
+        alpha *= alpha_mask[:, 0]
+        alpha += 1
+
+    # Update preview
+    if tuple(img.preview.image_size) != (width, height):
+        img.preview.image_size = (width, height)
+    img.preview.image_pixels_float.foreach_set(pixels)
+    preview_pixels_keys[img.name] = preview_key
 
 
 def get_hidden_image(
@@ -673,6 +705,8 @@ def get_hidden_image(
 
                 img.filepath = tpath
                 img.reload()
+                invalidate_preview(img)
+                ui_bgl.image_pool.invalidate(img)
                 img_to_preview(img)
         image_utils.set_colorspace(img, colorspace)
 
@@ -680,6 +714,8 @@ def get_hidden_image(
         if img.packed_file is not None:
             img.unpack(method="USE_ORIGINAL")
         img.reload()
+        invalidate_preview(img)
+        ui_bgl.image_pool.invalidate(img)
         img_to_preview(img)
         image_utils.set_colorspace(img, colorspace)
 
@@ -824,59 +860,79 @@ def delete_hierarchy(object):
         bpy.ops.object.delete()
 
 
-def get_bounds_snappable(obs, use_modifiers=False):
+def get_vertices_bounds(mesh, matrix) -> Optional[tuple[np.ndarray, np.ndarray]]:
+    """Get min and max corner of mesh vertices transformed by matrix. Returns None for mesh without vertices."""
+    count = len(mesh.vertices)
+    if count == 0:
+        return None
+    coords = np.empty(count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    coords = coords.reshape(count, 3)
+    m = np.array(matrix, dtype=np.float64)
+    transformed = coords @ m[:3, :3].T + m[:3, 3]
+    return transformed.min(axis=0), transformed.max(axis=0)
+
+
+def get_bound_box_bounds(ob, matrix) -> tuple[np.ndarray, np.ndarray]:
+    """Get min and max corner of 8 corners of the object bound box transformed by matrix.
+    Cheaper than get_vertices_bounds(), but the result can be larger than the exact bounds when the matrix rotates.
+    """
+    coords = np.array([tuple(corner) for corner in ob.bound_box], dtype=np.float64)
+    m = np.array(matrix, dtype=np.float64)
+    transformed = coords @ m[:3, :3].T + m[:3, 3]
+    return transformed.min(axis=0), transformed.max(axis=0)
+
+
+def merge_bounds(bounds: list) -> tuple:
+    """Merge list of (min, max) corners into minx, miny, minz, maxx, maxy, maxz. Empty list gives zeros."""
+    if len(bounds) == 0:
+        return 0, 0, 0, 0, 0, 0
+    mins = np.min([b[0] for b in bounds], axis=0)
+    maxs = np.max([b[1] for b in bounds], axis=0)
+    return (
+        float(mins[0]),
+        float(mins[1]),
+        float(mins[2]),
+        float(maxs[0]),
+        float(maxs[1]),
+        float(maxs[2]),
+    )
+
+
+def get_bounds_snappable(obs, use_modifiers=False, exact=True):
+    """Get bounds of objects in the space of their topmost parent, scaled by the parent scale.
+    With exact=False bound boxes of objects are used instead of their vertices.
+    """
     # progress('getting bounds of object(s)')
     parent = obs[0]
     while parent.parent is not None:
         parent = parent.parent
-    maxx = maxy = maxz = -10000000
-    minx = miny = minz = 10000000
-
-    s = bpy.context.scene
 
-    obcount = 0  # calculates the mesh obs. Good for non-mesh objects
-    matrix_parent = parent.matrix_world
+    matrix_parent_inverted = parent.matrix_world.inverted()
+    bounds = []
+    depsgraph = bpy.context.evaluated_depsgraph_get()
     for ob in obs:
-        # bb=ob.bound_box
-        mw = ob.matrix_world
-        subp = ob.parent
-        # while parent.parent is not None:
-        #     mw =
-
-        if ob.type == "MESH" or ob.type == "CURVE":
-            # If to_mesh() works we can use it on curves and any other ob type almost.
-            # disabled to_mesh for 2.8 by now, not wanting to use dependency graph yet.
-            depsgraph = bpy.context.evaluated_depsgraph_get()
-
-            object_eval = ob.evaluated_get(depsgraph)
-            if ob.type == "CURVE":
-                mesh = object_eval.to_mesh()
-            else:
-                mesh = object_eval.data
-
-            # to_mesh(context.depsgraph, apply_modifiers=self.applyModifiers, calc_undeformed=False)
-            obcount += 1
-            if mesh is not None:
-                for c in mesh.vertices:
-                    coord = c.co
-                    parent_coord = (
-                        matrix_parent.inverted()
-                        @ mw
-                        @ Vector((coord[0], coord[1], coord[2]))
-                    )  # copy this when it works below.
-                    minx = min(minx, parent_coord.x)
-                    miny = min(miny, parent_coord.y)
-                    minz = min(minz, parent_coord.z)
-                    maxx = max(maxx, parent_coord.x)
-                    maxy = max(maxy, parent_coord.y)
-                    maxz = max(maxz, parent_coord.z)
-                # bpy.data.meshes.remove(mesh)
-            if ob.type == "CURVE":
-                object_eval.to_mesh_clear()
-
-    if obcount == 0:
-        minx, miny, minz, maxx, maxy, maxz = 0, 0, 0, 0, 0, 0
-
+        if ob.type != "MESH" and ob.type != "CURVE":
+            continue
+        matrix = matrix_parent_inverted @ ob.matrix_world
+        object_eval = ob.evaluated_get(depsgraph)
+        if not exact:
+            bounds.append(get_bound_box_bounds(object_eval, matrix))
+            continue
+
+        # If to_mesh() works we can use it on curves and any other ob type almost.
+        if ob.type == "CURVE":
+            mesh = object_eval.to_mesh()
+        else:
+            mesh = object_eval.data
+        if mesh is not None:
+            mesh_bounds = get_vertices_bounds(mesh, matrix)
+            if mesh_bounds is not None:
+                bounds.append(mesh_bounds)
+        if ob.type == "CURVE":
+            object_eval.to_mesh_clear()
+
+    minx, miny, minz, maxx, maxy, maxz = merge_bounds(bounds)
     minx *= parent.scale.x
     maxx *= parent.scale.x
     miny *= parent.scale.y
@@ -887,35 +943,26 @@ def get_bounds_snappable(obs, use_modifiers=False):
     return minx, miny, minz, maxx, maxy, maxz
 
 
-def get_bounds_worldspace(obs, use_modifiers=False):
+def get_bounds_worldspace(obs, use_modifiers=False, exact=True):
+    """Get world space bounds of objects. With exact=False bound boxes of objects are used instead of their vertices."""
     # progress('getting bounds of object(s)')
-    s = bpy.context.scene
-    maxx = maxy = maxz = -10000000
-    minx = miny = minz = 10000000
-    obcount = 0  # calculates the mesh obs. Good for non-mesh objects
+    bounds = []
+    depsgraph = bpy.context.evaluated_depsgraph_get()
     for ob in obs:
-        # bb=ob.bound_box
-        mw = ob.matrix_world
-        if ob.type == "MESH" or ob.type == "CURVE":
-            depsgraph = bpy.context.evaluated_depsgraph_get()
-            ob_eval = ob.evaluated_get(depsgraph)
-            mesh = ob_eval.to_mesh()
-            obcount += 1
-            if mesh is not None:
-                for c in mesh.vertices:
-                    coord = c.co
-                    world_coord = mw @ Vector((coord[0], coord[1], coord[2]))
-                    minx = min(minx, world_coord.x)
-                    miny = min(miny, world_coord.y)
-                    minz = min(minz, world_coord.z)
-                    maxx = max(maxx, world_coord.x)
-                    maxy = max(maxy, world_coord.y)
-                    maxz = max(maxz, world_coord.z)
-            ob_eval.to_mesh_clear()
-
-    if obcount == 0:
-        minx, miny, minz, maxx, maxy, maxz = 0, 0, 0, 0, 0, 0
-    return minx, miny, minz, maxx, maxy, maxz
+        if ob.type != "MESH" and ob.type != "CURVE":
+            continue
+        ob_eval = ob.evaluated_get(depsgraph)
+        if not exact:
+            bounds.append(get_bound_box_bounds(ob_eval, ob.matrix_world))
+            continue
+        mesh = ob_eval.to_mesh()
+        if mesh is not None:
+            mesh_bounds = get_vertices_bounds(mesh, ob.matrix_world)
+            if mesh_bounds is not None:
+                bounds.append(mesh_bounds)
+        ob_eval.to_mesh_clear()
+
+    return merge_bounds(bounds)
 
 
 def is_linked_asset(ob):